@@ -25,28 +25,16 @@ def analyze_comments():
     for post in posts:
         if post.get('comment_count', 0) > 0:
             post_id = post['id']
-            # MersoomAPI에 get_post 메서드가 없으므로 requests 직접 사용 (임시)
-            try:
-                # API 엔드포인트 추정: /api/posts/{id}
-                url = f"{api.BASE_URL}/posts/{post_id}"
-                response = api.session.get(url)
-                
-                if response.status_code == 200:
-                    post_detail = response.json()
-                    post_comments = post_detail.get('comments', [])
-                    for comment in post_comments:
-                        if isinstance(comment, dict):
-                            content = comment.get('content', '')
-                        else:
-                            content = str(comment)
-                            
-                        if content:
-                            comments.append(content)
-                            print(".", end="", flush=True)
-                else:
-                    print(f"Failed to fetch post {post_id}: {response.status_code}")
-            except Exception as e:
-                print(f"Error fetching post {post_id}: {e}")
+            # /posts/{id} 한 번으로 본문 + 댓글을 받음 (로컬 캐시도 같이 갱신)
+            post_detail = api.get_post_detail(post_id)
+            if post_detail is None:
+                print(f"Failed to fetch post {post_id}")
+                continue
+            for comment in post_detail.comments:
+                content = comment.get('content', '')
+                if content:
+                    comments.append(content)
+                    print(".", end="", flush=True)
                 
     print(f"\nCollected {len(comments)} comments.")
     
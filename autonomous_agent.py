@@ -3,44 +3,128 @@
 Mersoom 플랫폼에서 자율적으로 활동하는 AI 에이전트
 """
 
+import asyncio
+import os
+import threading
 import time
 import random
-import re
 from datetime import datetime
 from mersoom import MersoomAPI
+from modules.async_api import AsyncMersoomAPI
 from modules.templates import MerseumTemplates, validate_eumseum
 from modules.analyzer import FeedAnalyzer
 from modules.news import NewsAggregator
+from modules.store import PostStore
+from modules.feed_sync import FeedSync
+from modules.outbox import Outbox
+from modules.metrics import Metrics
+from modules.arena import ArenaWatcher
+from modules.scheduler import PeriodicTask, TaskScheduler, deadline_passed
+from modules.snapshot import FeedSnapshot
+from modules.acted_index import ActedIndex
+from modules.moderation import ModerationRules
 
 
 class AutonomousAgent:
     """머슴 자율 에이전트"""
     
-    def __init__(self, api_key, dry_run=False):
+    # 스케줄러 작업 -> (실행 간격 초, 한 번 실행 제한시간 초)
+    SCHEDULE = {
+        'feed': (60, 30),        # 피드 + 댓글 동기화
+        'analysis': (120, 20),   # 트렌드 분석
+        'vote': (300, 60),       # 자동 투표
+        'comment': (240, 90),    # 댓글 작성
+        'post': (900, 120),      # 글 작성
+        'outbox': (120, 120),    # 실패한 쓰기 재전송
+    }
+    
+    def __init__(self, api_key, dry_run=False, sync_state=None, outbox_path=None, metrics_path=None,
+                 api=None, async_api=None, templates=None, analyzer=None, news=None, feed_sync=None, outbox=None,
+                 acted=None,
+                 nickname=None, post_limit=2, comment_limit=None, schedule=None, **api_options):
+        """
+        Args:
+            api_key: (미사용) API 키
+            dry_run: True면 쓰기 요청 없이 시뮬레이션만 함
+            sync_state: 피드 동기화 커서 파일 (기본: ~/.mersoom/feed_sync.json, False면 저장 안 함)
+            outbox_path: 쓰기 대기열 파일 (기본: ~/.mersoom/outbox.sqlite3)
+            metrics_path: 사이클마다 계측 결과를 저장할 파일 (.prom이면 Prometheus 텍스트, 나머지는 JSON)
+            api, async_api, templates, analyzer, news, feed_sync, outbox, acted: 여러 페르소나가 함께 쓸 공용 객체
+                (지정하지 않으면 새로 만듦, multi_persona.py 참고)
+            nickname: 고정 닉네임 (기본: 템플릿에서 랜덤 선택)
+            post_limit: 30분에 쓸 수 있는 글 수
+            comment_limit: 30분에 쓸 수 있는 댓글 수 (None이면 제한 없음)
+            schedule: SCHEDULE 덮어쓰기 {작업: (간격, 제한시간)}
+            api_options: MersoomAPI에 그대로 넘길 옵션 (base_url, record, replay 등,
+                replay면 저장소/대기열/행동 기록/동기화 커서를 파일 대신 메모리에 둠)
+        """
         self.dry_run = dry_run
-        self.mersoom = MersoomAPI(api_key)
-        self.templates = MerseumTemplates()
-        self.analyzer = FeedAnalyzer()
-        self.news = NewsAggregator()
+        self.metrics_path = metrics_path
+        # 녹화 재생 중에는 재생한 데이터/쓰기를 실제 ~/.mersoom 파일에 남기지 않음
+        replaying = bool(api_options.get('replay') or os.environ.get('MERSOOM_REPLAY'))
+        if replaying:
+            sync_state = False if sync_state is None else sync_state
+            outbox_path = outbox_path or ':memory:'
+        if api is None:
+            if 'store' not in api_options:
+                api_options['store'] = PostStore(':memory:' if replaying else None)
+            if metrics_path and 'metrics' not in api_options:
+                api_options['metrics'] = Metrics()
+            api = MersoomAPI(api_key, **api_options)
+        self.mersoom = api
+        self.async_mersoom = async_api or AsyncMersoomAPI(self.mersoom, concurrency=5)
+        # 피드를 받을 때마다 지난번 이후 새로 올라온 글을 골라둠 (댓글 대상 우선순위)
+        self.feed_sync = feed_sync or FeedSync(self.mersoom, state_path=sync_state, page_size=10)
+        # 최신 피드 스냅샷 (글 + 댓글 + 분석 결과, 작업들이 같이 씀)
+        self.snapshot = None
+        self._snapshot_lock = threading.Lock()
+        # 실패한 글/댓글은 버리지 않고 대기열에 남겨뒀다가 다시 보냄
+        self.outbox = outbox or Outbox(self.mersoom, path=outbox_path)
+        # 이미 댓글/투표한 글 기록 (테스트 모드에서는 파일에 남기지 않음)
+        self.acted = acted or ActedIndex(path=False if dry_run or replaying else None)
+        self.arena_watcher = None
+        self.schedule = dict(self.SCHEDULE, **(schedule or {}))
+        self.templates = templates or MerseumTemplates()
+        self.analyzer = analyzer or FeedAnalyzer()
+        self.moderation = ModerationRules()
+        self.news = news or NewsAggregator()
         
         # 닉네임 선택 (한 번 선택하면 유지)
-        self.nickname = self.templates.generate_nickname()
+        self.nickname = nickname or self.templates.generate_nickname()
+        # 고정 닉네임이면 행동 기록을 닉네임별로, 랜덤 닉네임이면 실행이 바뀌어도 이어지게 공통으로 남김
+        self.actor = nickname
         
         # 속도 제한
+        self.post_limit = post_limit
+        self.comment_limit = comment_limit
         self.last_post_time = 0
         self.post_count = 0
+        self.comment_count = 0
         self.last_reset_time = time.time()
     
-    def can_post(self):
-        """글 작성 가능 여부 (30분에 2개)"""
+    def _reset_limits(self):
+        """30분 경과 시 글/댓글 카운트 리셋"""
         current_time = time.time()
-        
-        # 30분 경과 시 카운트 리셋
         if current_time - self.last_reset_time > 1800:  # 30분
             self.post_count = 0
+            self.comment_count = 0
             self.last_reset_time = current_time
-        
-        return self.post_count < 2
+    
+    def can_post(self):
+        """
+        글 작성 가능 여부 (30분에 post_limit개, 기본 2개)
+
+        대기열에서 재전송을 기다리는 내 글도 곧 올라갈 글이므로 같이 셈
+        (재전송된 글은 그때 post_count에 반영되므로 새 글과 합쳐도 한도를 넘지 않음)
+        """
+        self._reset_limits()
+        queued = 0 if self.dry_run else self.outbox.pending('post', nicknames=(self.nickname, "닥터 노"))
+        return self.post_count + queued < self.post_limit
+    
+    def can_comment(self):
+        """댓글 작성 가능 여부 (30분에 comment_limit개)"""
+        self._reset_limits()
+        return self.comment_limit is None or self.comment_count < self.comment_limit
     
     def decide_action(self, feed_analysis):
         """행동 결정"""
@@ -84,12 +168,16 @@ class AutonomousAgent:
                 k=1
             )[0]
     
-    def create_post(self, feed_analysis):
-        """게시글 작성"""
+    def create_post(self, snapshot):
+        """게시글 작성 (snapshot의 피드 분석 결과로 주제 선택)"""
         if not self.can_post():
-            print("[제한] 30분에 2개 제한 도달")
+            print(f"[제한] 30분에 {self.post_limit}개 제한 도달 (재전송 대기 중인 글 포함)")
             return False
         
+        # 내용을 만드는 동안 PoW를 백그라운드에서 미리 풀어둠
+        if not self.dry_run:
+            self.mersoom.prefetch_proof()
+        
         is_doctor_roh = False  # 닥터 노 여부
         
         # 10% 확률로 뉴스 포스팅
@@ -109,6 +197,7 @@ class AutonomousAgent:
                 return False
         else:
             # 일반 포스팅
+            feed_analysis = snapshot.analysis
             # 트렌드 다양화: Top 5 키워드 중 랜덤 선택 (가중치 부여는 단순 랜덤으로 대체)
             top_keywords = feed_analysis.get('keywords', [])[:5]
             if top_keywords:
@@ -141,6 +230,9 @@ class AutonomousAgent:
         # 닥터 노일 경우 닉네임 강제 설정
         author = "닥터 노" if is_doctor_roh else self.nickname
         
+        if self._past_deadline('글 작성'):
+            return False
+        
         try:
             if self.dry_run:
                 print(f"[TEST] 글 작성 시뮬레이션: {author}: {title}")
@@ -149,11 +241,9 @@ class AutonomousAgent:
                 self.last_post_time = time.time()
                 return True
 
-            result = self.mersoom.create_post(
-                nickname=author,
-                title=title,
-                content=content
-            )
+            if not self.outbox.submit('post', nickname=author, title=title, content=content):
+                print(f"[보류] 글 작성 실패 -> 대기열에서 재시도: {title}")
+                return False
             
             self.post_count += 1
             self.last_post_time = time.time()
@@ -164,58 +254,38 @@ class AutonomousAgent:
             print(f"[오류] 글 작성 실패: {e}")
             return False
     
-    def create_comment(self, feed_analysis):
-        """댓글 작성"""
+    def create_comment(self, snapshot):
+        """댓글 작성 (대상 글과 댓글, 분석 결과는 snapshot에 있는 것을 그대로 씀)"""
+        if not self.can_comment():
+            print(f"[제한] 30분에 댓글 {self.comment_limit}개 제한 도달")
+            return False
+        
         try:
-            # 최근 게시글 가져오기
-            posts = self.mersoom.get_feed(limit=10)
+            # 새로 올라온 글 우선, 없으면 이번 스냅샷의 최근 글 중에서 (이미 댓글 단 글은 제외)
+            posts = (self.acted.filter_new('comment', snapshot.new_posts, self.actor)
+                     or self.acted.filter_new('comment', snapshot.posts[:10], self.actor))
             if not posts:
+                print("[스킵] 최근 글에는 이미 다 댓글을 달았음")
                 return False
             
             # 랜덤 게시글 선택
             post = random.choice(posts)
             
+            # 댓글 내용을 만드는 동안 PoW를 백그라운드에서 미리 풀어둠
+            if not self.dry_run:
+                self.mersoom.prefetch_proof()
+            
             # 게시글 제목에서 닥터 노 여부 판단
             is_doctor_roh_post = "닥터 노" in post.get('title', '')
             
-            # 게시글 내용에서 키워드 추출 (문맥 파악)
-            # 4. 심층 분석: 댓글 여론 파악 (Deep Analysis)
-            # 댓글 가져오기 (문맥 파악용)
-            try:
-                comments = self.mersoom.get_comments(post['id'])
-            except Exception as e:
-                print(f"[ERROR] 댓글 가져오기 실패: {e}")
-                comments = []
-                
-            comments_text = " ".join([c.get('content', '') for c in comments])
-            
-            # 게시글 자체의 의도 파악
-            full_context_text = f"{post.get('title', '')} {post.get('content', '')} {comments_text}"
-            title_intent = self.analyzer.detect_intent(full_context_text)
-            
-            # (기존 댓글 분석 로직 통합)
-            if comments:
-                 comment_analysis = self.analyzer.analyze_comments(comments)
-                 comment_intent = comment_analysis['intent']
-            else:
-                 comment_intent = 'neutral'
-            
-            # 의도 융합 (Fusion)
-            # 댓글 분위기가 압도적(분노/유머)이면 댓글 분위기를 따름
-            if comment_intent in ['complaint', 'humor']:
-                final_intent = comment_intent
+            # 심층 분석: 글 의도 + 댓글 여론 + 가중치 키워드 (스냅샷에 캐시됨)
+            post_analysis = snapshot.analyze_post(post)
+            title_intent = post_analysis.title_intent
+            comment_intent = post_analysis.comment_intent
+            final_intent = post_analysis.intent
+            if comment_intent in ('complaint', 'humor'):
                 print(f"[분석] 댓글 분위기({comment_intent})가 지배적임 -> 의도 변경")
-            else:
-                final_intent = title_intent
-                
-            # 전체 텍스트에서 키워드 추출 (게시글 + 댓글)
-            # 가중치 적용: 제목(x3) > 본문(x2) > 댓글(x1)
-            comments_text = " ".join([c.get('content', '') for c in comments])
-            post_keywords = self.analyzer.extract_keywords_weighted(
-                title=post.get('title', ''), 
-                content=post.get('content', ''), 
-                comments_text=comments_text
-            )
+            post_keywords = post_analysis.weighted_keywords
 
             # 키워드가 없는 경우 스킵 (User Request: "없으면 댓글 작성 안하면 됨")
             if not post_keywords:
@@ -225,7 +295,7 @@ class AutonomousAgent:
             keyword = post_keywords[0]
             topic = post_keywords[1] if len(post_keywords) > 1 else '머슴'
             
-            keyword_type = self.analyzer.classify_keyword_type(keyword)
+            keyword_type = post_analysis.keyword_type
             
             print(f"[분석] 심층 파악 완료: {keyword}({keyword_type}), 의도: {final_intent} (Title: {title_intent}, Comments: {comment_intent})")
 
@@ -236,7 +306,7 @@ class AutonomousAgent:
                 is_doctor_roh=is_doctor_roh_post,
                 intent=final_intent,
                 keyword_type=keyword_type,
-                context=feed_analysis.get('situation') # MolecularBuilder를 위한 컨텍스트 주입
+                context=snapshot.analysis.get('situation') # MolecularBuilder를 위한 컨텍스트 주입
             )
             
             # 닥터 노 댓글은 음슴체 검증 불필요 (이미 특수 형식)
@@ -246,24 +316,352 @@ class AutonomousAgent:
             # 닥터 노 게시글에 댓글 달 때는 닉네임도 "닥터 노"
             author = "닥터 노" if is_doctor_roh_post else self.nickname
             
+            if self._past_deadline('댓글 작성'):
+                return False
+            
             if self.dry_run:
                 print(f"[TEST] 댓글 작성 시뮬레이션 (Post {post['id']})")
                 print(f"[TEST] 대상 글: {post.get('title', '제목없음')}")
                 print(f"[TEST] {author}: {comment}")
+                self.comment_count += 1
+                self.acted.mark('comment', post['id'], self.actor)
                 return True
 
-            result = self.mersoom.create_comment(
-                post_id=post['id'],
-                nickname=author,
-                content=comment
-            )
+            # 실패해도 대기열에서 다시 보내므로 이 글은 댓글 단 글로 기록
+            self.acted.mark('comment', post['id'], self.actor)
+            if not self.outbox.submit('comment', post_id=post['id'], nickname=author, content=comment):
+                print(f"[보류] 댓글 작성 실패 -> 대기열에서 재시도: {comment}")
+                return False
             
+            self.comment_count += 1
             print(f"[댓글] {author}: {comment}")
             return True
         except Exception as e:
             print(f"[오류] 댓글 작성 실패: {e}")
             return False
     
+    def flush_outbox(self):
+        """대기열에 남은 글/댓글 재전송 (나중에 올라간 글도 작성 횟수에 포함)"""
+        if self.dry_run:
+            return
+        for kind, _ in self.outbox.flush(stop=deadline_passed):
+            self.count_write(kind)
+    
+    @staticmethod
+    def _past_deadline(action):
+        """스케줄러 작업의 제한시간이 지났으면 action을 건너뜀 (True면 건너뛰어야 함)"""
+        if deadline_passed():
+            print(f"[스케줄] 제한시간 지남 -> {action} 건너뜀")
+            return True
+        return False
+    
+    def count_write(self, kind):
+        """대기열에서 뒤늦게 올라간 글/댓글을 작성 횟수에 반영"""
+        if kind == 'post':
+            self.post_count += 1
+            self.last_post_time = time.time()
+        elif kind == 'comment':
+            self.comment_count += 1
+    
+    def refresh_feed(self):
+        """
+        최근 글 20개와 그 댓글을 받아서 새 스냅샷 만들기 (실패 시 None)
+        (분석은 analyze_feed가 따로 붙이므로 그 전까지는 직전 스냅샷의 분석 결과를 이어 씀)
+        """
+        # 피드 분석 (Deep Trend Analysis)
+        print("[분석] 피드 및 댓글 심층 분석 중...")
+        posts = self.mersoom.get_feed(limit=20)
+        
+        if not posts:
+            print("[오류] 피드 가져오기 실패 (None 반환)")
+            return None
+
+        # 댓글까지 싹 긁어오기 (User Request: "제목, 내용, 댓글 확인하면서 트렌드 결정")
+        # 글 20개의 댓글을 동시에 가져옴 (동시 요청 수는 async_mersoom.concurrency로 제한)
+        comments_by_post = asyncio.run(
+            self.async_mersoom.get_comments_many([post['id'] for post in posts])
+        )
+        for post in posts:
+            # 댓글을 글에 붙여두면 제목 + 내용 + 댓글 분석용 텍스트(full_text)는 처음 읽을 때 한 번만 만들어짐
+            post.attach_comments(comments_by_post.get(post.id) or [])
+        
+        new_posts = self.feed_sync.take_new(posts)
+        with self._snapshot_lock:
+            previous = self.snapshot
+            self.snapshot = FeedSnapshot(posts, self.analyzer, self.templates, new_posts=new_posts,
+                                         analysis=previous.analysis if previous else None)
+            return self.snapshot
+    
+    def analyze_feed(self, snapshot):
+        """제목 + 내용 + 댓글 기반 트렌드 분석 (분석 결과를 붙인 스냅샷 반환)"""
+        posts = snapshot.posts
+        # 분석기에 'full_text'를 우선적으로 보라고 개조는 안 했으니,
+        # analyzer.analyze는 여전히 title/content만 봅니다.
+        # 따라서 analyzer의 extract_keywords를 직접 호출해서 '진짜 트렌드'를 덮어씌웁니다.
+        
+        # 1. 기존 분석 (활동량 등)
+        analysis = self.analyzer.analyze(posts)
+        
+        # 2. 심층 트렌드 분석 (Override)
+        all_text_blobs = ' '.join([p.full_text for p in posts])
+        deep_keywords = self.analyzer.extract_keywords(all_text_blobs)
+        
+        # 키워드 필터링 (1글자 제외 등은 extract_keywords에 이미 포함됨)
+        if deep_keywords:
+            analysis['keywords'] = deep_keywords[:10]
+            analysis['top_keyword'] = deep_keywords[0]
+            analysis['trending_topic'] = deep_keywords[0]
+            print(f"[분석] Deep Trend 발견: {analysis['top_keyword']} (기반: 게시글 20개 + 댓글 전체)")
+        else:
+             print("[분석] 뚜렷한 트렌드 없음. 기본값 유지.")
+             analysis['top_keyword'] = "None"
+        
+        print(f"\n[분석] 활동량: {analysis['activity']}, 트렌드: {analysis['trending_topic']}")
+        analyzed = snapshot.with_analysis(analysis)
+        with self._snapshot_lock:
+            # 분석하는 사이에 피드가 새로 들어왔으면 최신 글은 그대로 두고 분석 결과만 옮겨 붙임
+            if self.snapshot is None or self.snapshot is snapshot:
+                self.snapshot = analyzed
+            elif self.snapshot.taken_at >= snapshot.taken_at:
+                self.snapshot = self.snapshot.with_analysis(analysis)
+        return analyzed
+    
+    def auto_vote(self, snapshot):
+        """자동 투표: 맘에 드는 글 개추, 없으면 규칙 위반/성의 없는 글 비추 (이미 투표한 글은 건너뜀)"""
+        posts = self.acted.filter_new('vote', snapshot.posts, self.actor)
+        # ==========================================
+        # V2 Feature: Auto-Vote (자동 투표)
+        # ==========================================
+        # 트렌드와 일치하거나(Tech/Life) 고품질 글에 투표
+        voted = False
+        for post in posts[:3]: # 상위 3개만 검사
+            title = post.title
+            content = post.content
+            
+            # 1. Tech/Life 카테고리고 길이가 적당하면 '개추'
+            category = snapshot.analyze_post(post).category
+            if category is None: continue
+            
+            if category in ['tech', 'life'] and len(content) > 20:
+                print(f"[투표] '{title}' 글이 {category} 주제라 맘에 듦 -> 개추 시도")
+                if self.cast_vote(post, 'up', '투표'):
+                    voted = True
+                    break # 한 턴에 하나만 투표
+        
+        if not voted:
+            # 3. 규칙 위반자 처벌 (The Punisher)
+            # 이모지, 마크다운, 존댓말, 성의 없는 글을 스냅샷 전체에서 한 번씩 훑고 위반 점수가 높은 글부터 비추
+            for verdict in self.moderation.scan(posts):
+                post = verdict.post
+                # 성의 없는 글만 걸린 경우는 반반 확률로 봐줌
+                if verdict.only('low_effort') and random.random() >= 0.5:
+                    continue
+                print(f"[처벌] '{post.get('title')}' 글이 규칙 위반({verdict.reason}, 점수 {verdict.score}) -> 비추 시도")
+                if self.cast_vote(post, 'down', '처벌'):
+                    break
+    
+    def cast_vote(self, post, vote_type, label):
+        """
+        투표 한 번 (테스트 모드면 시뮬레이션)
+
+        Returns:
+            이번 턴 투표를 끝낼지 여부 (성공했거나 오류가 나거나 제한시간이 지나면 True)
+        """
+        if self._past_deadline('투표'):
+            return True
+        if self.dry_run:
+            print(f"[TEST] {label} 시뮬레이션: {'개추' if vote_type == 'up' else '비추'} (Post {post['id']})")
+            self.acted.mark('vote', post['id'], self.actor)
+            return True
+        try:
+            outcome = self.mersoom.vote_outcome(post['id'], vote_type)
+        except Exception as e:
+            print(f"[ERROR] 투표 중 오류 발생: {e}")
+            return True
+        # 성공했거나 서버가 거절한 글(이미 투표함 등)만 기록 (PoW 시간 초과/429/네트워크 오류면 다음에 다시 시도)
+        if outcome != 'failed':
+            self.acted.mark('vote', post['id'], self.actor)
+        return outcome == 'ok'
+    
+    def plan_actions(self, analysis):
+        """상황(활동량)에 따른 행동 계획 (예: ['comment', 'comment', 'read'])"""
+        # ==========================================
+        # 행동 결정 (Multi-Tasking)
+        # ==========================================
+        situation = analysis.get('situation', {})
+        intensity = situation.get('intensity', 'medium')
+        
+        # 상황에 따른 행동 플랜 수립
+        actions = []
+        
+        if intensity == 'high':
+            # 혼잡: 댓글 위주지만 가끔 글도 씀
+            if random.random() < 0.2:
+                actions = ['post', 'comment'] # 글쓰고 댓글달기
+                print(f"[플랜] 혼잡 상황(High) -> 틈새시장 공략 (글작성+댓글)")
+            else:
+                actions = ['comment', 'comment', 'read']
+                print(f"[플랜] 혼잡 상황(High) -> 다중 행동 개시 (댓글x2 + 읽기)")
+        elif intensity == 'low':
+            # 정적: 게시글 작성 (장작 넣기) or 읽기
+            actions = ['post'] if random.random() < 0.7 else ['read', 'read']
+            print(f"[플랜] 정적 상황(Low) -> 장작 넣기 시도")
+        else:
+            # 보통: 기본 행동 1개
+            base_action = self.decide_action(analysis)
+            actions = [base_action]
+            # 간헐적으로 2연타
+            if random.random() < 0.3:
+                actions.append('read')
+        
+        print(f"[행동] 실행 계획: {actions}")
+        return actions
+    
+    def run_actions(self, actions, snapshot):
+        """행동 계획 실행"""
+        # 행동 루프 실행
+        for action in actions:
+            if action == 'post':
+                self.create_post(snapshot)
+            elif action == 'comment':
+                self.create_comment(snapshot)
+            elif action == 'read':
+                print("[읽기] 피드 모니터링 중...")
+            elif action == 'sleep':
+                print("[수면] 대기 모드")
+            # 다중 행동 사이 딜레이는 MersoomAPI의 속도 제한기가 맡음 (429 방지)
+    
+    def run_cycle(self):
+        """한 사이클 실행: 대기열 재전송 -> 피드/댓글 심층 분석 -> 투표 -> 행동 (피드를 못 받으면 False)"""
+        self.flush_outbox()
+        
+        snapshot = self.refresh_feed()
+        if not snapshot:
+            return False
+        
+        snapshot = self.analyze_feed(snapshot)
+        self.auto_vote(snapshot)
+        self.run_actions(self.plan_actions(snapshot.analysis), snapshot)
+        return True
+    
+    # ---- 스케줄러 작업 (각자 주기대로 돌고, 최신 스냅샷만 공유) ----
+    
+    def _task_feed(self):
+        self.refresh_feed()
+    
+    def _task_analysis(self):
+        if self.snapshot:
+            self.analyze_feed(self.snapshot)
+    
+    def _task_vote(self):
+        if self.snapshot:
+            self.auto_vote(self.snapshot)
+    
+    def _task_comment(self):
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.analysis is None:
+            return
+        for _ in range(self.plan_actions(snapshot.analysis).count('comment')):
+            if deadline_passed():
+                break
+            self.create_comment(snapshot)
+    
+    def _task_post(self):
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.analysis is not None and 'post' in self.plan_actions(snapshot.analysis):
+            self.create_post(snapshot)
+    
+    def _task_metrics(self):
+        self.mersoom.metrics.dump(self.metrics_path)
+    
+    def task_handlers(self):
+        """스케줄러 작업 이름 -> 실행 함수 (피드가 먼저 돌도록 실행 순서대로)"""
+        return {
+            'feed': self._task_feed,
+            'analysis': self._task_analysis,
+            'vote': self._task_vote,
+            'comment': self._task_comment,
+            'post': self._task_post,
+            'outbox': self.flush_outbox,
+        }
+    
+    def build_tasks(self, names=None, schedule=None, prefix=''):
+        """
+        작업별 주기/제한시간으로 PeriodicTask 목록 구성
+        (피드가 먼저 한 번 돌도록 나머지 작업은 조금씩 늦게 시작)
+
+        Args:
+            names: 만들 작업 이름 (기본: 전체)
+            schedule: self.schedule 덮어쓰기 {작업: (간격, 제한시간)}
+            prefix: 작업 이름 앞에 붙일 문자열 (로그 구분용)
+        """
+        schedule = dict(self.schedule, **(schedule or {}))
+        tasks = []
+        for order, (name, handler) in enumerate(self.task_handlers().items()):
+            if names is not None and name not in names:
+                continue
+            interval, timeout = schedule[name]
+            tasks.append(PeriodicTask(prefix + name, handler, interval, timeout, initial_delay=order * 5.0))
+        return tasks
+    
+    def build_scheduler(self, schedule=None):
+        """전체 작업 스케줄러 구성 (metrics_path가 있으면 계측 저장 작업도 추가)"""
+        scheduler = TaskScheduler(self.build_tasks(schedule=schedule))
+        if self.metrics_path:
+            scheduler.add(PeriodicTask('metrics', self._task_metrics, 60, 10, initial_delay=60))
+        return scheduler
+    
+    def run_scheduled(self, schedule=None, duration=None):
+        """
+        작업별 스케줄러로 실행 (느린 쓰기 작업이 피드 동기화/분석을 막지 않음)
+
+        Args:
+            schedule: SCHEDULE 덮어쓰기 {작업: (간격, 제한시간)}
+            duration: 이 시간(초)이 지나면 종료 (기본: Ctrl+C까지)
+        """
+        print(f"=== 머슴 자율 에이전트 시작 (스케줄러) ===")
+        print(f"닉네임: {self.nickname}")
+        scheduler = self.build_scheduler(schedule)
+        for task in scheduler.tasks:
+            print(f"  {task.name}: {task.interval:.0f}초마다 (제한 {task.timeout:.0f}초)")
+        try:
+            asyncio.run(scheduler.run(duration))
+        except KeyboardInterrupt:
+            print("\n\n=== 에이전트 종료 ===")
+        return scheduler
+    
+    def handle_arena_phase(self, phase, arena_posts, info):
+        """콜로세움 페이즈가 바뀔 때: 발의 페이즈면 주제 발의, 참전 페이즈면 토론글 하나에 참전"""
+        analysis = (self.snapshot and self.snapshot.analysis) or {}
+        keyword = analysis.get('top_keyword')
+        if not keyword or keyword == "None":
+            keyword = 'AI'
+        topic = analysis.get('trending_topic') or '머슴'
+
+        if phase == 'propose':
+            title, _ = self.templates.generate_title(keyword=keyword, topic=topic, intent='opinion')
+            content = self.templates.generate_content(keyword=keyword, topic=topic, intent='opinion')
+            if self.dry_run:
+                print(f"[TEST] 아레나 발의 시뮬레이션: {title}")
+                return
+            self.mersoom.propose_arena(self.nickname, title, content)
+        elif phase == 'fight' and arena_posts:
+            target = arena_posts[0]
+            side = random.choice(['pro', 'con'])
+            target_keywords = self.analyzer.extract_keywords(target.get('title', '')) or [keyword]
+            content = self.templates.generate_comment(keyword=target_keywords[0], topic=topic, intent='opinion')
+            if self.dry_run:
+                print(f"[TEST] 아레나 참전 시뮬레이션 ({side}): {target.get('title', '')} <- {content}")
+                return
+            self.mersoom.fight_arena(target['id'], self.nickname, content, side)
+        else:
+            print(f"[아레나] {phase} 페이즈 (토론글 {len(arena_posts)}개) -> 관전")
+    
+    def start_arena(self):
+        """콜로세움 페이즈 감시를 백그라운드에서 시작"""
+        self.arena_watcher = ArenaWatcher(self.mersoom, on_phase=self.handle_arena_phase)
+        self.arena_watcher.start()
+    
     def run(self, interval=300):
         """메인 루프 (기본 5분 간격)"""
         print(f"=== 머슴 자율 에이전트 시작 ===")
@@ -272,192 +670,12 @@ class AutonomousAgent:
         
         while True:
             try:
-                # 피드 분석 (Deep Trend Analysis)
-                print("[분석] 피드 및 댓글 심층 분석 중... (약 5-10초 소요)")
-                posts = self.mersoom.get_feed(limit=20)
-                
-                if not posts:
-                    print("[오류] 피드 가져오기 실패 (None 반환)")
+                ok = self.run_cycle()
+                if self.metrics_path:
+                    self.mersoom.metrics.dump(self.metrics_path)
+                if not ok:
                     time.sleep(60)
                     continue
-
-                # 댓글까지 싹 긁어오기 (User Request: "제목, 내용, 댓글 확인하면서 트렌드 결정")
-                full_context_posts = []
-                for post in posts:
-                    # 댓글 가져오기
-                    # 댓글 가져오기 (API 부하 방지를 위해 1초 대기)
-                    try:
-                        time.sleep(1.0)
-                        comments = self.mersoom.get_comments(post['id'])
-                    except Exception as e:
-                        print(f"[ERROR] 댓글 가져오기 실패 ({post['id']}): {e}")
-                        comments = []
-                    
-                    if comments:
-                         post['comments_text'] = ' '.join([c.get('content', '') for c in comments])
-                    else:
-                         post['comments_text'] = ''
-                    
-                    # 제목 + 내용 + 댓글을 모두 합쳐서 분석용 텍스트 생성
-                    post['full_text'] = f"{post.get('title', '')} {post.get('content', '')} {post['comments_text']}"
-                    full_context_posts.append(post)
-                
-                # 분석기에 'full_text'를 우선적으로 보라고 개조는 안 했으니,
-                # analyzer.analyze는 여전히 title/content만 봅니다.
-                # 따라서 analyzer의 extract_keywords를 직접 호출해서 '진짜 트렌드'를 덮어씌웁니다.
-                
-                # 1. 기존 분석 (활동량 등)
-                analysis = self.analyzer.analyze(posts)
-                
-                # 2. 심층 트렌드 분석 (Override)
-                all_text_blobs = ' '.join([p['full_text'] for p in full_context_posts])
-                deep_keywords = self.analyzer.extract_keywords(all_text_blobs)
-                
-                # 키워드 필터링 (1글자 제외 등은 extract_keywords에 이미 포함됨)
-                if deep_keywords:
-                    analysis['keywords'] = deep_keywords[:10]
-                    analysis['top_keyword'] = deep_keywords[0]
-                    analysis['trending_topic'] = deep_keywords[0]
-                    print(f"[분석] Deep Trend 발견: {analysis['top_keyword']} (기반: 게시글 20개 + 댓글 전체)")
-                else:
-                     print("[분석] 뚜렷한 트렌드 없음. 기본값 유지.")
-                     analysis['top_keyword'] = "None"
-                
-                print(f"\n[분석] 활동량: {analysis['activity']}, 트렌드: {analysis['trending_topic']}")
-                
-                # ==========================================
-                # V2 Feature: Auto-Vote (자동 투표)
-                # ==========================================
-                # 트렌드와 일치하거나(Tech/Life) 고품질 글에 투표
-                voted = False
-                for post in posts[:3]: # 상위 3개만 검사
-                    title = post.get('title', '')
-                    content = post.get('content', '')
-                    post_text = title + " " + content
-                    
-                    # 1. Tech/Life 카테고리고 길이가 적당하면 '개추'
-                    keyword_for_check = self.analyzer.extract_keywords(post_text)
-                    if not keyword_for_check: continue
-                    
-                    category = self.templates.classify_category(keyword_for_check[0])
-                    if category in ['tech', 'life'] and len(content) > 20:
-                        print(f"[투표] '{title}' 글이 {category} 주제라 맘에 듦 -> 개추 시도")
-                        if self.dry_run:
-                            print(f"[TEST] 투표 시뮬레이션: 개추 (Post {post['id']})")
-                            voted = True
-                            break
-
-                        try:
-                            if self.mersoom.vote(post['id'], 'up'):
-                                voted = True
-                                time.sleep(2)
-                                break # 한 턴에 하나만 투표
-                        except Exception as e:
-                            print(f"[ERROR] 투표 중 오류 발생: {e}")
-                            time.sleep(5)
-                            break
-                
-                if not voted:
-                    # 3. 규칙 위반자 처벌 (The Punisher)
-                    # 이모지, 마크다운, 존댓말 사용 감지
-                    for post in posts[:5]:
-                        check_text = post.get('title', '') + " " + post.get('content', '')
-                        
-                        # 이모지 감지 (단, 자모음 ㅋ,ㅎ,ㅠ,ㅜ 제외)
-                        # 간단하게 주요 이모지 범위만 체크
-                        emoji_pattern = r'[😀-🙏]' 
-                        markdown_pattern = r'\*\*|##|__|```'
-                        polite_pattern = r'요\.|요$|습니다|입니다'
-                        
-                        violation_reason = ""
-                        if re.search(emoji_pattern, check_text):
-                            violation_reason = "이모지 사용"
-                        elif re.search(markdown_pattern, check_text):
-                            violation_reason = "마크다운 사용"
-                        elif re.search(polite_pattern, check_text):
-                            violation_reason = "존댓말(비음슴체) 사용"
-                            
-                        if violation_reason:
-                             print(f"[처벌] '{post.get('title')}' 글이 규칙 위반({violation_reason}) -> 비추 시도")
-                             
-                             if self.dry_run:
-                                 print(f"[TEST] 처벌 시뮬레이션: 비추 (Post {post['id']})")
-                                 break
-
-                             try:
-                                 if self.mersoom.vote(post['id'], 'down'):
-                                     time.sleep(2)
-                                     break
-                             except Exception as e:
-                                 print(f"[ERROR] 투표 중 오류 발생: {e}")
-                                 time.sleep(5)
-                                 break
-                        
-                        # 4. 쓰레기 글(너무 짧음) 비추
-                        if len(post.get('content', '')) < 5 and '망고' not in post.get('title', ''):
-                             if random.random() < 0.5:
-                                 print(f"[투표] '{post.get('title')}' 글이 너무 성의 없음 -> 비추 시도")
-
-                                 if self.dry_run:
-                                     print(f"[TEST] 투표 시뮬레이션: 비추 (Post {post['id']})")
-                                     break
-
-                                 try:
-                                     if self.mersoom.vote(post['id'], 'down'):
-                                         time.sleep(2)
-                                         break
-                                 except Exception as e:
-                                     print(f"[ERROR] 투표 중 오류 발생: {e}")
-                                     time.sleep(5)
-                                     break
-
-                # ==========================================
-                # 행동 결정
-                # ==========================================
-                # ==========================================
-                # 행동 결정 (Multi-Tasking)
-                # ==========================================
-                situation = analysis.get('situation', {})
-                intensity = situation.get('intensity', 'medium')
-                
-                # 상황에 따른 행동 플랜 수립
-                actions = []
-                
-                if intensity == 'high':
-                    # 혼잡: 댓글 위주지만 가끔 글도 씀
-                    if random.random() < 0.2:
-                        actions = ['post', 'comment'] # 글쓰고 댓글달기
-                        print(f"[플랜] 혼잡 상황(High) -> 틈새시장 공략 (글작성+댓글)")
-                    else:
-                        actions = ['comment', 'comment', 'read']
-                        print(f"[플랜] 혼잡 상황(High) -> 다중 행동 개시 (댓글x2 + 읽기)")
-                elif intensity == 'low':
-                    # 정적: 게시글 작성 (장작 넣기) or 읽기
-                    actions = ['post'] if random.random() < 0.7 else ['read', 'read']
-                    print(f"[플랜] 정적 상황(Low) -> 장작 넣기 시도")
-                else:
-                    # 보통: 기본 행동 1개
-                    base_action = self.decide_action(analysis)
-                    actions = [base_action]
-                    # 간헐적으로 2연타
-                    if random.random() < 0.3:
-                        actions.append('read')
-                
-                print(f"[행동] 실행 계획: {actions}")
-                
-                # 행동 루프 실행
-                for action in actions:
-                    if action == 'post':
-                        self.create_post(analysis)
-                    elif action == 'comment':
-                        self.create_comment(analysis)
-                    elif action == 'read':
-                        print("[읽기] 피드 모니터링 중...")
-                    elif action == 'sleep':
-                        print("[수면] 대기 모드")
-                    
-                    # 다중 행동 사이 딜레이 (429 방지)
-                    time.sleep(random.uniform(2, 5))
                 
                 # 대기
                 wait_time = interval + random.randint(-60, 60)  # ±1분 랜덤
@@ -478,15 +696,27 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Mersoom Autonomous Agent')
     parser.add_argument('--dry-run', action='store_true', help='실제 API 호출 없이 테스트 실행')
+    parser.add_argument('--base-url', help='API 주소 (예: 모의 서버 http://127.0.0.1:8765/api)')
+    parser.add_argument('--record', help='모든 요청/응답을 카세트 파일에 녹화')
+    parser.add_argument('--replay', help='카세트 파일의 응답을 네트워크 없이 재생')
+    parser.add_argument('--scheduler', action='store_true', help='5분마다 한 사이클 대신 작업별 주기 스케줄러로 실행')
+    parser.add_argument('--arena', action='store_true', help='콜로세움 페이즈를 감시하면서 발의/참전')
+    parser.add_argument('--metrics', help='사이클마다 응답 시간/PoW 계측 결과 저장 (.prom이면 Prometheus 형식)')
     args = parser.parse_args()
     
     # Mersoom은 PoW만 필요하고 API 키가 필요 없음
     # AutonomousAgent 구조상 api_key 파라미터가 있지만 빈 문자열 전달
     api_key = ""
     
-    agent = AutonomousAgent(api_key, dry_run=args.dry_run)
+    agent = AutonomousAgent(api_key, dry_run=args.dry_run, base_url=args.base_url,
+                            record=args.record, replay=args.replay, metrics_path=args.metrics)
     
     if args.dry_run:
         print("=== [TEST MODE] API 호출이 비활성화되었습니다 ===")
-        
-    agent.run(interval=300)  # 5분 간격
+    if args.arena:
+        agent.start_arena()
+    
+    if args.scheduler:
+        agent.run_scheduled()
+    else:
+        agent.run(interval=300)  # 5분 간격
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+JSON 디코딩 벤치마크
+피드/댓글 응답 크기의 JSON을 표준 json, requests의 response.json(), orjson(설치 시)으로 디코딩해서
+글 1000개당 디코딩 시간(ms)과 Post 레코드 변환까지 포함한 시간을 JSON으로 출력
+
+실행:
+    python bench_json.py --posts 1000 --comments 5 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules import fastjson
+from modules.models import Post
+
+WORDS = ['AI', 'GPT', '머슴', '서버', '코딩', '주인', '야근', '커피', '새벽', '트렌드', 'ㅋㅋㅋ', '레전드임', '그렇슴', '맞음']
+
+
+def make_feed(count, comments_per_post, seed):
+    """모의 피드 응답 본문 (bytes)"""
+    rng = random.Random(seed)
+
+    def sentence(n):
+        return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+    posts = []
+    for i in range(count):
+        posts.append({
+            'id': f"p{i}",
+            'nickname': f"머슴{i % 50}",
+            'title': sentence(6),
+            'content': sentence(60),
+            'score': rng.randint(-5, 30),
+            'views': rng.randint(0, 500),
+            'comment_count': comments_per_post,
+            'created_at': 1700000000 + i,
+            'comments': [
+                {'id': f"c{i}_{j}", 'post_id': f"p{i}", 'parent_id': None,
+                 'nickname': f"댓글러{j}", 'content': sentence(12), 'created_at': 1700000000 + i}
+                for j in range(comments_per_post)
+            ],
+        })
+    return json.dumps({'posts': posts, 'system_message': 'bench'}, ensure_ascii=False).encode('utf-8')
+
+
+def make_response(body):
+    """네트워크 없이 requests.Response 생성"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    return response
+
+
+def timed(fn, repeat):
+    """repeat번 실행한 소요 시간 중 최솟값 (ms)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mersoom JSON 디코딩 벤치마크')
+    parser.add_argument('--posts', type=int, default=1000, help='응답 하나에 들어갈 글 수 (기본: 1000)')
+    parser.add_argument('--comments', type=int, default=5, help='글당 댓글 수 (기본: 5)')
+    parser.add_argument('--repeat', type=int, default=20, help='측정 반복 횟수 (최솟값 사용, 기본: 20)')
+    parser.add_argument('--seed', type=int, default=0, help='랜덤 시드 (기본: 0)')
+    args = parser.parse_args()
+
+    body = make_feed(args.posts, args.comments, args.seed)
+    per_1k = 1000 / args.posts
+
+    decoders = {
+        'json.loads': lambda: json.loads(body),
+        'response.json': lambda: make_response(body).json(),
+    }
+    if fastjson.ORJSON_AVAILABLE:
+        import orjson
+        decoders['orjson.loads'] = lambda: orjson.loads(body)
+    decoders[f"fastjson.decode_response ({fastjson.BACKEND})"] = lambda: fastjson.decode_response(make_response(body))
+
+    results = []
+    for name, decode in decoders.items():
+        decode_ms = timed(decode, args.repeat)
+        records_ms = timed(lambda: Post.from_json_list(decode()['posts']), args.repeat)
+        results.append({
+            'decoder': name,
+            'decode_ms_per_1k_posts': round(decode_ms * per_1k, 3),
+            'decode_and_records_ms_per_1k_posts': round(records_ms * per_1k, 3),
+        })
+
+    baseline = results[1]['decode_ms_per_1k_posts']
+    for case in results:
+        case['speedup_vs_response_json'] = round(baseline / case['decode_ms_per_1k_posts'], 2)
+
+    report = {
+        'posts': args.posts,
+        'comments_per_post': args.comments,
+        'body_bytes': len(body),
+        'orjson_available': fastjson.ORJSON_AVAILABLE,
+        'results': results,
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+PoW 벤치마크
+모든 솔버 백엔드를 target prefix 길이 x 워커 수 조합으로 돌려서
+해시 속도, 해결 시간 p50/p95/p99, 시간 초과율을 JSON으로 출력
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import uuid
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mersoom import MersoomPoW, POW_BACKENDS
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return round(ordered[int(rank) - 1], 3)
+
+
+def run_case(backend, prefix_len, workers, trials, limit_ms):
+    """한 조합(백엔드, prefix 길이, 워커 수)을 trials번 실행"""
+    target_prefix = '0' * prefix_len
+    solve_times = []
+    total_attempts = 0
+    total_ms = 0.0
+    timeouts = 0
+
+    for _ in range(trials):
+        seed = uuid.uuid4().hex
+        # 솔버 로그는 결과 JSON과 섞이지 않게 버림
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = MersoomPoW.solve(seed, target_prefix, limit_ms, workers, backend)
+        total_attempts += result['attempts']
+        total_ms += result['elapsed_ms']
+        if result['nonce'] is None:
+            timeouts += 1
+        else:
+            solve_times.append(result['elapsed_ms'])
+
+    return {
+        'backend': backend,
+        'prefix_len': prefix_len,
+        'workers': workers,
+        'trials': trials,
+        'hashes_per_sec': round(total_attempts / (total_ms / 1000)) if total_ms else 0,
+        'p50_ms': percentile(solve_times, 50),
+        'p95_ms': percentile(solve_times, 95),
+        'p99_ms': percentile(solve_times, 99),
+        'timeout_rate': timeouts / trials,
+    }
+
+
+def compare_baseline(results, baseline, tolerance):
+    """기준 결과 대비 해시 속도가 tolerance 이상 떨어진 조합 목록"""
+    def key(case):
+        return (case['backend'], case['prefix_len'], case['workers'])
+
+    previous = {key(case): case for case in baseline.get('results', [])}
+    regressions = []
+    for case in results:
+        old = previous.get(key(case))
+        if not old or not old.get('hashes_per_sec'):
+            continue
+        ratio = case['hashes_per_sec'] / old['hashes_per_sec']
+        if ratio < 1 - tolerance:
+            regressions.append({
+                'backend': case['backend'],
+                'prefix_len': case['prefix_len'],
+                'workers': case['workers'],
+                'baseline_hashes_per_sec': old['hashes_per_sec'],
+                'hashes_per_sec': case['hashes_per_sec'],
+                'ratio': round(ratio, 3),
+            })
+    return regressions
+
+
+def parse_int_list(text):
+    return [int(x) for x in text.split(',') if x.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mersoom PoW 벤치마크')
+    parser.add_argument('--backends', default=','.join(POW_BACKENDS),
+                        help=f"쉼표로 구분한 백엔드 목록 (기본: {','.join(POW_BACKENDS)})")
+    parser.add_argument('--prefix-lengths', type=parse_int_list, default=[2, 3, 4, 5],
+                        help='target prefix 길이 목록 (기본: 2,3,4,5)')
+    parser.add_argument('--workers', type=parse_int_list, default=[1, 2, os.cpu_count() or 1],
+                        help='워커 수 목록 (기본: 1,2,CPU 코어 수)')
+    parser.add_argument('--trials', type=int, default=20, help='조합당 실행 횟수 (기본: 20)')
+    parser.add_argument('--limit-ms', type=int, default=2000, help='챌린지 제한시간 (기본: 2000ms)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON (해시 속도 회귀 시 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='허용하는 해시 속도 하락 비율 (기본: 0.2)')
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    unknown = [b for b in backends if b not in POW_BACKENDS]
+    if unknown:
+        parser.error(f"알 수 없는 백엔드: {', '.join(unknown)}")
+
+    results = []
+    for backend in backends:
+        for prefix_len in args.prefix_lengths:
+            for workers in sorted(set(args.workers)):
+                print(f"[벤치] {backend} prefix={prefix_len} workers={workers}", file=sys.stderr)
+                results.append(run_case(backend, prefix_len, workers, args.trials, args.limit_ms))
+
+    report = {
+        'cpu_count': os.cpu_count(),
+        'limit_ms': args.limit_ms,
+        'results': results,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        report['regressions'] = compare_baseline(results, baseline, args.tolerance)
+        if report['regressions']:
+            exit_code = 1
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if exit_code:
+        print(f"[벤치] 해시 속도 회귀 {len(report['regressions'])}건 발견", file=sys.stderr)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+녹화 트래픽 재생 벤치마크
+카세트 파일(python autonomous_agent.py --record FILE 로 녹화)을 네트워크 없이 재생하면서
+FeedAnalyzer 분석, 템플릿 생성, AutonomousAgent 사이클의 소요 시간을 JSON으로 출력
+(네트워크가 빠지므로 시간 편차는 우리 코드에서만 나옴)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autonomous_agent import AutonomousAgent
+from mersoom import MersoomAPI
+from modules.acted_index import ActedIndex
+from modules.analyzer import FeedAnalyzer
+from modules.news import NewsAggregator
+from modules.store import PostStore
+from modules.templates import MerseumTemplates
+
+
+class ReplayNews(NewsAggregator):
+    """네트워크 대신 고정 헤드라인을 돌려주는 뉴스 소스 (뉴스 글 사이클도 오프라인으로 재생)"""
+
+    HEADLINES = [
+        {'title': '정부, AI 기본법 시행령 입법예고', 'link': ''},
+        {'title': '반도체 수출 3개월 연속 증가', 'link': ''},
+        {'title': '전국 대체로 맑고 일교차 커', 'link': ''},
+    ]
+
+    def fetch_headlines(self, source_name=None):
+        return list(self.HEADLINES)
+
+
+def summarize(samples_ms):
+    """소요 시간 목록 -> p50/p95/max (ms)"""
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return {}
+
+    def pick(pct):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))], 3)
+
+    return {'runs': len(ordered), 'p50_ms': pick(50), 'p95_ms': pick(95), 'max_ms': round(ordered[-1], 3)}
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화 트래픽 재생 벤치마크')
+    parser.add_argument('cassette', help='카세트 파일 경로')
+    parser.add_argument('--repeat', type=int, default=50, help='분석/템플릿 반복 횟수 (기본: 50)')
+    parser.add_argument('--cycles', type=int, default=3, help='에이전트 사이클 횟수 (기본: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='random 시드 (기본: 0)')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        api = MersoomAPI(replay=args.cassette)
+        posts = api.get_feed(limit=20) or []
+    analyzer = FeedAnalyzer()
+    templates = MerseumTemplates()
+
+    report = {
+        'cassette': args.cassette,
+        'posts': len(posts),
+        'analyzer': timed(lambda: analyzer.analyze(posts), args.repeat),
+        'templates': timed(lambda: (templates.generate_title(keyword='AI', topic='머슴'),
+                                    templates.generate_comment(keyword='AI', topic='머슴')), args.repeat),
+    }
+
+    # 에이전트 사이클마다 카세트를 처음부터 다시 재생
+    cycle_samples = []
+    for _ in range(args.cycles):
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent = AutonomousAgent("", sync_state=False, outbox_path=':memory:', replay=args.cassette,
+                                    store=PostStore(':memory:'), acted=ActedIndex(path=False),
+                                    news=ReplayNews())
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent.run_cycle()
+        cycle_samples.append((time.perf_counter() - start) * 1000)
+    report['agent_cycle'] = summarize(cycle_samples)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
+import asyncio
 import time
 from mersoom import MersoomAPI
+from modules.async_api import AsyncMersoomAPI
 
 def check_feed_and_latency():
     api = MersoomAPI()
@@ -30,5 +32,13 @@ def check_feed_and_latency():
     print(f"\nTime for 5 posts: {duration:.2f}s (Avg: {duration/5:.2f}s/req)")
     print(f"Estimated for 20 posts: {duration * 4:.2f}s")
 
+    # Measure Concurrent Fan-out
+    print(f"\nFetching comments for {len(posts)} posts concurrently...")
+    async_api = AsyncMersoomAPI(api)
+    start = time.time()
+    asyncio.run(async_api.get_comments_many([post['id'] for post in posts]))
+    print(f"Fan-out for {len(posts)} posts: {time.time() - start:.2f}s")
+    async_api.close()
+
 if __name__ == "__main__":
     check_feed_and_latency()
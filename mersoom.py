@@ -5,129 +5,572 @@ AI 에이전트들을 위한 익명 소셜 네트워크 - 사람도 사용 가
 """
 
 import hashlib
+import multiprocessing
+import os
+import queue
 import requests
 import time
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from modules import fastjson
+from modules.cassette import RecordingTransport, ReplayTransport
+from modules.latency import LatencyRouter
+from modules.metrics import Metrics
+from modules.models import Comment, Post
+from modules.pow_daemon import PowDaemonClient
+from modules.pow_estimator import PowEstimator
+from modules.proof_pipeline import ProofPipeline
+from modules.rate_limiter import RateLimiter
+from modules.single_flight import SingleFlight
+from modules.store import PostStore
+from modules.transport import HttpTransport
+
+
+# 시간 제한/중단 신호 확인 주기 (midstate 백엔드, 시도 횟수 단위)
+POW_CHECK_INTERVAL = 4096
+
+HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _scan_naive(seed: str, target_prefix: str, start: int, step: int,
+                deadline: float, stop_event=None) -> Tuple[Optional[int], int]:
+    """
+    기존 방식 탐색: 매 시도마다 문자열 생성 + 전체 해싱 + hexdigest 비교
+    
+    Returns:
+        (찾은 nonce 또는 None, 시도 횟수)
+    """
+    nonce = start
+    attempts = 0
+    while True:
+        # 시간 제한 체크
+        if time.time() > deadline:
+            return None, attempts
+        if stop_event is not None and attempts % 1024 == 0 and stop_event.is_set():
+            return None, attempts
+        
+        # seed + nonce를 SHA-256 해싱
+        test_string = f"{seed}{nonce}"
+        hash_result = hashlib.sha256(test_string.encode()).hexdigest()
+        attempts += 1
+        
+        # 타겟 prefix와 일치하는지 확인
+        if hash_result.startswith(target_prefix):
+            return nonce, attempts
+        
+        nonce += step
+
+
+def _scan_midstate(seed: str, target_prefix: str, start: int, step: int,
+                   deadline: float, stop_event=None) -> Tuple[Optional[int], int]:
+    """
+    midstate 재사용 탐색
+    
+    seed를 hashlib 컨텍스트에 한 번만 흡수해두고 nonce마다 .copy()해서 이어 해싱함.
+    hex 변환 없이 digest 바이트(홀수 길이면 마지막 니블)를 미리 계산한 타겟과 비교하고,
+    시계는 POW_CHECK_INTERVAL번마다 한 번만 확인함
+    """
+    prefix = target_prefix.lower()
+    if not set(prefix) <= HEX_DIGITS:
+        # hex가 아닌 prefix는 바이트 비교가 불가능하므로 기존 방식으로 처리
+        return _scan_naive(seed, target_prefix, start, step, deadline, stop_event)
+    
+    full_len = len(prefix) // 2
+    target_bytes = bytes.fromhex(prefix[:full_len * 2])
+    target_nibble = int(prefix[-1], 16) if len(prefix) % 2 else -1
+    
+    copy = hashlib.sha256(seed.encode()).copy
+    nonce = start
+    attempts = 0
+    while True:
+        for _ in range(POW_CHECK_INTERVAL):
+            h = copy()
+            h.update(b"%d" % nonce)
+            digest = h.digest()
+            if digest.startswith(target_bytes) and (
+                    target_nibble < 0 or digest[full_len] >> 4 == target_nibble):
+                return nonce, attempts + _ + 1
+            nonce += step
+        attempts += POW_CHECK_INTERVAL
+        if time.time() > deadline:
+            return None, attempts
+        if stop_event is not None and stop_event.is_set():
+            return None, attempts
+
+
+# 선택 가능한 해싱 백엔드
+POW_BACKENDS = {
+    "naive": _scan_naive,
+    "midstate": _scan_midstate,
+}
+DEFAULT_POW_BACKEND = "midstate"
+
+
+def _pow_worker(backend: str, seed: str, target_prefix: str, start: int, step: int,
+                deadline: float, stop_event, result_queue) -> None:
+    """병렬 솔버 워커: start부터 step 간격으로 nonce 탐색"""
+    nonce, attempts = POW_BACKENDS[backend](seed, target_prefix, start, step, deadline, stop_event)
+    if nonce is not None:
+        stop_event.set()
+    result_queue.put((nonce, attempts))
 
 
 class MersoomPoW:
     """Proof of Work 챌린지 솔버"""
     
     @staticmethod
-    def solve_challenge(seed: str, target_prefix: str, limit_ms: int = 2000) -> Optional[str]:
+    def solve(seed: str, target_prefix: str, limit_ms: int = 2000, workers: int = 1,
+              backend: str = DEFAULT_POW_BACKEND) -> Dict[str, Any]:
         """
-        PoW 챌린지 해결
+        PoW 챌린지 해결 (통계 포함)
         
         Args:
             seed: 서버에서 제공한 seed 문자열
             target_prefix: 찾아야 할 해시 prefix (예: "0000")
             limit_ms: 제한 시간 (밀리초)
+            workers: 병렬 프로세스 수 (1이면 단일 스레드, 0이면 CPU 코어 수)
+            backend: 해싱 백엔드 이름 (POW_BACKENDS 참고)
             
         Returns:
-            성공시 nonce, 실패시 None
+            {"nonce": 성공시 nonce 문자열/실패시 None, "attempts": 시도 횟수,
+             "elapsed_ms": 소요시간, "workers": 워커 수, "backend": 백엔드}
         """
-        start_time = time.time()
-        limit_sec = limit_ms / 1000
-        nonce = 0
+        if backend not in POW_BACKENDS:
+            raise ValueError(f"알 수 없는 PoW 백엔드: {backend} (가능: {', '.join(POW_BACKENDS)})")
+        if workers == 0:
+            workers = os.cpu_count() or 1
         
-        print(f"[PoW] 챌린지 해결 중... (target: {target_prefix})")
+        print(f"[PoW] 챌린지 해결 중... (target: {target_prefix}, backend: {backend}, workers: {workers})")
         
-        while True:
-            # 시간 제한 체크
-            if time.time() - start_time > limit_sec:
-                print(f"[PoW] 시간 초과! ({limit_ms}ms)")
-                return None
-            
-            # seed + nonce를 SHA-256 해싱
-            test_string = f"{seed}{nonce}"
-            hash_result = hashlib.sha256(test_string.encode()).hexdigest()
-            
-            # 타겟 prefix와 일치하는지 확인
-            if hash_result.startswith(target_prefix):
-                elapsed = (time.time() - start_time) * 1000
-                print(f"[PoW] 해결 완료! nonce={nonce}, 소요시간={elapsed:.2f}ms")
-                print(f"[PoW] 해시: {hash_result}")
-                return str(nonce)
-            
-            nonce += 1
-            
-            # 진행상황 표시 (매 10만번마다)
-            if nonce % 100000 == 0:
-                elapsed = (time.time() - start_time) * 1000
-                print(f"[PoW] 시도 중... {nonce:,} attempts ({elapsed:.0f}ms)")
+        start_time = time.time()
+        deadline = start_time + limit_ms / 1000
+        if workers > 1:
+            nonce, attempts = MersoomPoW._solve_parallel(
+                backend, seed, target_prefix, deadline, workers)
+        else:
+            nonce, attempts = POW_BACKENDS[backend](seed, target_prefix, 0, 1, deadline)
+        elapsed = (time.time() - start_time) * 1000
+        
+        if nonce is None:
+            print(f"[PoW] 시간 초과! ({limit_ms}ms, {attempts:,} attempts)")
+        else:
+            print(f"[PoW] 해결 완료! nonce={nonce}, 소요시간={elapsed:.2f}ms")
+        
+        return {
+            "nonce": None if nonce is None else str(nonce),
+            "attempts": attempts,
+            "elapsed_ms": elapsed,
+            "workers": workers,
+            "backend": backend,
+        }
+    
+    @staticmethod
+    def solve_challenge(seed: str, target_prefix: str, limit_ms: int = 2000,
+                        workers: int = 1, backend: str = DEFAULT_POW_BACKEND) -> Optional[str]:
+        """
+        PoW 챌린지 해결
+        
+        Returns:
+            성공시 nonce, 실패시 None
+        """
+        return MersoomPoW.solve(seed, target_prefix, limit_ms, workers, backend)["nonce"]
+
+    @staticmethod
+    def solve_challenge_parallel(seed: str, target_prefix: str, limit_ms: int = 2000,
+                                 workers: Optional[int] = None,
+                                 backend: str = DEFAULT_POW_BACKEND) -> Optional[str]:
+        """PoW 챌린지 병렬 해결 (프로세스 풀)"""
+        return MersoomPoW.solve_challenge(
+            seed, target_prefix, limit_ms, workers or os.cpu_count() or 1, backend)
+
+    @staticmethod
+    def _solve_parallel(backend: str, seed: str, target_prefix: str, deadline: float,
+                        workers: int) -> Tuple[Optional[int], int]:
+        """
+        nonce 공간을 워커 수만큼 건너뛰며 나눠 탐색하고,
+        가장 먼저 찾은 nonce를 반환한 뒤 나머지 워커는 즉시 중단시킴
+        """
+        ctx = multiprocessing.get_context()
+        stop_event = ctx.Event()
+        result_queue = ctx.Queue()
+        processes = [
+            ctx.Process(
+                target=_pow_worker,
+                args=(backend, seed, target_prefix, i, workers, deadline, stop_event, result_queue),
+                daemon=True
+            )
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        
+        found = None
+        attempts = 0
+        reported = 0
+        try:
+            while reported < workers:
+                # 워커가 모두 시간 초과로 끝날 때까지 여유 시간을 조금 더 줌
+                timeout = max(deadline - time.time(), 0) + 0.1
+                nonce, worker_attempts = result_queue.get(timeout=timeout)
+                reported += 1
+                attempts += worker_attempts
+                if nonce is not None and found is None:
+                    found = nonce
+                    stop_event.set()
+        except queue.Empty:
+            pass
+        finally:
+            stop_event.set()
+            for process in processes:
+                process.join(timeout=0.1)
+                if process.is_alive():
+                    process.terminate()
+            result_queue.close()
+        
+        return found, attempts
 
 
 class MersoomAPI:
     """Mersoom API 클라이언트"""
     
     BASE_URL = "https://www.mersoom.com/api"
+    # 서버가 expires_at을 주지 않을 때 쓰는 토큰 유효 시간 (초, limit_ms는 풀이 제한시간이지 토큰 수명이 아님)
+    DEFAULT_TOKEN_TTL = 30.0
+    # 다시 보내도 결과가 같은 투표 거절 응답 (잘못된 요청, 없는 글, 이미 투표함)
+    FINAL_VOTE_REJECTIONS = (400, 404, 409, 422)
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, pow_workers: Optional[int] = None,
+                 pow_backend: str = DEFAULT_POW_BACKEND, proof_ttl: Optional[float] = None,
+                 pow_estimator: Optional[PowEstimator] = None, max_challenge_attempts: int = 3,
+                 pow_socket: Optional[str] = None, limiter: Optional[RateLimiter] = None,
+                 max_retries: int = 3, store: Optional[PostStore] = None,
+                 transport: Optional[HttpTransport] = None, base_url: Optional[str] = None,
+                 record: Optional[str] = None, replay: Optional[str] = None,
+                 coalesce_window: float = 1.0, metrics: Optional[Metrics] = None):
         self.api_key = api_key  # 향후 인증 기능 추가 시 사용
-        self.session = requests.Session()
+        # API 주소 (지정하지 않으면 MERSOOM_BASE_URL 환경변수, 둘 다 없으면 실서버)
+        self.BASE_URL = (base_url or os.environ.get('MERSOOM_BASE_URL') or self.BASE_URL).rstrip('/')
+        # max_retries: 429/5xx/연결 오류 시 읽기 요청 재시도 횟수
+        self.transport = transport or HttpTransport(limiter=limiter, max_retries=max_retries)
+        # 녹화/재생 모드 (지정하지 않으면 MERSOOM_RECORD / MERSOOM_REPLAY 환경변수)
+        replay = replay or os.environ.get('MERSOOM_REPLAY')
+        record = record or os.environ.get('MERSOOM_RECORD')
+        if replay:
+            print(f"[재생] {replay} 카세트로 응답 재생 (네트워크 사용 안 함)")
+            self.transport = ReplayTransport(replay)
+        elif record:
+            print(f"[녹화] 모든 요청/응답을 {record}에 기록")
+            self.transport = RecordingTransport(self.transport, record)
+        self.session = self.transport.session
+        self.limiter = self.transport.limiter
+        self.store = store  # 게시글/댓글 로컬 저장소 (None이면 캐시 안 함)
+        # 동시에 들어온 같은 피드/댓글 요청은 하나로 합치고, 끝난 뒤 coalesce_window초 동안 결과 재사용
+        self.single_flight = SingleFlight(coalesce_window)
+        # 응답 시간/PoW/바이트 계측 (지정하지 않으면 MERSOOM_METRICS=1 일 때만 기록)
+        self.metrics = metrics or Metrics.from_env()
+        # 댓글은 /posts/{id}/comments 와 /posts/{id}(글 + 댓글) 둘 다로 받을 수 있으니 더 빠른 쪽 사용
+        self.comments_router = LatencyRouter(['comments', 'post_detail'])
         self.pow_solver = MersoomPoW()
-        
+        # None이면 난이도 추정기가 결정, 0이면 CPU 코어 수만큼 병렬 해결
+        self.pow_workers = pow_workers
+        self.pow_backend = pow_backend
+        self.pow_estimator = pow_estimator or PowEstimator(POW_BACKENDS)
+        self.max_challenge_attempts = max_challenge_attempts
+        # PoW 오프로드 데몬 소켓 (지정하지 않으면 MERSOOM_POW_SOCKET 환경변수, 둘 다 없으면 직접 해결)
+        pow_socket = pow_socket or os.environ.get('MERSOOM_POW_SOCKET')
+        self.pow_daemon = PowDaemonClient(pow_socket) if pow_socket else None
+        # 미리 풀어둔 proof의 유효 시간 (초, 서버가 expires_at을 주지 않을 때 기준, 기본 DEFAULT_TOKEN_TTL)
+        self.proof_ttl = proof_ttl if proof_ttl is not None else self.DEFAULT_TOKEN_TTL
+        self.proof_pipeline = ProofPipeline(self._solve_fresh_proof)
+        
+    def _request(self, method: str, endpoint: str, path: str, **kwargs) -> requests.Response:
+        """모든 HTTP 요청의 공통 경로 (전송 계층: 타임아웃, 재시도, 속도 제한, 서킷 브레이커)"""
+        if not self.metrics.enabled:
+            return self.transport.request(method, endpoint, f"{self.BASE_URL}{path}", **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = self.transport.request(method, endpoint, f"{self.BASE_URL}{path}", **kwargs)
+        except Exception as e:
+            self.metrics.observe('http_request_ms', (time.perf_counter() - start) * 1000,
+                                 endpoint=endpoint, status=type(e).__name__)
+            raise
+        # 재시도/속도 제한 대기까지 포함한, 호출한 쪽이 체감하는 응답 시간
+        self.metrics.observe('http_request_ms', (time.perf_counter() - start) * 1000,
+                             endpoint=endpoint, status=response.status_code)
+        self.metrics.inc('http_response_bytes_total', len(response.content), endpoint=endpoint)
+        request = getattr(response, 'request', None)
+        if request is not None and request.body:
+            self.metrics.inc('http_request_bytes_total', len(request.body), endpoint=endpoint)
+        return response
+    
     def _request_challenge(self) -> Optional[Dict[str, Any]]:
         """챌린지 요청"""
         try:
-            response = self.session.post(f"{self.BASE_URL}/challenge")
+            response = self._request('POST', 'challenge', '/challenge')
             response.raise_for_status()
             return response.json()
         except Exception as e:
             print(f"[ERROR] 챌린지 요청 실패: {e}")
             return None
     
+    def _solve_fresh_proof(self) -> Optional[Dict[str, Any]]:
+        """챌린지를 새로 받아서 풀고 token, nonce, 만료 시각 반환"""
+        for attempt in range(1, self.max_challenge_attempts + 1):
+            issued_at = time.time()
+            response_data = self._request_challenge()
+            if not response_data:
+                return None
+            
+            # API 응답: {"challenge": {...}, "token": "..."}
+            challenge = response_data.get('challenge', {})
+            token = response_data.get('token', '')
+            target_prefix = challenge['target_prefix']
+            limit_ms = challenge['limit_ms']
+            
+            print(f"\n[챌린지 정보]")
+            print(f"  ID: {challenge.get('challenge_id')}")
+            print(f"  알고리즘: sha256")
+            print(f"  타겟: {target_prefix}")
+            print(f"  제한시간: {limit_ms}ms\n")
+            
+            # 난이도 추정: 워커 수 결정 또는 가망 없으면 즉시 포기
+            workers = self.pow_workers
+            if self.pow_estimator:
+                plan = self.pow_estimator.plan(target_prefix, limit_ms, self.pow_backend)
+                print(f"[PoW] 예상 소요 {plan['expected_ms']:.0f}ms, "
+                      f"성공 확률 {plan['success_prob']:.0%} (workers: {plan['workers']})")
+                if not plan['feasible'] and attempt < self.max_challenge_attempts:
+                    print(f"[PoW] 제한시간 안에 풀 가망 없음 -> 챌린지 재요청 ({attempt}/{self.max_challenge_attempts})")
+                    continue
+                if workers is None:
+                    workers = plan['workers']
+            
+            # PoW 챌린지 해결 (데몬이 있으면 위임, 연결 실패시 직접 해결)
+            result = None
+            source = 'daemon'
+            if self.pow_daemon:
+                result = self.pow_daemon.solve(
+                    challenge['seed'], target_prefix, limit_ms, self.pow_backend)
+            if result is None:
+                source = 'local'
+                result = self.pow_solver.solve(
+                    seed=challenge['seed'],
+                    target_prefix=target_prefix,
+                    limit_ms=limit_ms,
+                    workers=workers or 1,
+                    backend=self.pow_backend
+                )
+            outcome = 'solved' if result['nonce'] is not None else 'timeout'
+            self.metrics.observe('pow_solve_ms', result['elapsed_ms'], backend=self.pow_backend,
+                                 source=source, outcome=outcome)
+            self.metrics.observe('pow_attempts', result['attempts'], scale=1, backend=self.pow_backend,
+                                 difficulty=len(target_prefix))
+            if self.pow_estimator:
+                self.pow_estimator.record(
+                    target_prefix, self.pow_backend, result['workers'],
+                    result['attempts'], result['elapsed_ms'], result['nonce'] is not None)
+            
+            if not result['nonce']:
+                return None
+            
+            return {
+                "token": token,
+                "nonce": result['nonce'],
+                "expires_at": self._proof_expires_at(challenge, issued_at)
+            }
+        return None
+    
+    def _proof_expires_at(self, challenge: Dict[str, Any], issued_at: float) -> float:
+        """토큰 만료 시각 계산 (서버가 알려준 값이 아직 안 지났으면 그 값, 아니면 받은 시각 + proof_ttl)"""
+        expires_at = challenge.get('expires_at')
+        if isinstance(expires_at, (int, float)):
+            # 밀리초 단위 epoch도 허용
+            expires_at = expires_at / 1000 if expires_at > 1e12 else float(expires_at)
+            # 이미 지난 값(녹화 재생, 서버와 시계가 어긋난 경우)은 믿지 않음
+            if expires_at > issued_at:
+                return expires_at
+        return issued_at + self.proof_ttl
+    
+    def prefetch_proof(self) -> None:
+        """다음 쓰기 요청에 쓸 PoW를 백그라운드에서 미리 풀기 시작"""
+        self.proof_pipeline.prefetch()
+    
     def _solve_and_get_proof(self) -> Optional[tuple[str, str]]:
-        """챌린지를 풀고 token과 proof 반환"""
-        response_data = self._request_challenge()
-        if not response_data:
-            return None
-        
-        # API 응답: {"challenge": {...}, "token": "..."}
-        challenge = response_data.get('challenge', {})
-        token = response_data.get('token', '')
-        
-        print(f"\n[챌린지 정보]")
-        print(f"  ID: {challenge.get('challenge_id')}")
-        print(f"  알고리즘: sha256")
-        print(f"  타겟: {challenge.get('target_prefix')}")
-        print(f"  제한시간: {challenge.get('limit_ms')}ms\n")
-        
-        # PoW 챌린지 해결
-        nonce = self.pow_solver.solve_challenge(
-            seed=challenge['seed'],
-            target_prefix=challenge['target_prefix'],
-            limit_ms=challenge['limit_ms']
-        )
-        
-        if not nonce:
+        """챌린지를 풀고 token과 proof 반환 (미리 풀어둔 proof가 있으면 우선 사용)"""
+        start = time.perf_counter()
+        proof = self.proof_pipeline.take()
+        if proof:
+            print("[PoW] 미리 풀어둔 proof 사용")
+            self.metrics.observe('proof_wait_ms', (time.perf_counter() - start) * 1000, source='pipeline')
+            return proof
+        
+        proof_data = self._solve_fresh_proof()
+        if not proof_data:
             return None
-        
-        return token, nonce
+        # 쓰기 요청이 proof 때문에 기다린 시간 (챌린지 요청 + PoW)
+        self.metrics.observe('proof_wait_ms', (time.perf_counter() - start) * 1000, source='fresh')
+        return proof_data['token'], proof_data['nonce']
     
     def get_feed(self, limit: int = 10) -> Optional[list]:
-        """피드 가져오기 (챌린지 불필요)"""
+        """피드 가져오기 (챌린지 불필요, Post 목록)"""
+        page = self.get_feed_page(limit)
+        return page[0] if page else None
+
+    def get_feed_page(self, limit: int = 20, cursor: Optional[str] = None) -> Optional[Tuple[list, Optional[str]]]:
+        """
+        피드 한 페이지 가져오기
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (없으면 최신 글부터)
+
+        Returns:
+            (Post 목록, 다음 페이지 커서 또는 None), 실패 시 None
+        """
         try:
-            response = self.session.get(f"{self.BASE_URL}/posts", params={"limit": limit})
-            response.raise_for_status()
-            data = response.json()
-            # API가 {"posts": [...], "system_message": "..."} 형태로 응답
-            return data.get('posts', [])
+            posts, next_cursor = self.single_flight.do(
+                ('feed', limit, cursor), lambda: self._fetch_feed_page(limit, cursor))
+            # 합쳐진 요청끼리 리스트는 따로 가짐 (Post 레코드는 공유)
+            return list(posts), next_cursor
         except Exception as e:
             print(f"[ERROR] 피드 가져오기 실패: {e}")
             return None
 
-    def get_comments(self, post_id: str) -> Optional[list]:
-        """댓글 가져오기"""
+    def _fetch_feed_page(self, limit: int, cursor: Optional[str]) -> Tuple[list, Optional[str]]:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = self._request('GET', 'feed', '/posts', params=params)
+        response.raise_for_status()
+        data = fastjson.decode_response(response)
+        # API가 {"posts": [...], "system_message": "..."} 형태로 응답
+        raw_posts = data.get('posts', [])
+        if self.store:
+            self.store.save_posts(raw_posts)
+        posts = Post.from_json_list(raw_posts)
+        # next_cursor를 안 주는 서버면 꽉 찬 페이지의 마지막 글 ID를 커서로 사용
+        next_cursor = data.get('next_cursor')
+        if next_cursor is None and posts and len(posts) >= limit:
+            next_cursor = posts[-1].id
+        return posts, next_cursor
+
+    def iter_feed(self, page_size: int = 50, cursor: Optional[str] = None):
+        """
+        피드 전체를 최신 글부터 한 페이지씩 받아서 글 단위로 yield (지연 페이지네이션)
+
+        필요한 만큼만 꺼내면 그 이후 페이지는 요청하지 않음 (itertools.islice 등과 함께 사용)
+        서버가 커서를 무시해서 같은 글만 돌려주면 거기서 멈춤
+        """
+        previous_ids = set()
+        while True:
+            page = self.get_feed_page(page_size, cursor)
+            if not page:
+                return
+            posts, cursor = page
+            page_ids = {post.get('id') for post in posts}
+            if not posts or page_ids <= previous_ids:
+                return
+            for post in posts:
+                if post.get('id') not in previous_ids:
+                    yield post
+            previous_ids = page_ids
+            if not cursor:
+                return
+
+    def get_comments(self, post_id: str, fresh: bool = False, raise_errors: bool = False) -> Optional[list]:
+        """
+        댓글 가져오기 (Comment 목록, 저장소가 있으면 최근 피드의 comment_count가 그대로인 글은 캐시 사용)
+
+        fresh=True면 캐시를 건너뛰고 서버에서 새로 받음
+        실패하면 빈 목록 (raise_errors=True면 예외를 그대로 던짐, 댓글이 없는 것과 구분해야 할 때)
+        """
+        if fresh:
+            self.single_flight.forget('comments', post_id)
+            self.single_flight.forget('detail', post_id)
+        elif self.store:
+            cached = self.store.cached_comments(post_id)
+            if cached is not None:
+                return Comment.from_json_list(cached)
         try:
-            response = self.session.get(f"{self.BASE_URL}/posts/{post_id}/comments")
-            response.raise_for_status()
-            data = response.json()
-            return data.get('comments', [])
+            if self.comments_router.choose() == 'post_detail':
+                try:
+                    post = self.single_flight.do(('detail', post_id), lambda: self._fetch_post_detail(post_id))
+                    return list(post.comments)
+                except Exception as e:
+                    print(f"[대기] 글 상세로 댓글 가져오기 실패 ({post_id}): {e} -> 댓글 목록으로 재시도")
+            return list(self.single_flight.do(('comments', post_id), lambda: self._fetch_comments(post_id)))
         except Exception as e:
             print(f"[ERROR] 댓글 가져오기 실패 ({post_id}): {e}")
+            if raise_errors:
+                raise
             return []
+
+    def _fetch_comments(self, post_id: str) -> list:
+        start = time.perf_counter()
+        try:
+            response = self._request('GET', 'comments', f"/posts/{post_id}/comments")
+            response.raise_for_status()
+            data = fastjson.decode_response(response)
+        except Exception:
+            self.comments_router.record_failure('comments')
+            raise
+        self.comments_router.record('comments', self._network_ms(response, start))
+        comments = data.get('comments', [])
+        if self.store:
+            self.store.save_comments(post_id, comments)
+        return Comment.from_json_list(comments)
+
+    @staticmethod
+    def _network_ms(response: requests.Response, start: float) -> float:
+        """응답 시간 (속도 제한 대기를 빼고 서버 응답까지 걸린 시간, 모르면 전체 소요 시간)"""
+        elapsed = response.elapsed.total_seconds() * 1000 if response.elapsed else 0.0
+        return elapsed or (time.perf_counter() - start) * 1000
+
+    def get_post_detail(self, post_id: str, fresh: bool = False) -> Optional[Post]:
+        """
+        글 본문 + 댓글을 한 번에 가져오기 (댓글이 붙은 Post, 실패 시 None)
+
+        /posts/{id} 한 번으로 받고 저장소의 글/댓글 캐시도 갱신함
+        /posts/{id}/comments 쪽이 더 빠르고 글 본문이 저장소에 있으면 그쪽 + 저장된 본문으로 조립
+        """
+        if fresh:
+            self.single_flight.forget('detail', post_id)
+        elif self.store and self.comments_router.best() == 'comments':
+            stored = self.store.get_post(post_id)
+            if stored is not None:
+                comments = self.get_comments(post_id)
+                post = Post.from_json(stored)
+                post.attach_comments(comments)
+                return post
+        try:
+            return self.single_flight.do(('detail', post_id), lambda: self._fetch_post_detail(post_id))
+        except Exception as e:
+            print(f"[ERROR] 글 가져오기 실패 ({post_id}): {e}")
+            return None
+
+    def _fetch_post_detail(self, post_id: str) -> Post:
+        start = time.perf_counter()
+        try:
+            response = self._request('GET', 'post_detail', f"/posts/{post_id}")
+            response.raise_for_status()
+            data = fastjson.decode_response(response)
+        except Exception:
+            self.comments_router.record_failure('post_detail')
+            raise
+        self.comments_router.record('post_detail', self._network_ms(response, start))
+        # {"post": {...}, "comments": [...]} 또는 글 필드 + "comments"
+        raw_post = dict(data.get('post') or data)
+        comments = raw_post.pop('comments', None)
+        if comments is None:
+            comments = data.get('comments') or []
+        if self.store:
+            self.store.save_posts([raw_post])
+            self.store.save_comments(post_id, comments)
+        post = Post.from_json(raw_post)
+        post.attach_comments(comments)
+        return post
     
     def create_post(self, nickname: str, title: str, content: str) -> bool:
         """새 글 작성"""
@@ -138,8 +581,8 @@ class MersoomAPI:
         token, nonce = proof_data
         
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/posts",
+            response = self._request(
+                'POST', 'post', "/posts",
                 headers={
                     "Content-Type": "application/json",
                     "X-Mersoom-Token": token,
@@ -152,6 +595,7 @@ class MersoomAPI:
                 }
             )
             response.raise_for_status()
+            self.single_flight.forget('feed')
             print(f"\n✅ 글 작성 성공!")
             return True
         except Exception as e:
@@ -176,8 +620,8 @@ class MersoomAPI:
             payload["parent_id"] = parent_id
         
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/posts/{post_id}/comments",
+            response = self._request(
+                'POST', 'comment', f"/posts/{post_id}/comments",
                 headers={
                     "Content-Type": "application/json",
                     "X-Mersoom-Token": token,
@@ -186,6 +630,10 @@ class MersoomAPI:
                 json=payload
             )
             response.raise_for_status()
+            self.single_flight.forget('comments', post_id)
+            self.single_flight.forget('detail', post_id)
+            if self.store:
+                self.store.invalidate_comments(post_id)
             comment_type = "답글" if parent_id else "댓글"
             print(f"\n✅ {comment_type} 작성 성공!")
             return True
@@ -197,19 +645,29 @@ class MersoomAPI:
     
     def vote(self, post_id: str, vote_type: str) -> bool:
         """투표하기 (up/down)"""
+        return self.vote_outcome(post_id, vote_type) == 'ok'
+
+    def vote_outcome(self, post_id: str, vote_type: str) -> str:
+        """
+        투표하고 결과 종류 반환
+
+        Returns:
+            'ok' (성공), 'rejected' (이미 투표함/없는 글 등 다시 해도 안 되는 거절),
+            'failed' (PoW 실패, 429, 5xx, 네트워크 오류 등 나중에 다시 해볼 만한 실패)
+        """
         if vote_type not in ['up', 'down']:
             print("[ERROR] 투표 타입은 'up' 또는 'down'이어야 합니다.")
-            return False
+            return 'rejected'
         
         proof_data = self._solve_and_get_proof()
         if not proof_data:
-            return False
+            return 'failed'
         
         token, nonce = proof_data
         
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/posts/{post_id}/vote",
+            response = self._request(
+                'POST', 'vote', f"/posts/{post_id}/vote",
                 headers={
                     "Content-Type": "application/json",
                     "X-Mersoom-Token": token,
@@ -220,20 +678,23 @@ class MersoomAPI:
             response.raise_for_status()
             emoji = "👍" if vote_type == "up" else "👎"
             print(f"\n✅ 투표 성공! {emoji}")
-            return True
+            return 'ok'
         except Exception as e:
             print(f"\n[ERROR] 투표 실패: {e}")
-            if hasattr(e, 'response') and e.response:
-                print(f"[ERROR] 응답: {e.response.text}")
-            return False
+            response = getattr(e, 'response', None)
+            if response is not None:
+                print(f"[ERROR] 응답: {response.text}")
+                if response.status_code in self.FINAL_VOTE_REJECTIONS:
+                    return 'rejected'
+            return 'failed'
 
     
     def get_arena_status(self) -> Optional[Dict]:
         """콜로세움 상태 확인"""
         try:
-            response = self.session.get(f"{self.BASE_URL}/arena/status")
+            response = self._request('GET', 'arena_status', '/arena/status')
             response.raise_for_status()
-            return response.json()
+            return fastjson.decode_response(response)
         except Exception as e:
             print(f"[ERROR] 아레나 상태 확인 실패: {e}")
             return None
@@ -241,9 +702,9 @@ class MersoomAPI:
     def get_arena_posts(self) -> Optional[list]:
         """콜로세움 토론글 목록"""
         try:
-            response = self.session.get(f"{self.BASE_URL}/arena/posts")
+            response = self._request('GET', 'arena_posts', '/arena/posts')
             response.raise_for_status()
-            return response.json().get('posts', [])
+            return fastjson.decode_response(response).get('posts', [])
         except Exception as e:
             print(f"[ERROR] 아레나 글 목록 실패: {e}")
             return None
@@ -255,8 +716,8 @@ class MersoomAPI:
         token, nonce = proof_data
         
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/arena/propose",
+            response = self._request(
+                'POST', 'arena_propose', "/arena/propose",
                 headers={
                     "Content-Type": "application/json",
                     "X-Mersoom-Token": token,
@@ -282,8 +743,8 @@ class MersoomAPI:
         token, nonce = proof_data
         
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/arena/fight",
+            response = self._request(
+                'POST', 'arena_fight', "/arena/fight",
                 headers={
                     "Content-Type": "application/json",
                     "X-Mersoom-Token": token,
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Mersoom 로컬 모의 서버
+실제 API 대신 오프라인으로 부하/지연 테스트를 할 수 있게 같은 엔드포인트를 흉내냄
+(/challenge는 실제 SHA-256 proof 검증, 지연/429 비율/난이도 조절 가능)
+
+실행:
+    python mock_server.py --port 8765 --latency-ms 80 --rate-429 0.05 --difficulty 4
+    MERSOOM_BASE_URL=http://127.0.0.1:8765/api python autonomous_agent.py --dry-run
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockState:
+    """모의 서버 데이터 (글, 댓글, 챌린지 토큰, 아레나, 통계)"""
+
+    ARENA_PHASES = ['propose', 'vote', 'fight']
+
+    def __init__(self, difficulty=4, limit_ms=2000, token_ttl=30.0, seed_posts=30,
+                 arena_phase_sec=600):
+        self.difficulty = difficulty
+        self.limit_ms = limit_ms
+        self.token_ttl = token_ttl
+        self.arena_phase_sec = arena_phase_sec
+        self.started_at = time.time()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.posts = []          # 최신 글이 앞
+        self.comments = {}       # post_id -> [comment]
+        self.tokens = {}         # token -> challenge
+        self.arena_posts = []
+        self.stats = {'requests': 0, 'throttled': 0, 'writes': 0, 'rejected_proofs': 0}
+        for i in range(seed_posts):
+            self.add_post(f"머슴{i % 7}", f"테스트 글 {i}번 AI 얘기임", f"모의 서버 본문 {i}번임. GPT 써봤는데 괜찮음",
+                          created_at=self.started_at - (seed_posts - i) * 60)
+
+    def _new_id(self):
+        return f"m{next(self.ids)}"
+
+    def add_post(self, nickname, title, content, created_at=None):
+        post = {
+            'id': self._new_id(),
+            'nickname': nickname,
+            'title': title,
+            'content': content,
+            'score': 0,
+            'views': 0,
+            'comment_count': 0,
+            'created_at': created_at or time.time(),
+        }
+        self.posts.insert(0, post)
+        self.comments[post['id']] = []
+        return post
+
+    def add_comment(self, post_id, nickname, content, parent_id=None):
+        comment = {
+            'id': self._new_id(),
+            'post_id': post_id,
+            'parent_id': parent_id,
+            'nickname': nickname,
+            'content': content,
+            'created_at': time.time(),
+        }
+        self.comments[post_id].append(comment)
+        self.find_post(post_id)['comment_count'] += 1
+        return comment
+
+    def find_post(self, post_id):
+        for post in self.posts:
+            if post['id'] == post_id:
+                return post
+        return None
+
+    def issue_challenge(self):
+        challenge = {
+            'challenge_id': uuid.uuid4().hex,
+            'algorithm': 'sha256',
+            'seed': uuid.uuid4().hex,
+            'target_prefix': '0' * self.difficulty,
+            'limit_ms': self.limit_ms,
+            'expires_at': time.time() + self.token_ttl,
+        }
+        token = uuid.uuid4().hex
+        self.tokens[token] = challenge
+        return {'challenge': challenge, 'token': token}
+
+    def verify_proof(self, token, nonce):
+        """토큰은 일회용, 만료 전이어야 하고 sha256(seed + nonce)가 target으로 시작해야 함"""
+        challenge = self.tokens.pop(token or '', None)
+        if challenge is None or nonce is None or time.time() > challenge['expires_at']:
+            return False
+        digest = hashlib.sha256(f"{challenge['seed']}{nonce}".encode()).hexdigest()
+        return digest.startswith(challenge['target_prefix'])
+
+    def arena_status(self):
+        elapsed = time.time() - self.started_at
+        index = int(elapsed // self.arena_phase_sec)
+        phase = self.ARENA_PHASES[index % len(self.ARENA_PHASES)]
+        ends_at = self.started_at + (index + 1) * self.arena_phase_sec
+        return {
+            'phase': phase,
+            'phase_number': self.ARENA_PHASES.index(phase) + 1,
+            'ends_at': ends_at,
+            'next_phase': self.ARENA_PHASES[(index + 1) % len(self.ARENA_PHASES)],
+            'server_time': time.time(),
+        }
+
+
+POST_PATH = re.compile(r'/api/posts/([^/]+)')
+COMMENTS_PATH = re.compile(r'/api/posts/([^/]+)/comments')
+VOTE_PATH = re.compile(r'/api/posts/([^/]+)/vote')
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Mersoom API 흉내 핸들러"""
+
+    server_version = 'MersoomMock/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ---- 공통 ----
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _throttle(self):
+        """지연 주입 + 확률적으로 429 응답 (처리했으면 True)"""
+        server = self.server
+        if server.latency_ms:
+            delay = random.gauss(server.latency_ms, server.jitter_ms) if server.jitter_ms else server.latency_ms
+            time.sleep(max(0.0, delay) / 1000)
+        with server.state.lock:
+            server.state.stats['requests'] += 1
+            throttled = random.random() < server.rate_429
+            if throttled:
+                server.state.stats['throttled'] += 1
+        if throttled:
+            self._send(429, {'error': 'Too Many Requests'}, {'Retry-After': str(server.retry_after)})
+        return throttled
+
+    def _check_proof(self, state):
+        if state.verify_proof(self.headers.get('X-Mersoom-Token'), self.headers.get('X-Mersoom-Proof')):
+            state.stats['writes'] += 1
+            return True
+        state.stats['rejected_proofs'] += 1
+        self._send(401, {'error': 'invalid proof'})
+        return False
+
+    # ---- 라우팅 ----
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        state = self.server.state
+        if url.path == '/api/_stats':
+            # 측정용 엔드포인트는 지연/429 없이 바로 응답
+            with state.lock:
+                self._send(200, dict(state.stats, posts=len(state.posts)))
+            return
+        if self._throttle():
+            return
+        comments_match = COMMENTS_PATH.fullmatch(url.path)
+        post_match = POST_PATH.fullmatch(url.path)
+        with state.lock:
+            if url.path == '/api/posts':
+                limit = int(query.get('limit', ['10'])[0])
+                # cursor = 이전 페이지 마지막 글 ID (그 다음 글부터)
+                cursor = query.get('cursor', [None])[0]
+                start = next((i + 1 for i, post in enumerate(state.posts) if post['id'] == cursor), 0)
+                page = state.posts[start:start + limit]
+                next_cursor = page[-1]['id'] if page and start + limit < len(state.posts) else None
+                self._send(200, {'posts': page, 'next_cursor': next_cursor, 'system_message': 'mock'})
+            elif url.path == '/api/arena/status':
+                self._send(200, state.arena_status())
+            elif url.path == '/api/arena/posts':
+                self._send(200, {'posts': state.arena_posts})
+            elif comments_match:
+                post_id = comments_match.group(1)
+                if state.find_post(post_id) is None:
+                    self._send(404, {'error': 'post not found'})
+                else:
+                    self._send(200, {'comments': state.comments[post_id]})
+            elif post_match:
+                post = state.find_post(post_match.group(1))
+                if post is None:
+                    self._send(404, {'error': 'post not found'})
+                else:
+                    post['views'] += 1
+                    self._send(200, dict(post, comments=state.comments[post['id']]))
+            else:
+                self._send(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self._throttle():
+            return
+        path = urlparse(self.path).path
+        body = self._body()
+        state = self.server.state
+        comments_match = COMMENTS_PATH.fullmatch(path)
+        vote_match = VOTE_PATH.fullmatch(path)
+        with state.lock:
+            if path == '/api/challenge':
+                self._send(200, state.issue_challenge())
+                return
+            if not self._check_proof(state):
+                return
+            if path == '/api/posts':
+                post = state.add_post(body.get('nickname', '익명'), body.get('title', ''), body.get('content', ''))
+                self._send(201, {'post': post})
+            elif comments_match:
+                post_id = comments_match.group(1)
+                if state.find_post(post_id) is None:
+                    self._send(404, {'error': 'post not found'})
+                    return
+                comment = state.add_comment(post_id, body.get('nickname', '익명'),
+                                            body.get('content', ''), body.get('parent_id'))
+                self._send(201, {'comment': comment})
+            elif vote_match:
+                post = state.find_post(vote_match.group(1))
+                if post is None:
+                    self._send(404, {'error': 'post not found'})
+                    return
+                post['score'] += 1 if body.get('type') == 'up' else -1
+                self._send(200, {'score': post['score']})
+            elif path == '/api/arena/propose':
+                arena_post = {'id': state._new_id(), 'title': body.get('title', ''),
+                              'content': body.get('content', ''), 'nickname': body.get('nickname', '익명'),
+                              'pro': 0, 'con': 0}
+                state.arena_posts.insert(0, arena_post)
+                self._send(201, {'post': arena_post})
+            elif path == '/api/arena/fight':
+                for arena_post in state.arena_posts:
+                    if arena_post['id'] == body.get('post_id') and body.get('side') in ('pro', 'con'):
+                        arena_post[body['side']] += 1
+                        self._send(200, {'post': arena_post})
+                        return
+                self._send(404, {'error': 'arena post not found'})
+            else:
+                self._send(404, {'error': 'not found'})
+
+
+class MockMersoomServer(ThreadingHTTPServer):
+    """모의 서버 본체"""
+
+    daemon_threads = True
+
+    def __init__(self, address, state, latency_ms=0.0, jitter_ms=0.0, rate_429=0.0,
+                 retry_after=1, verbose=False):
+        super().__init__(address, MockHandler)
+        self.state = state
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.verbose = verbose
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mersoom 로컬 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연 평균 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='응답 지연 표준편차 (ms)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='429 응답 확률 (0~1)')
+    parser.add_argument('--retry-after', type=int, default=1, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--difficulty', type=int, default=4, help='target prefix 길이 (hex 0 개수)')
+    parser.add_argument('--limit-ms', type=int, default=2000, help='챌린지 제한시간 (ms)')
+    parser.add_argument('--token-ttl', type=float, default=30.0, help='챌린지 토큰 유효시간 (초)')
+    parser.add_argument('--seed-posts', type=int, default=30, help='미리 만들어둘 글 수')
+    parser.add_argument('--arena-phase-sec', type=float, default=600, help='아레나 페이즈 길이 (초)')
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+
+    state = MockState(args.difficulty, args.limit_ms, args.token_ttl, args.seed_posts, args.arena_phase_sec)
+    server = MockMersoomServer((args.host, args.port), state, args.latency_ms, args.jitter_ms,
+                               args.rate_429, args.retry_after, args.verbose)
+    print(f"[모의 서버] {server.base_url} (difficulty={args.difficulty}, latency={args.latency_ms}ms, 429={args.rate_429:.0%})")
+    print(f"  MERSOOM_BASE_URL={server.base_url} 로 에이전트를 연결하세요")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[모의 서버] 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+머슴 행동 기록 인덱스
+이미 댓글을 달았거나 투표(개추/비추)한 글 ID를 기억해서 같은 글에 다시 요청/PoW를 쓰지 않게 함
+최근 기록은 크기 제한이 있는 정확한 집합으로, 그보다 오래된 기록은 블룸 필터로 O(1) 확인
+(블룸 필터는 두 세대로 돌려가며 써서 오래 켜둬도 오탐률이 일정하게 유지됨, 파일에 저장되므로 재시작해도 유지)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from modules.paths import data_path
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터"""
+
+    def __init__(self, bits=1 << 16, hashes=5, data=None):
+        """
+        Args:
+            bits: 비트 수
+            hashes: 키 하나당 켜는 비트 수
+            data: 저장해둔 비트 배열 (bytes)
+        """
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray(data) if data else bytearray(bits // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # 해시 하나를 두 조각으로 나눠 k개 위치를 만듦 (double hashing)
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.array[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class ActedIndex:
+    """행동한 글 ID 인덱스 (행동 종류 + 닉네임 + 글 ID 단위)"""
+
+    def __init__(self, path=None, exact_size=2000, bloom_bits=1 << 16, bloom_hashes=5,
+                 generation_size=5000):
+        """
+        Args:
+            path: 저장 파일 (기본: ~/.mersoom/acted_index.json, False면 저장 안 함)
+            exact_size: 정확하게 기억할 최근 기록 수
+            bloom_bits: 블룸 필터 한 세대의 비트 수
+            bloom_hashes: 키 하나당 켜는 비트 수
+            generation_size: 한 세대에 넣을 최대 기록 수 (넘으면 새 세대로 교체, 오탐률 약 1% 기준)
+        """
+        self.path = data_path('acted_index.json') if path is None else path
+        self.exact_size = exact_size
+        self.bloom_bits = bloom_bits
+        self.bloom_hashes = bloom_hashes
+        self.generation_size = generation_size
+        self.recent = OrderedDict()
+        self.current = BloomFilter(bloom_bits, bloom_hashes)
+        self.previous = None
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(action, post_id, actor=None):
+        return f"{action}:{actor or ''}:{post_id}"
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            for key in state.get('recent', [])[-self.exact_size:]:
+                self.recent[key] = None
+            for name in ('current', 'previous'):
+                saved = state.get(name)
+                if not saved or saved.get('bits') != self.bloom_bits:
+                    continue
+                bloom = BloomFilter(self.bloom_bits, saved.get('hashes', self.bloom_hashes),
+                                    base64.b64decode(saved['data']))
+                bloom.count = saved.get('count', 0)
+                setattr(self, name, bloom)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] 행동 기록 인덱스 로드 실패: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        def dump(bloom):
+            if bloom is None:
+                return None
+            return {'bits': bloom.bits, 'hashes': bloom.hashes, 'count': bloom.count,
+                    'data': base64.b64encode(bytes(bloom.array)).decode('ascii')}
+        state = {'recent': list(self.recent), 'current': dump(self.current), 'previous': dump(self.previous)}
+        try:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARN] 행동 기록 인덱스 저장 실패: {e}")
+
+    def seen(self, action, post_id, actor=None):
+        """
+        이미 행동한 글인지 여부 (최근 기록은 정확, 오래된 기록은 블룸 필터라 드물게 오탐 가능)
+
+        Args:
+            action: 행동 종류 ('comment', 'vote')
+            post_id: 글 ID
+            actor: 행동한 닉네임 (페르소나별로 따로 기억할 때)
+        """
+        key = self._key(action, post_id, actor)
+        with self._lock:
+            if key in self.recent:
+                return True
+            return key in self.current or (self.previous is not None and key in self.previous)
+
+    def mark(self, action, post_id, actor=None):
+        """행동 기록 추가 (바로 파일에 저장)"""
+        key = self._key(action, post_id, actor)
+        with self._lock:
+            if key in self.recent:
+                return
+            self.recent[key] = None
+            if len(self.recent) > self.exact_size:
+                self.recent.popitem(last=False)
+            if self.current.count >= self.generation_size:
+                # 오래된 세대는 버리고 새 세대 시작 (직전 세대는 계속 조회)
+                self.previous = self.current
+                self.current = BloomFilter(self.bloom_bits, self.bloom_hashes)
+            self.current.add(key)
+            self._save()
+
+    def filter_new(self, action, posts, actor=None):
+        """아직 행동하지 않은 글만 (순서 유지)"""
+        return [post for post in posts if not self.seen(action, post.get('id'), actor)]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'recent': len(self.recent),
+                'bloom_current': self.current.count,
+                'bloom_previous': self.previous.count if self.previous is not None else 0,
+            }
@@ -94,12 +94,12 @@ class FeedAnalyzer:
         activity = len(posts)
         
         # 텍스트 통합
-        all_text = ' '.join([post.get('title', '') + ' ' + post.get('content', '') for post in posts])
+        all_text = ' '.join([self._post_text(post) for post in posts])
         
         # 의도 파악 (가장 최근 글 5개 기반으로 분위기 파악)
         intents = []
         for post in posts[:5]:
-            text = post.get('title', '') + ' ' + post.get('content', '')
+            text = self._post_text(post)
             intents.append(self.detect_intent(text))
         
         dominant_intent = Counter(intents).most_common(1)[0][0] if intents else 'general'
@@ -125,6 +125,14 @@ class FeedAnalyzer:
             'situation': self._infer_situation(activity, dominant_intent)
         }
 
+    @staticmethod
+    def _post_text(post):
+        """제목 + 내용 (Post 레코드면 캐시된 텍스트 사용, dict도 지원)"""
+        text = getattr(post, 'text', None)
+        if text is not None:
+            return text
+        return post.get('title', '') + ' ' + post.get('content', '')
+
     def _infer_situation(self, activity, intent):
         """상황 추론 (Rule-based Inference)"""
         if activity > 15:
@@ -0,0 +1,173 @@
+"""
+머슴 콜로세움(아레나) 페이즈 감시
+/arena/status를 주기적으로 찍어보는 대신 응답의 페이즈와 마감 시각을 읽고 다음 경계까지 잠들었다가 깨어남
+(페이즈가 바뀔 때만 토론글 목록을 받고, 발의/참전 페이즈 직전에는 PoW를 미리 풀어둠)
+"""
+
+import threading
+import time
+from datetime import datetime
+
+
+class ArenaWatcher:
+    """콜로세움 페이즈 상태 머신"""
+
+    PHASES = ['propose', 'vote', 'fight']
+    # 쓰기 요청(PoW 필요)이 있는 페이즈
+    PROOF_PHASES = ('propose', 'fight')
+
+    def __init__(self, api, on_phase=None, lead_time=3.0, boundary_grace=1.0,
+                 fallback_poll=300.0, max_sleep=900.0):
+        """
+        Args:
+            api: MersoomAPI 인스턴스
+            on_phase: 페이즈가 바뀔 때 호출할 함수 on_phase(phase, posts, info)
+            lead_time: 발의/참전 페이즈 시작 몇 초 전에 PoW를 미리 풀지 (api.proof_ttl 안에 맞춰 줄어들 수 있음)
+            boundary_grace: 경계 직후 서버가 페이즈를 넘기기까지 기다려줄 시간 (초)
+            fallback_poll: 응답에 마감 시각이 없을 때 상태를 다시 확인할 간격 (초)
+            max_sleep: 한 번에 잠드는 최대 시간 (초, 마감 시각이 바뀌는 경우 대비)
+        """
+        self.api = api
+        self.on_phase = on_phase
+        # 미리 푼 proof는 lead_time + boundary_grace 뒤에 쓰이므로 토큰 유효 시간의 절반 안에 들어오게 줄임
+        token_ttl = getattr(api, 'proof_ttl', None)
+        if token_ttl and lead_time + boundary_grace > token_ttl / 2:
+            lead_time = max(0.5, token_ttl / 2 - boundary_grace)
+        self.lead_time = lead_time
+        self.boundary_grace = boundary_grace
+        self.fallback_poll = fallback_poll
+        self.max_sleep = max_sleep
+        self.phase = None
+        self.info = None
+        self.posts = []
+        self.status_requests = 0
+        self._prefetched_for = None
+        self._stop = threading.Event()
+
+    # ---- 상태 응답 해석 ----
+
+    @staticmethod
+    def _to_epoch(value):
+        """epoch 초/밀리초 숫자나 ISO 8601 문자열을 epoch 초로 변환 (모르면 None)"""
+        if isinstance(value, (int, float)):
+            return value / 1000 if value > 1e12 else float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+            try:
+                text = value.replace('Z', '+00:00')
+                parsed = datetime.fromisoformat(text)
+                return parsed.timestamp()
+            except ValueError:
+                return None
+        return None
+
+    @classmethod
+    def parse_status(cls, status, now=None):
+        """
+        /arena/status 응답에서 페이즈와 (로컬 시계 기준) 마감 시각 추출
+
+        Returns:
+            {'phase', 'ends_at', 'next_phase'} (모르는 값은 None)
+        """
+        now = time.time() if now is None else now
+        status = status or {}
+
+        phase = status.get('phase') or status.get('current_phase')
+        if isinstance(phase, int) and 1 <= phase <= len(cls.PHASES):
+            phase = cls.PHASES[phase - 1]
+        elif phase is None and isinstance(status.get('phase_number'), int):
+            phase = cls.PHASES[(status['phase_number'] - 1) % len(cls.PHASES)]
+
+        ends_at = None
+        for key in ('ends_at', 'phase_ends_at', 'deadline', 'next_phase_at'):
+            ends_at = cls._to_epoch(status.get(key))
+            if ends_at is not None:
+                break
+        if ends_at is not None:
+            # 서버 시계가 어긋나 있으면 로컬 시계 기준으로 보정
+            server_time = cls._to_epoch(status.get('server_time'))
+            if server_time is not None:
+                ends_at -= server_time - now
+        else:
+            for key, unit in (('remaining_ms', 1000), ('remaining_seconds', 1), ('time_left', 1)):
+                if isinstance(status.get(key), (int, float)):
+                    ends_at = now + status[key] / unit
+                    break
+
+        next_phase = status.get('next_phase')
+        if next_phase is None and phase in cls.PHASES:
+            next_phase = cls.PHASES[(cls.PHASES.index(phase) + 1) % len(cls.PHASES)]
+
+        return {'phase': phase, 'ends_at': ends_at, 'next_phase': next_phase}
+
+    # ---- 상태 머신 ----
+
+    def step(self):
+        """
+        상태 한 번 확인 -> 페이즈가 바뀌었으면 토론글 받고 콜백 호출
+
+        Returns:
+            다음에 깨어날 때까지 잘 시간 (초)
+        """
+        status = self.api.get_arena_status()
+        self.status_requests += 1
+        if not status:
+            return self.fallback_poll
+
+        info = self.parse_status(status)
+        self.info = info
+        if info['phase'] != self.phase:
+            previous, self.phase = self.phase, info['phase']
+            print(f"[아레나] 페이즈 변경: {previous} -> {self.phase}")
+            self.posts = self.api.get_arena_posts() or []
+            if self.on_phase:
+                try:
+                    self.on_phase(self.phase, self.posts, info)
+                except Exception as e:
+                    print(f"[ERROR] 아레나 페이즈 처리 실패: {e}")
+        return self._next_sleep(info)
+
+    def _next_sleep(self, info):
+        if info['ends_at'] is None:
+            return self.fallback_poll
+        remaining = info['ends_at'] - time.time()
+        # 다음 페이즈가 발의/참전이면 시작 lead_time초 전에 한 번 깨어나서 PoW를 미리 풀어둠
+        if (info['next_phase'] in self.PROOF_PHASES and self._prefetched_for != info['ends_at']
+                and remaining > self.lead_time):
+            return min(self.max_sleep, remaining - self.lead_time)
+        return min(self.max_sleep, max(0.0, remaining) + self.boundary_grace)
+
+    def _maybe_prefetch(self):
+        """다음 발의/참전 페이즈 직전이면 PoW 미리 풀기 시작"""
+        info = self.info
+        if not info or info['ends_at'] is None or info['next_phase'] not in self.PROOF_PHASES:
+            return
+        if self._prefetched_for == info['ends_at']:
+            return
+        if info['ends_at'] - time.time() <= self.lead_time + 0.5:
+            print(f"[아레나] {info['next_phase']} 페이즈 직전 -> PoW 미리 풀기")
+            self._prefetched_for = info['ends_at']
+            self.api.prefetch_proof()
+
+    def run(self):
+        """stop()이 불릴 때까지 페이즈 경계마다 깨어나서 처리"""
+        sleep_for = self.step()
+        while not self._stop.wait(sleep_for):
+            self._maybe_prefetch()
+            # PoW 예약으로 깨어난 경우는 상태를 다시 묻지 않고 경계까지 더 잠
+            if self.info and self.info['ends_at'] is not None and self.info['ends_at'] > time.time():
+                sleep_for = self._next_sleep(self.info)
+                continue
+            sleep_for = self.step()
+
+    def start(self):
+        """백그라운드 스레드로 실행"""
+        thread = threading.Thread(target=self.run, name='arena-watcher', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
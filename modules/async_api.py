@@ -0,0 +1,102 @@
+"""
+머슴 asyncio API 클라이언트
+MersoomAPI와 같은 메서드를 코루틴으로 제공하고, 여러 글의 댓글을 동시에 가져오는 fan-out 지원
+(HTTP 호출은 동기 MersoomAPI를 스레드 풀에서 실행하므로 세션/캐시/PoW 설정을 그대로 공유함)
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from mersoom import MersoomAPI
+
+
+class AsyncMersoomAPI:
+    """Mersoom API asyncio 클라이언트"""
+
+    def __init__(self, api=None, concurrency=8):
+        """
+        Args:
+            api: 공유할 MersoomAPI 인스턴스 (없으면 새로 생성)
+            concurrency: 동시에 보낼 수 있는 최대 요청 수
+        """
+        self.api = api or MersoomAPI()
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='mersoom')
+        # 동시 요청 수만큼 keep-alive 연결을 유지하도록 풀 크기 조정
+        self.api.transport.resize_pool(concurrency)
+
+    async def _call(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, *args, **kwargs))
+
+    async def get_feed(self, limit=10):
+        """피드 가져오기"""
+        return await self._call(self.api.get_feed, limit)
+
+    async def get_comments(self, post_id):
+        """댓글 가져오기"""
+        return await self._call(self.api.get_comments, post_id)
+
+    async def get_post_detail(self, post_id):
+        """글 본문 + 댓글 가져오기"""
+        return await self._call(self.api.get_post_detail, post_id)
+
+    async def get_comments_many(self, post_ids, concurrency=None):
+        """
+        여러 글의 댓글을 동시에 가져오기 (최대 concurrency개씩)
+
+        Returns:
+            {post_id: 댓글 목록}
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def fetch(post_id):
+            async with semaphore:
+                return post_id, await self.get_comments(post_id)
+
+        results = await asyncio.gather(*(fetch(post_id) for post_id in post_ids))
+        return dict(results)
+
+    def prefetch_proof(self):
+        """다음 쓰기 요청에 쓸 PoW를 백그라운드에서 미리 풀기 시작"""
+        self.api.prefetch_proof()
+
+    async def create_post(self, nickname, title, content):
+        """새 글 작성"""
+        return await self._call(self.api.create_post, nickname, title, content)
+
+    async def create_comment(self, post_id, nickname, content, parent_id=None):
+        """댓글/답글 작성"""
+        return await self._call(self.api.create_comment, post_id, nickname, content, parent_id)
+
+    async def vote(self, post_id, vote_type):
+        """투표하기 (up/down)"""
+        return await self._call(self.api.vote, post_id, vote_type)
+
+    async def get_arena_status(self):
+        """콜로세움 상태 확인"""
+        return await self._call(self.api.get_arena_status)
+
+    async def get_arena_posts(self):
+        """콜로세움 토론글 목록"""
+        return await self._call(self.api.get_arena_posts)
+
+    async def propose_arena(self, nickname, title, content):
+        """콜로세움 주제 발의 (Phase 1)"""
+        return await self._call(self.api.propose_arena, nickname, title, content)
+
+    async def fight_arena(self, post_id, nickname, content, side):
+        """콜로세움 참전 (Phase 3)"""
+        return await self._call(self.api.fight_arena, post_id, nickname, content, side)
+
+    def close(self):
+        """스레드 풀 정리"""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,144 @@
+"""
+머슴 요청 녹화/재생 (카세트)
+실제 트래픽의 요청/응답 쌍(챌린지 포함)을 gzip JSON Lines 파일로 저장해두고,
+재생 모드에서는 네트워크 없이 그대로 돌려줘서 오프라인 벤치마크를 결정적으로 만듦
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from modules.rate_limiter import RateLimiter
+
+# 재생에 필요한 응답 헤더만 저장
+KEPT_HEADERS = ('Content-Type', 'Retry-After')
+
+
+def _request_key(method, url, params=None):
+    """요청 식별 키: 메서드 + 경로 + 쿼리 (호스트는 빼서 녹화/재생 서버가 달라도 맞춰짐)"""
+    parsed = urlparse(url)
+    query = parsed.query
+    if params:
+        extra = urlencode(sorted(params.items()))
+        query = f"{query}&{extra}" if query else extra
+    return f"{method} {parsed.path}?{query}" if query else f"{method} {parsed.path}"
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """재생할 녹화 응답이 없음"""
+
+
+class RecordingTransport:
+    """실제 전송 계층을 감싸서 모든 요청/응답을 카세트 파일에 추가 기록"""
+
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.path = path
+        self.session = transport.session
+        self.limiter = transport.limiter
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+
+    def resize_pool(self, pool_size):
+        self.transport.resize_pool(pool_size)
+
+    def request(self, method, endpoint, url, **kwargs):
+        start = time.perf_counter()
+        response = self.transport.request(method, endpoint, url, **kwargs)
+        entry = {
+            'key': _request_key(method, url, kwargs.get('params')),
+            'endpoint': endpoint,
+            'status': response.status_code,
+            'headers': {k: response.headers[k] for k in KEPT_HEADERS if k in response.headers},
+            'body': response.text,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+        return response
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+        self.transport.close()
+
+
+class ReplayTransport:
+    """카세트 파일의 응답을 네트워크 없이 재생하는 전송 계층"""
+
+    def __init__(self, path, replay_latency=False):
+        """
+        Args:
+            path: 카세트 파일 경로
+            replay_latency: True면 녹화 당시 응답 시간만큼 기다림 (기본: 지연 없음)
+        """
+        self.path = path
+        self.replay_latency = replay_latency
+        self.session = requests.Session()  # 실제로는 쓰지 않음 (MersoomAPI.session 호환용)
+        self.limiter = RateLimiter()       # 재생 중에는 속도 제한을 걸지 않음
+        self._lock = threading.Lock()
+        self._by_key = defaultdict(deque)
+        self._by_endpoint = defaultdict(deque)
+        self._last = {}
+        self._used = set()
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for index, line in enumerate(f):
+                if line.strip():
+                    entry = json.loads(line)
+                    entry['index'] = index
+                    self._by_key[entry['key']].append(entry)
+                    method = entry['key'].split(' ', 1)[0]
+                    if method != 'GET':
+                        self._by_endpoint[(method, entry['endpoint'])].append(entry)
+
+    def resize_pool(self, pool_size):
+        pass
+
+    def _next_entry(self, method, endpoint, key):
+        """
+        같은 요청(경로+쿼리)의 녹화를 순서대로 꺼내고, 쓰기 요청은 없으면 같은 엔드포인트의 녹화를 사용
+        (쓰기 요청은 글 ID/본문이 매번 달라서 엔드포인트 단위로 맞춤, 읽기 요청은 다른 글의 응답을 주면 안 되므로 정확히 맞춤)
+        다 쓴 읽기 요청은 같은 요청의 마지막 응답을 반복해서 돌려줌 (녹화가 아예 없으면 None)
+        """
+        with self._lock:
+            queues = [self._by_key.get(key)]
+            if method != 'GET':
+                queues.append(self._by_endpoint.get((method, endpoint)))
+            for queue in queues:
+                while queue:
+                    entry = queue.popleft()
+                    if entry['index'] in self._used:
+                        continue
+                    self._used.add(entry['index'])
+                    self._last[key] = entry
+                    return entry
+            if method == 'GET':
+                return self._last.get(key)
+            return None
+
+    def request(self, method, endpoint, url, **kwargs):
+        key = _request_key(method, url, kwargs.get('params'))
+        entry = self._next_entry(method, endpoint, key)
+        if entry is None:
+            raise CassetteMissError(f"카세트에 녹화된 응답 없음: {key}")
+        if self.replay_latency:
+            time.sleep(entry['elapsed_ms'] / 1000)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = url
+        response.reason = 'Replayed'
+        return response
+
+    def close(self):
+        self.session.close()
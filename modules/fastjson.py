@@ -0,0 +1,40 @@
+"""
+머슴 JSON 디코더
+orjson이 설치돼 있으면 큰 피드/댓글 응답을 orjson으로 디코딩하고, 없으면 표준 json 사용
+(MERSOOM_JSON=stdlib 으로 강제로 표준 json 사용 가능)
+"""
+
+import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+USE_ORJSON = ORJSON_AVAILABLE and os.environ.get('MERSOOM_JSON', '').lower() != 'stdlib'
+
+BACKEND = 'orjson' if USE_ORJSON else 'json'
+
+
+def loads(data):
+    """bytes/str JSON 디코딩"""
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_response(response):
+    """
+    requests 응답 본문을 JSON으로 디코딩 (response.json() 대체)
+
+    orjson은 UTF-8 bytes를 바로 받으므로 requests의 인코딩 추측/str 변환을 건너뜀
+    (UTF-8이 아닌 응답이거나 orjson이 실패하면 response.json()으로 처리)
+    """
+    if USE_ORJSON and (response.encoding or 'utf-8').lower().replace('_', '-') in ('utf-8', 'utf8'):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
@@ -0,0 +1,118 @@
+"""
+머슴 증분 피드 동기화
+마지막으로 본 최신 글(ID + 작성 시각)을 기억해두고, 다음 동기화 때는 그 이후에 올라온 글만 돌려줌
+(커서는 파일에 저장되므로 재시작해도 이어서 동기화)
+"""
+
+import json
+import os
+import threading
+
+from modules.paths import data_path
+
+
+class FeedSync:
+    """피드 증분 동기화"""
+
+    def __init__(self, api, state_path=None, page_size=20, max_pages=10):
+        """
+        Args:
+            api: MersoomAPI 인스턴스 (get_feed_page/iter_feed 사용)
+            state_path: 커서 저장 파일 (기본: ~/.mersoom/feed_sync.json, False면 저장 안 함)
+            page_size: 한 번에 요청할 글 수
+            max_pages: 한 번 동기화할 때 최대 페이지 수 (오래 쉬었다가 켜도 무한히 거슬러가지 않게)
+        """
+        self.api = api
+        self.state_path = data_path('feed_sync.json') if state_path is None else state_path
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.newest_id = None
+        self.newest_at = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.newest_id = state.get('newest_id')
+            self.newest_at = state.get('newest_at')
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 피드 동기화 커서 로드 실패: {e}")
+
+    def _save(self):
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump({'newest_id': self.newest_id, 'newest_at': self.newest_at}, f)
+        except OSError as e:
+            print(f"[WARN] 피드 동기화 커서 저장 실패: {e}")
+
+    def _is_seen(self, post):
+        """커서 이전(이미 본) 글인지 여부"""
+        if self.newest_id is not None and post.get('id') == self.newest_id:
+            return True
+        created_at = post.get('created_at')
+        if self.newest_at is None or created_at is None:
+            return False
+        try:
+            return created_at < self.newest_at
+        except TypeError:
+            return False
+
+    def iter_new(self):
+        """
+        커서 이후의 새 글을 최신 글부터 yield
+        (처음 동기화라면 첫 페이지만, 모두 꺼내면 커서를 가장 최신 글로 옮김)
+        """
+        first_sync = self.newest_id is None and self.newest_at is None
+        max_pages = 1 if first_sync else self.max_pages
+        newest = None
+        count = 0
+        for post in self.api.iter_feed(self.page_size):
+            if self._is_seen(post) or count >= max_pages * self.page_size:
+                break
+            if newest is None:
+                newest = post
+            count += 1
+            yield post
+        if newest is not None:
+            self.newest_id = newest.get('id')
+            self.newest_at = newest.get('created_at', self.newest_at)
+            self._save()
+
+    def poll(self):
+        """새 글 목록 (최신 글이 앞, 없으면 빈 리스트, 여러 스레드가 같이 불러도 새 글은 한 번만 돌려줌)"""
+        with self._lock:
+            return list(self.iter_new())
+
+    def take_new(self, posts):
+        """
+        이미 받아온 글 목록(최신 글이 앞)에서 커서 이후의 새 글만 골라내고 커서를 옮김 (추가 요청 없음)
+        """
+        with self._lock:
+            new_posts = []
+            for post in posts:
+                if self._is_seen(post):
+                    break
+                new_posts.append(post)
+            if new_posts:
+                self.newest_id = new_posts[0].get('id')
+                self.newest_at = new_posts[0].get('created_at', self.newest_at)
+                self._save()
+            return new_posts
+
+    def backfill(self, page_size=None):
+        """
+        전체 히스토리를 최신 글부터 한 페이지씩 지연 로딩하며 yield (커서는 건드리지 않음)
+        """
+        return self.api.iter_feed(page_size or self.page_size)
+
+    def reset(self):
+        """커서 초기화 (다음 동기화는 첫 동기화처럼 동작)"""
+        self.newest_id = None
+        self.newest_at = None
+        self._save()
@@ -0,0 +1,61 @@
+"""
+머슴 엔드포인트 선택기
+같은 데이터를 줄 수 있는 엔드포인트가 여러 개일 때 최근 응답 시간(EWMA)이 가장 짧은 쪽을 고름
+(측정값이 없는 엔드포인트는 먼저 한 번씩 써보고, 가끔 다른 쪽도 다시 재서 추정을 갱신함,
+실패한 요청은 벌점 응답 시간으로 반영해서 계속 실패하는 엔드포인트는 뒤로 밀림)
+"""
+
+import threading
+
+
+class LatencyRouter:
+    """응답 시간 기반 엔드포인트 선택"""
+
+    def __init__(self, choices, alpha=0.2, explore_every=20, failure_penalty_ms=10000.0):
+        """
+        Args:
+            choices: 후보 엔드포인트 이름 목록
+            alpha: EWMA 가중치 (클수록 최근 측정값을 크게 반영)
+            explore_every: 이 횟수마다 한 번은 느린 쪽도 다시 측정
+            failure_penalty_ms: 요청이 실패했을 때 응답 시간 대신 반영할 값 (ms)
+        """
+        self.choices = list(choices)
+        self.alpha = alpha
+        self.explore_every = explore_every
+        self.failure_penalty_ms = failure_penalty_ms
+        self.latency_ms = {choice: None for choice in self.choices}
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def choose(self):
+        """이번에 쓸 엔드포인트"""
+        with self._lock:
+            self._calls += 1
+            unmeasured = [c for c in self.choices if self.latency_ms[c] is None]
+            if unmeasured:
+                return unmeasured[0]
+            ranked = sorted(self.choices, key=lambda c: self.latency_ms[c])
+            if self.explore_every and self._calls % self.explore_every == 0 and len(ranked) > 1:
+                return ranked[1]
+            return ranked[0]
+
+    def record(self, choice, elapsed_ms):
+        """측정한 응답 시간 반영"""
+        with self._lock:
+            previous = self.latency_ms.get(choice)
+            if previous is None:
+                self.latency_ms[choice] = elapsed_ms
+            else:
+                self.latency_ms[choice] = (1 - self.alpha) * previous + self.alpha * elapsed_ms
+
+    def record_failure(self, choice):
+        """실패한 요청 반영 (벌점 응답 시간으로 기록해서 측정 안 된 상태로 남지 않게)"""
+        self.record(choice, self.failure_penalty_ms)
+
+    def best(self):
+        """지금 가장 빠른 엔드포인트 (측정값이 없으면 첫 후보)"""
+        with self._lock:
+            measured = [c for c in self.choices if self.latency_ms[c] is not None]
+            if not measured:
+                return self.choices[0]
+            return min(measured, key=lambda c: self.latency_ms[c])
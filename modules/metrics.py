@@ -0,0 +1,173 @@
+"""
+머슴 계측 (metrics)
+엔드포인트/상태 코드별 응답 시간, PoW 시도 횟수/소요 시간을 HDR 방식(로그-선형 버킷) 히스토그램으로,
+송수신 바이트는 카운터로 모아서 프로세스 안에서 읽거나 JSON / Prometheus 텍스트로 내보냄
+(비활성화 상태에서는 기록 함수가 바로 반환해서 부담이 거의 없음)
+"""
+
+import json
+import os
+import threading
+
+
+class Histogram:
+    """
+    HDR 방식 히스토그램
+
+    값을 정수(값 x scale)로 바꾼 뒤 상위 SUB_BITS 비트로 버킷을 나눠서
+    범위와 상관없이 상대 오차 약 1%로 분위수를 계산함 (버킷은 쓰인 것만 저장)
+    """
+
+    SUB_BITS = 7
+
+    def __init__(self, scale=1):
+        """
+        Args:
+            scale: 기록 단위 (예: ms 값을 소수점 3자리까지 구분하려면 1000)
+        """
+        self.scale = scale
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, n):
+        shift = max(0, n.bit_length() - self.SUB_BITS)
+        return (n >> shift) << shift, ((n >> shift) + 1) << shift
+
+    def record(self, value):
+        n = max(0, int(value * self.scale))
+        bucket = self._bucket(n)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, pct):
+        """pct 백분위수 (버킷 중간값, 실제 최소/최대값 범위로 제한)"""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for low, high in sorted(self.counts):
+            seen += self.counts[(low, high)]
+            if seen >= rank:
+                value = (low + high - 1) / 2 / self.scale
+                return round(min(max(value, self.min), self.max), 3)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'sum': round(self.total, 3),
+            'mean': round(self.total / self.count, 3) if self.count else None,
+            'min': self.min,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+            'max': self.max,
+        }
+
+
+class Metrics:
+    """히스토그램/카운터 모음"""
+
+    QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, enabled=True, prefix='mersoom'):
+        """
+        Args:
+            enabled: False면 아무것도 기록하지 않음
+            prefix: Prometheus 지표 이름 접두어
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._histograms = {}  # (이름, 라벨) -> Histogram
+        self._counters = {}    # (이름, 라벨) -> 값
+
+    @classmethod
+    def from_env(cls):
+        """MERSOOM_METRICS=1 이면 활성화"""
+        return cls(enabled=os.environ.get('MERSOOM_METRICS', '').lower() in ('1', 'true', 'yes'))
+
+    @staticmethod
+    def _key(name, labels):
+        # 라벨 값은 문자열로 통일 (상태 코드 숫자와 예외 이름이 섞여도 정렬 가능하게)
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def observe(self, name, value, scale=1000, **labels):
+        """히스토그램에 값 기록 (scale: 구분할 최소 단위의 역수)"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(scale)
+            histogram.record(value)
+
+    def inc(self, name, amount=1, **labels):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def histogram(self, name, **labels):
+        """기록된 히스토그램 (없으면 None)"""
+        return self._histograms.get(self._key(name, labels))
+
+    def counter(self, name, **labels):
+        return self._counters.get(self._key(name, labels), 0)
+
+    def snapshot(self):
+        """현재 값 전체 (JSON으로 바꿀 수 있는 dict)"""
+        with self._lock:
+            return {
+                'histograms': [dict(name=name, labels=dict(labels), **histogram.summary())
+                               for (name, labels), histogram in sorted(self._histograms.items())],
+                'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                             for (name, labels), value in sorted(self._counters.items())],
+            }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (히스토그램은 summary로 내보냄)"""
+        def fmt_labels(labels, **extra):
+            items = list(labels) + sorted(extra.items())
+            if not items:
+                return ''
+            return '{' + ','.join(f'{k}="{v}"' for k, v in items) + '}'
+
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} summary")
+                    typed.add(metric)
+                for q in self.QUANTILES:
+                    lines.append(f"{metric}{fmt_labels(labels, quantile=q)} {histogram.percentile(q * 100)}")
+                lines.append(f"{metric}_sum{fmt_labels(labels)} {round(histogram.total, 3)}")
+                lines.append(f"{metric}_count{fmt_labels(labels)} {histogram.count}")
+            for (name, labels), value in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} counter")
+                    typed.add(metric)
+                lines.append(f"{metric}{fmt_labels(labels)} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """파일로 저장 (.prom이면 Prometheus 텍스트, 나머지는 JSON)"""
+        text = self.to_prometheus() if path.endswith('.prom') else self.to_json() + '\n'
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
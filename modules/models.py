@@ -0,0 +1,159 @@
+"""
+머슴 게시글/댓글 모델
+API JSON을 __slots__ 기반 레코드로 바로 변환해서 글 하나당 메모리를 줄이고,
+분석용 파생 텍스트(댓글 합본, 제목+내용+댓글)는 처음 쓸 때 한 번만 만들어 캐시함
+(기존 dict 코드와 호환되도록 post.get('title', '') / post['id'] 형태의 읽기도 지원)
+"""
+
+import sys
+
+
+class _Record:
+    """dict처럼 읽을 수 있는 __slots__ 레코드 공통 부분"""
+
+    __slots__ = ('extra',)
+
+    FIELDS = ()
+    INTERNED = ()  # 같은 값이 자주 반복되는 필드 (닉네임 등)
+
+    @classmethod
+    def from_json(cls, data):
+        """API 응답 dict에서 생성 (모르는 필드는 extra에 보관)"""
+        record = cls.__new__(cls)
+        for field in cls.FIELDS:
+            value = data.get(field)
+            if field in cls.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(record, field, value)
+        extra = {k: v for k, v in data.items() if k not in cls.FIELDS}
+        record.extra = extra or None
+        record._reset()
+        return record
+
+    @classmethod
+    def from_json_list(cls, items):
+        return [item if isinstance(item, cls) else cls.from_json(item) for item in items or []]
+
+    def _reset(self):
+        pass
+
+    def get(self, key, default=None):
+        """dict.get 호환 (값이 없거나 None이면 default)"""
+        if key in self.FIELDS:
+            value = getattr(self, key)
+        elif self.extra:
+            value = self.extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def keys(self):
+        return self.as_dict().keys()
+
+    def as_dict(self):
+        """원래 JSON 형태의 dict (저장/녹화용)"""
+        data = {field: getattr(self, field) for field in self.FIELDS if getattr(self, field) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+class Comment(_Record):
+    """댓글"""
+
+    __slots__ = ('id', 'post_id', 'parent_id', 'nickname', 'content', 'created_at')
+
+    FIELDS = __slots__
+    INTERNED = ('nickname',)
+
+    @classmethod
+    def from_json(cls, data):
+        # 글 상세 응답에서 댓글이 문자열로만 오는 경우도 있음
+        if not isinstance(data, dict):
+            data = {'content': str(data)}
+        return super().from_json(data)
+
+    def _reset(self):
+        if self.content is None:
+            self.content = ''
+
+
+class Post(_Record):
+    """게시글"""
+
+    __slots__ = ('id', 'nickname', 'title', 'content', 'score', 'views', 'comment_count', 'created_at',
+                 '_comments', '_text', '_comments_text', '_full_text')
+
+    FIELDS = ('id', 'nickname', 'title', 'content', 'score', 'views', 'comment_count', 'created_at')
+    INTERNED = ('nickname',)
+
+    def _reset(self):
+        if self.title is None:
+            self.title = ''
+        if self.content is None:
+            self.content = ''
+        self._comments = None
+        self._text = None
+        self._comments_text = None
+        self._full_text = None
+
+    @property
+    def comments(self):
+        """붙여둔 댓글 목록 (attach_comments 전에는 빈 리스트)"""
+        return self._comments or []
+
+    def attach_comments(self, comments):
+        """댓글 연결 (댓글 관련 파생 텍스트 캐시 초기화)"""
+        self._comments = Comment.from_json_list(comments)
+        self._comments_text = None
+        self._full_text = None
+
+    @property
+    def text(self):
+        """제목 + 내용"""
+        if self._text is None:
+            self._text = f"{self.title} {self.content}"
+        return self._text
+
+    @property
+    def comments_text(self):
+        """댓글 내용 합본"""
+        if self._comments_text is None:
+            self._comments_text = ' '.join(comment.content for comment in self.comments)
+        return self._comments_text
+
+    @property
+    def full_text(self):
+        """제목 + 내용 + 댓글 (심층 분석용)"""
+        if self._full_text is None:
+            self._full_text = f"{self.text} {self.comments_text}"
+        return self._full_text
+
+    def get(self, key, default=None):
+        # 예전에 dict에 직접 넣던 파생 필드도 같은 이름으로 읽을 수 있게 함
+        if key in ('comments_text', 'full_text', 'text'):
+            return getattr(self, key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        if key in ('comments_text', 'full_text', 'text'):
+            return getattr(self, key)
+        return super().__getitem__(key)
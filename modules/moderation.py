@@ -0,0 +1,106 @@
+"""
+머슴 규칙 위반 감지 (The Punisher)
+행동 강령 위반 규칙(이모지, 마크다운, 존댓말, 성의 없는 글)을 선언형으로 정의하고
+정규식 규칙은 이름 붙은 그룹 하나로 합쳐 한 번만 컴파일해서, 글 하나를 한 번 훑을 때 모든 위반을 점수와 함께 찾아냄
+"""
+
+import re
+from collections import namedtuple
+
+
+# 위반 하나 (규칙 이름, 사유, 걸린 횟수, 점수)
+Violation = namedtuple('Violation', ['rule', 'reason', 'count', 'score'])
+
+
+class Verdict(namedtuple('Verdict', ['post', 'score', 'violations'])):
+    """글 하나의 판정 결과"""
+
+    __slots__ = ()
+
+    @property
+    def reason(self):
+        return ', '.join(v.reason for v in self.violations)
+
+    def only(self, *rules):
+        """위반이 전부 rules 안의 규칙인지 여부"""
+        return all(v.rule in rules for v in self.violations)
+
+
+# 이모지 범위 (기본이 그림으로 보이는 문자만, 한글 자모 ㅋ, ㅎ, ㅠ, ㅜ 등은 포함하지 않음)
+EMOJI_RANGES = (
+    '\U0001F300-\U0001F64F'   # 기호/그림문자, 이모티콘 (🔥 😀)
+    '\U0001F680-\U0001F6FF'   # 교통/지도 (🚀)
+    '\U0001F7E0-\U0001F7EB'   # 색깔 원/네모 (🟠 🟩)
+    '\U0001F900-\U0001F9FF\U0001FA70-\U0001FAFF'  # 보충 기호/그림문자 (🤔 🥲 🫠)
+    '\U0001F1E6-\U0001F1FF'   # 국기 (지역 표시 문자)
+    '\U0001F004\U0001F0CF\U0001F18E\U0001F191-\U0001F19A\U0001F201-\U0001F251'  # 🀄 🃏 🆎 🆗 🈁
+    '\u231A\u231B\u23E9-\u23EC\u23F0\u23F3'  # ⌚ ⌛ ⏩ ⏰ ⏳
+    '\u2614\u2615\u2648-\u2653\u267F\u2693\u26A1\u26AA\u26AB\u26BD\u26BE'
+    '\u26C4\u26C5\u26CE\u26D4\u26EA\u26F2\u26F3\u26F5\u26FA\u26FD'  # ☔ ☕ ♈ ⚡ ⚽ ⛄ ⛔ ⛪ ⛳ ⛺
+    '\u2705\u270A\u270B\u2728\u274C\u274E\u2753-\u2755\u2757\u2795-\u2797\u27B0\u27BF'  # ✅ ✊ ✨ ❌ ❓ ❗ ➕
+    '\u2B1B\u2B1C\u2B50\u2B55'  # ⬛ ⬜ ⭐ ⭕
+    '\u20E3'                  # 키캡
+)
+
+# 기본은 글자로 보이는 기호 (♥ ★ ✓ ☀ ❤ ㊗ 등, 뒤에 이모지 표현 선택자 U+FE0F가 붙을 때만 이모지)
+TEXT_SYMBOL_RANGES = '\u00A9\u00AE\u203C\u2049\u2122\u2139\u2194-\u21AA\u2300-\u2BFF\u3030\u303D\u3297\u3299'
+
+EMOJI_PATTERN = f'(?:[{EMOJI_RANGES}]\uFE0F?|[{TEXT_SYMBOL_RANGES}]\uFE0F)+'
+
+
+class ModerationRules:
+    """규칙 위반 감지기"""
+
+    # 선언형 규칙: pattern(정규식)이나 check(글 -> bool) 중 하나, score는 위반 한 종류당 점수
+    DEFAULT_RULES = (
+        {'name': 'emoji', 'reason': '이모지 사용', 'score': 3,
+         'pattern': EMOJI_PATTERN},
+        {'name': 'markdown', 'reason': '마크다운 사용', 'score': 2,
+         'pattern': r'\*\*|##|__|```'},
+        {'name': 'polite', 'reason': '존댓말(비음슴체) 사용', 'score': 2,
+         'pattern': r'요\.|요$|습니다|입니다'},
+        {'name': 'low_effort', 'reason': '너무 성의 없음', 'score': 1,
+         'check': lambda post: len(post.get('content', '')) < 5 and '망고' not in post.get('title', '')},
+    )
+
+    def __init__(self, rules=None, min_score=1):
+        """
+        Args:
+            rules: 규칙 목록 (기본: DEFAULT_RULES)
+            min_score: scan()에서 돌려줄 최소 점수
+        """
+        self.rules = {rule['name']: rule for rule in (rules or self.DEFAULT_RULES)}
+        self.min_score = min_score
+        pattern_rules = [rule for rule in self.rules.values() if rule.get('pattern')]
+        # 정규식 규칙을 (?P<이름>...) 대안으로 묶어서 한 번에 매칭 (글 하나당 한 번만 훑음)
+        self.pattern = re.compile(
+            '|'.join(f"(?P<{rule['name']}>{rule['pattern']})" for rule in pattern_rules)
+        ) if pattern_rules else None
+        self.check_rules = [rule for rule in self.rules.values() if rule.get('check')]
+
+    def check(self, post):
+        """글 하나(제목 + 내용) 검사 -> Verdict"""
+        counts = {}
+        if self.pattern is not None:
+            text = getattr(post, 'text', None) or f"{post.get('title', '')} {post.get('content', '')}"
+            for match in self.pattern.finditer(text):
+                counts[match.lastgroup] = counts.get(match.lastgroup, 0) + 1
+        for rule in self.check_rules:
+            if rule['check'](post):
+                counts[rule['name']] = 1
+
+        violations = [
+            Violation(name, rule['reason'], counts[name], rule['score'])
+            for name, rule in self.rules.items() if name in counts
+        ]
+        return Verdict(post, sum(v.score for v in violations), violations)
+
+    def scan(self, posts, min_score=None):
+        """
+        여러 글 검사 -> 위반 점수가 min_score 이상인 판정만 점수 높은 순으로
+        """
+        min_score = self.min_score if min_score is None else min_score
+        verdicts = [self.check(post) for post in posts]
+        verdicts = [verdict for verdict in verdicts if verdict.violations and verdict.score >= min_score]
+        verdicts.sort(key=lambda verdict: verdict.score, reverse=True)
+        return verdicts
@@ -0,0 +1,228 @@
+"""
+머슴 쓰기 대기열 (outbox)
+글/댓글 작성 요청을 보내기 전에 SQLite에 먼저 기록해두고, 실패하면 백오프 후 새 PoW로 다시 보냄
+(재시작해도 남아 있고, 보내는 동안은 'sending'으로 잡아둬서 다른 flush가 같은 요청을 또 보내지 않으며,
+flush가 다시 보내기 전에는 최신 피드/댓글에 같은 내용이 이미 올라갔는지 확인해서 중복 작성 방지)
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+
+from modules.paths import data_path
+
+
+class Outbox:
+    """글/댓글 쓰기 대기열"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            created_at REAL NOT NULL,
+            last_error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+    """
+
+    KINDS = ('post', 'comment')
+
+    def __init__(self, api, path=None, max_attempts=5, backoff_base=30.0, backoff_cap=1800.0,
+                 dedupe_window=20, claim_timeout=300.0):
+        """
+        Args:
+            api: MersoomAPI 인스턴스
+            path: SQLite 파일 경로 (기본: ~/.mersoom/outbox.sqlite3, ':memory:'도 가능)
+            max_attempts: 이만큼 실패하면 포기 (status='dead')
+            backoff_base: 첫 재시도까지 대기 시간 (초, 실패할 때마다 2배)
+            backoff_cap: 최대 대기 시간 (초)
+            dedupe_window: 중복 확인 때 살펴볼 최신 글 수
+            claim_timeout: 보내는 중('sending')인 요청을 잡아두는 시간 (초, 그동안 끝나지 않으면
+                프로세스가 죽은 것으로 보고 flush가 중복 확인 후 다시 보냄)
+        """
+        self.api = api
+        self.path = path or data_path('outbox.sqlite3')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.dedupe_window = dedupe_window
+        self.claim_timeout = claim_timeout
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+
+    def submit(self, kind, **payload):
+        """
+        쓰기 요청을 기록하고 바로 한 번 보내봄
+
+        Args:
+            kind: 'post' (nickname, title, content) 또는 'comment' (post_id, nickname, content, parent_id)
+
+        Returns:
+            성공하면 True, 실패해서 재시도 대기 중이면 False
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 쓰기 종류: {kind}")
+        now = time.time()
+        # 보내는 중으로 잡아둔 채 기록 (동시에 도는 flush가 같은 요청을 또 보내지 않게)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (kind, payload, status, next_attempt_at, created_at) "
+                "VALUES (?, ?, 'sending', ?, ?)",
+                (kind, json.dumps(payload, ensure_ascii=False), now + self.claim_timeout, now)
+            )
+        return self._attempt(cursor.lastrowid, kind, payload, 0, dedupe=False)
+
+    def flush(self, stop=None):
+        """
+        재시도 시각이 된 요청(과 claim_timeout이 지나도록 끝나지 않은 보내는 중 요청)을 다시 보냄
+        (보내기 전에 하나씩 잡아두고, 이미 올라가 있는지 항상 먼저 확인)
+
+        Args:
+            stop: 요청 하나를 보내기 전마다 부를 함수 (True를 돌려주면 남은 요청은 다음 flush로 미룸)
+
+        Returns:
+            이번에 보내진(또는 이미 올라가 있던) 요청의 (종류, 내용) 목록 (예: [('post', {'nickname': ...})])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, kind, payload, attempts, status, next_attempt_at FROM outbox "
+                "WHERE status IN ('pending', 'sending') AND next_attempt_at <= ? ORDER BY id",
+                (time.time(),)
+            ).fetchall()
+        sent = []
+        for entry_id, kind, payload, attempts, status, due_at in rows:
+            if stop is not None and stop():
+                print("[대기열] 중단 요청 -> 남은 요청은 다음 flush에서 재전송")
+                break
+            if not self._claim(entry_id, status, due_at):
+                continue
+            payload = json.loads(payload)
+            if self._attempt(entry_id, kind, payload, attempts):
+                sent.append((kind, payload))
+        return sent
+
+    def _claim(self, entry_id, status, due_at):
+        """요청을 보내는 중으로 잡아둠 (그사이 다른 쪽이 먼저 잡았으면 False)"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE outbox SET status = 'sending', next_attempt_at = ? "
+                "WHERE id = ? AND status = ? AND next_attempt_at = ?",
+                (time.time() + self.claim_timeout, entry_id, status, due_at)
+            )
+        return cursor.rowcount == 1
+
+    def _attempt(self, entry_id, kind, payload, attempts, dedupe=True):
+        if dedupe:
+            written = self._already_written(kind, payload)
+            if written:
+                print(f"[대기열] #{entry_id} {kind}는 이미 올라가 있음 -> 재전송 안 함")
+                self._finish(entry_id, 'sent', attempts, None)
+                return True
+            if written is None:
+                # 확인을 못 했으면 중복 작성 위험이 있으니 보내지 않고 다음으로 미룸 (시도 횟수는 그대로)
+                delay = self._backoff(max(1, attempts))
+                print(f"[대기열] #{entry_id} {kind} 중복 여부 확인 실패 -> {delay:.0f}초 후 다시 확인")
+                self._reschedule(entry_id, attempts, delay, 'dedupe check failed')
+                return False
+
+        try:
+            if kind == 'post':
+                ok = self.api.create_post(payload['nickname'], payload['title'], payload['content'])
+            else:
+                ok = self.api.create_comment(payload['post_id'], payload['nickname'],
+                                             payload['content'], payload.get('parent_id'))
+            error = None if ok else 'request failed'
+        except Exception as e:
+            ok, error = False, str(e)
+
+        attempts += 1
+        if ok:
+            self._finish(entry_id, 'sent', attempts, None)
+            return True
+        if attempts >= self.max_attempts:
+            print(f"[대기열] #{entry_id} {kind} {attempts}회 실패 -> 포기")
+            self._finish(entry_id, 'dead', attempts, error)
+            return False
+
+        delay = self._backoff(attempts)
+        print(f"[대기열] #{entry_id} {kind} 실패 -> {delay:.0f}초 후 재시도 ({attempts}/{self.max_attempts})")
+        self._reschedule(entry_id, attempts, delay, error)
+        return False
+
+    def _backoff(self, attempts):
+        return min(self.backoff_cap, self.backoff_base * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+
+    def _reschedule(self, entry_id, attempts, delay, error):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'pending', attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                (attempts, time.time() + delay, error, entry_id)
+            )
+
+    def _finish(self, entry_id, status, attempts, error):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ? WHERE id = ?",
+                (status, attempts, error, entry_id)
+            )
+
+    def _already_written(self, kind, payload):
+        """
+        이전 시도가 응답만 못 받고 실제로는 올라갔는지 확인
+        (글: 최신 피드에 같은 제목이나 내용, 댓글: 그 글의 댓글에 같은 닉네임 + 내용)
+
+        Returns:
+            올라가 있으면 True, 없으면 False, 피드/댓글을 못 받아서 확인할 수 없으면 None
+        """
+        try:
+            if kind == 'post':
+                self.api.single_flight.forget('feed')
+                posts = self.api.get_feed(self.dedupe_window)
+                if posts is None:
+                    return None
+                return any(post.get('title') == payload['title'] or post.get('content') == payload['content']
+                           for post in posts)
+            comments = self.api.get_comments(payload['post_id'], fresh=True, raise_errors=True)
+        except Exception:
+            return None
+        if comments is None:
+            return None
+        return any(comment.get('content') == payload['content'] and comment.get('nickname') == payload['nickname']
+                   for comment in comments)
+
+    def pending(self, kind=None, nicknames=None):
+        """
+        아직 끝나지 않은(재시도 대기 중이거나 보내는 중인) 요청 수
+
+        Args:
+            kind: 이 종류('post', 'comment')만 셈
+            nicknames: 작성자 닉네임이 이 안에 있는 요청만 셈 (여러 페르소나가 대기열을 같이 쓸 때)
+        """
+        query = "SELECT kind, payload FROM outbox WHERE status IN ('pending', 'sending')"
+        params = ()
+        if kind is not None:
+            query += " AND kind = ?"
+            params = (kind,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        if nicknames is None:
+            return len(rows)
+        return sum(1 for _, payload in rows if json.loads(payload).get('nickname') in nicknames)
+
+    def stats(self):
+        """상태별 요청 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
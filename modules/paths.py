@@ -0,0 +1,18 @@
+"""
+머슴 로컬 데이터 경로
+캐시/기록 파일은 MERSOOM_DATA_DIR (기본: ~/.mersoom) 아래에 저장
+"""
+
+import os
+
+
+def data_dir():
+    """데이터 디렉토리 (없으면 생성)"""
+    path = os.environ.get('MERSOOM_DATA_DIR') or os.path.expanduser('~/.mersoom')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_path(filename):
+    """데이터 디렉토리 안의 파일 경로"""
+    return os.path.join(data_dir(), filename)
@@ -0,0 +1,196 @@
+"""
+머슴 PoW 오프로드 데몬
+한 호스트의 여러 에이전트가 코어를 두고 다투지 않도록 PoW를 한 곳에서 풀어줌
+
+실행:
+    python -m modules.pow_daemon --socket /tmp/mersoom-pow.sock --workers 4
+
+프로토콜 (Unix 소켓, 줄 단위 JSON):
+    요청: {"seed": "...", "target_prefix": "0000", "limit_ms": 2000, "backend": "midstate"}
+    응답: {"nonce": "123" 또는 null, "attempts": 0, "elapsed_ms": 0.0, ...}
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+DEFAULT_SOCKET_PATH = '/tmp/mersoom-pow.sock'
+
+
+def _solve_job(seed, target_prefix, deadline, backend):
+    """워커 프로세스에서 실행되는 단일 작업"""
+    from mersoom import POW_BACKENDS
+
+    start = time.time()
+    nonce, attempts = POW_BACKENDS[backend](seed, target_prefix, 0, 1, deadline)
+    return {
+        'nonce': None if nonce is None else str(nonce),
+        'attempts': attempts,
+        'elapsed_ms': (time.time() - start) * 1000,
+        'workers': 1,
+        'backend': backend,
+    }
+
+
+class PowScheduler:
+    """마감 시각이 빠른 작업부터 고정 크기 프로세스 풀에 배정 (EDF)"""
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._busy = 0
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, seed, target_prefix, limit_ms, backend):
+        """작업 등록 후 결과 Future 반환"""
+        future = Future()
+        deadline = time.time() + limit_ms / 1000
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), seed, target_prefix, backend, future))
+            self._cond.notify()
+        return future
+
+    def _dispatch(self):
+        while True:
+            with self._cond:
+                while not self._closed and (not self._heap or self._busy >= self.workers):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                deadline, _, seed, target_prefix, backend, future = heapq.heappop(self._heap)
+                if deadline <= time.time():
+                    # 기다리는 동안 마감이 지난 작업은 풀지 않고 바로 실패 처리
+                    future.set_result({'nonce': None, 'attempts': 0, 'elapsed_ms': 0.0,
+                                       'workers': 0, 'backend': backend, 'expired': True})
+                    continue
+                self._busy += 1
+
+            job = self.pool.submit(_solve_job, seed, target_prefix, deadline, backend)
+            job.add_done_callback(lambda done, future=future: self._finish(done, future))
+
+    def _finish(self, done, future):
+        with self._cond:
+            self._busy -= 1
+            self._cond.notify()
+        error = done.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(done.result())
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.pool.shutdown(cancel_futures=True)
+
+
+class _PowRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                job = json.loads(line)
+                future = self.server.scheduler.submit(
+                    job['seed'], job['target_prefix'], int(job.get('limit_ms', 2000)),
+                    job.get('backend') or self.server.default_backend)
+                reply = future.result()
+            except Exception as e:
+                # 클라이언트가 결과 필드를 그대로 읽을 수 있게 실패 결과도 같은 형태로 보냄
+                reply = {'nonce': None, 'attempts': 0, 'elapsed_ms': 0.0, 'workers': 0,
+                         'backend': None, 'error': str(e)}
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+
+class PowDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """PoW 오프로드 데몬 (Unix 소켓 서버)"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, workers=None, default_backend=None):
+        from mersoom import DEFAULT_POW_BACKEND
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.default_backend = default_backend or DEFAULT_POW_BACKEND
+        self.scheduler = PowScheduler(workers)
+        super().__init__(socket_path, _PowRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.scheduler.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class PowDaemonClient:
+    """PoW 오프로드 데몬 클라이언트"""
+
+    # 호출 측(MersoomAPI)이 읽는 결과 필드
+    RESULT_KEYS = {'nonce', 'attempts', 'elapsed_ms', 'workers'}
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, grace_sec=1.0):
+        self.socket_path = socket_path
+        self.grace_sec = grace_sec  # 제한시간 외에 기다려줄 여유 (대기열/전송 지연)
+
+    def solve(self, seed, target_prefix, limit_ms=2000, backend=None):
+        """
+        데몬에 PoW 작업 위임
+
+        Returns:
+            MersoomPoW.solve와 같은 결과 dict, 데몬 연결 실패나 데몬 쪽 오류면 None (직접 해결하도록)
+        """
+        job = {'seed': seed, 'target_prefix': target_prefix, 'limit_ms': limit_ms}
+        if backend:
+            job['backend'] = backend
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(limit_ms / 1000 + self.grace_sec)
+                sock.connect(self.socket_path)
+                sock.sendall(json.dumps(job).encode() + b'\n')
+                with sock.makefile('rb') as reader:
+                    line = reader.readline()
+            if not line:
+                return None
+            result = json.loads(line)
+        except (OSError, ValueError) as e:
+            print(f"[PoW] 데몬 연결 실패 ({self.socket_path}): {e}")
+            return None
+        if not isinstance(result, dict) or result.get('error') or not self.RESULT_KEYS <= result.keys():
+            error = result.get('error') if isinstance(result, dict) else result
+            print(f"[PoW] 데몬 처리 실패 -> 직접 해결: {error}")
+            return None
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mersoom PoW 오프로드 데몬')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help=f'Unix 소켓 경로 (기본: {DEFAULT_SOCKET_PATH})')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--backend', default=None, help='기본 해싱 백엔드')
+    args = parser.parse_args()
+
+    server = PowDaemon(args.socket, args.workers, args.backend)
+    print(f"[PoW 데몬] {args.socket} 대기 중 (workers: {server.scheduler.workers}, backend: {server.default_backend})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[PoW 데몬] 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
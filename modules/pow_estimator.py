@@ -0,0 +1,158 @@
+"""
+머슴 PoW 난이도 추정기
+머신의 해시 속도를 측정해서 챌린지 해결 가능성을 미리 예측하고,
+워커 수를 고르거나 가망 없는 챌린지는 바로 포기하게 함
+"""
+
+import json
+import math
+import os
+import threading
+import time
+
+from modules.paths import data_path
+
+
+class PowEstimator:
+    """PoW 해결 시간 추정기"""
+
+    # 병렬 워커 1개당 효율 (프로세스 생성/동기화 비용 반영, 기록이 쌓이면 실측값 사용)
+    PARALLEL_EFFICIENCY = 0.85
+    # 병렬 프로세스 기동 비용 추정치 (ms)
+    PARALLEL_STARTUP_MS = 30.0
+    # 해시 속도 이동평균 가중치
+    EWMA_ALPHA = 0.2
+    # 이보다 적게 시도한 기록은 해시 속도 갱신에 쓰지 않음 (고정 비용에 묻힘)
+    MIN_RATE_SAMPLE = 1000
+
+    def __init__(self, backends, history_path=None, max_workers=None,
+                 target_success=0.9, min_success=0.1, history_size=200):
+        """
+        Args:
+            backends: {백엔드 이름: 탐색 함수} (mersoom.POW_BACKENDS)
+            history_path: 해결 기록 파일 경로 (기본: ~/.mersoom/pow_history.json)
+            max_workers: 사용할 최대 워커 수 (기본: CPU 코어 수)
+            target_success: 이 확률 이상이면 워커를 더 늘리지 않음
+            min_success: 최대 워커로도 이 확률 미만이면 포기하고 챌린지 재요청
+            history_size: 보관할 해결 기록 수
+        """
+        self.backends = backends
+        self.history_path = history_path or data_path('pow_history.json')
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.target_success = target_success
+        self.min_success = min_success
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self.rates = {}     # "backend:workers" -> 초당 해시 수 (워커 전체 합)
+        self.history = []
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.history_path):
+            return
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.rates = data.get('rates', {})
+            self.history = data.get('history', [])[-self.history_size:]
+        except (OSError, ValueError) as e:
+            print(f"[PoW] 해결 기록 로드 실패: {e}")
+
+    def _save(self):
+        tmp_path = self.history_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'rates': self.rates, 'history': self.history}, f)
+            os.replace(tmp_path, self.history_path)
+        except OSError as e:
+            print(f"[PoW] 해결 기록 저장 실패: {e}")
+
+    def calibrate(self, backend, duration_ms=50):
+        """단일 워커 해시 속도 측정 (사실상 안 풀리는 타겟으로 duration_ms 동안 돌림)"""
+        scan = self.backends[backend]
+        start = time.time()
+        _, attempts = scan('calibrate', '0' * 64, 0, 1, start + duration_ms / 1000)
+        elapsed = max(time.time() - start, 1e-6)
+        rate = attempts / elapsed
+        with self._lock:
+            self.rates[f"{backend}:1"] = rate
+        print(f"[PoW] 해시 속도 측정: {backend} {rate:,.0f} H/s")
+        return rate
+
+    def hash_rate(self, backend, workers=1):
+        """워커 수에 따른 예상 해시 속도 (실측 기록 우선, 없으면 단일 속도에서 외삽)"""
+        key = f"{backend}:{workers}"
+        if key in self.rates:
+            return self.rates[key]
+        single = self.rates.get(f"{backend}:1") or self.calibrate(backend)
+        if workers == 1:
+            return single
+        return single * workers * self.PARALLEL_EFFICIENCY
+
+    @staticmethod
+    def expected_attempts(target_prefix):
+        """prefix를 맞추는 데 필요한 평균 시도 횟수 (hex 한 글자당 16배)"""
+        return 16 ** len(target_prefix)
+
+    def success_probability(self, target_prefix, limit_ms, backend, workers=1):
+        """제한 시간 안에 해결할 확률 (시도는 독립 시행이므로 지수분포로 근사)"""
+        budget_ms = limit_ms - (self.PARALLEL_STARTUP_MS if workers > 1 else 0)
+        if budget_ms <= 0:
+            return 0.0
+        attempts = self.hash_rate(backend, workers) * budget_ms / 1000
+        return 1 - math.exp(-attempts / self.expected_attempts(target_prefix))
+
+    def plan(self, target_prefix, limit_ms, backend):
+        """
+        챌린지 해결 계획 수립
+
+        Returns:
+            {"workers": 사용할 워커 수, "feasible": 시도할 가치 여부,
+             "success_prob": 예상 성공 확률, "expected_ms": 예상 소요 시간}
+        """
+        candidates = [1]
+        workers = 2
+        while workers < self.max_workers:
+            candidates.append(workers)
+            workers *= 2
+        if self.max_workers > 1:
+            candidates.append(self.max_workers)
+
+        best = None
+        for workers in candidates:
+            prob = self.success_probability(target_prefix, limit_ms, backend, workers)
+            if best is None or prob > best[1]:
+                best = (workers, prob)
+            if prob >= self.target_success:
+                break
+
+        workers, prob = best
+        expected_ms = self.expected_attempts(target_prefix) / self.hash_rate(backend, workers) * 1000
+        if workers > 1:
+            expected_ms += self.PARALLEL_STARTUP_MS
+        return {
+            'workers': workers,
+            'feasible': prob >= self.min_success,
+            'success_prob': prob,
+            'expected_ms': expected_ms,
+        }
+
+    def record(self, target_prefix, backend, workers, attempts, elapsed_ms, solved):
+        """해결 결과 기록 (해시 속도 이동평균 갱신 + 파일 저장)"""
+        with self._lock:
+            if attempts >= self.MIN_RATE_SAMPLE and elapsed_ms > 0:
+                key = f"{backend}:{workers}"
+                rate = attempts / (elapsed_ms / 1000)
+                old = self.rates.get(key)
+                self.rates[key] = rate if old is None else old + self.EWMA_ALPHA * (rate - old)
+            self.history.append({
+                'time': time.time(),
+                'prefix_len': len(target_prefix),
+                'backend': backend,
+                'workers': workers,
+                'attempts': attempts,
+                'elapsed_ms': round(elapsed_ms, 2),
+                'solved': solved,
+            })
+            self.history = self.history[-self.history_size:]
+            self._save()
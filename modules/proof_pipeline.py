@@ -0,0 +1,77 @@
+"""
+머슴 PoW 선행 해결 파이프라인
+글/댓글 내용을 만드는 동안 백그라운드에서 챌린지를 미리 받아서 풀어둠
+"""
+
+import threading
+import time
+
+
+class ProofPipeline:
+    """PoW 선행 해결 파이프라인 (solve-ahead)"""
+
+    def __init__(self, solve_fn, safety_margin=0.2):
+        """
+        Args:
+            solve_fn: 챌린지를 요청하고 풀어서 proof dict를 반환하는 함수
+                      ({"token", "nonce", "expires_at"} 또는 실패시 None)
+            safety_margin: 만료 직전 proof를 버리기 위한 여유 시간 (초)
+        """
+        self.solve_fn = solve_fn
+        self.safety_margin = safety_margin
+        self._lock = threading.Lock()
+        self._ready = None       # 풀어둔 proof
+        self._worker = None      # 진행 중인 백그라운드 스레드
+
+    def prefetch(self):
+        """백그라운드에서 챌린지 해결 시작 (이미 준비됐거나 진행 중이면 무시)"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            if self._ready is not None and self._is_fresh(self._ready):
+                return
+            self._ready = None
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        try:
+            proof = self.solve_fn()
+        except Exception as e:
+            print(f"[PoW] 선행 해결 실패: {e}")
+            proof = None
+        with self._lock:
+            self._ready = proof
+
+    def _is_fresh(self, proof):
+        return proof['expires_at'] - self.safety_margin > time.time()
+
+    def take(self, timeout=None):
+        """
+        준비된 (token, nonce) 꺼내기
+
+        진행 중인 해결이 있으면 끝날 때까지 기다림.
+        만료된 proof는 버리고 None 반환 (호출 측에서 새로 풀어야 함)
+        """
+        with self._lock:
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+        with self._lock:
+            if worker is not None and worker.is_alive():
+                return None
+            proof, self._ready = self._ready, None
+            self._worker = None
+
+        if proof is None:
+            return None
+        if not self._is_fresh(proof):
+            print("[PoW] 미리 풀어둔 토큰이 만료되어 폐기함")
+            return None
+        return proof['token'], proof['nonce']
+
+    def pending(self):
+        """선행 해결이 진행 중이거나 준비되어 있는지 여부"""
+        with self._lock:
+            return self._ready is not None or (self._worker is not None and self._worker.is_alive())
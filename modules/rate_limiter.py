@@ -0,0 +1,125 @@
+"""
+머슴 요청 속도 제한기
+엔드포인트별 토큰 버킷으로 읽기/쓰기 예산을 따로 관리하고,
+429/5xx 응답이 오면 Retry-After를 지키거나 지터를 섞은 지수 백오프로 버킷을 잠가둠
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """토큰 하나를 쓸 수 있을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def block(self, seconds):
+        """seconds 동안 토큰 지급 중단"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """엔드포인트별 속도 제한기 (읽기/쓰기 예산 분리)"""
+
+    # 예산별 (초당 요청 수, 버스트 크기)
+    DEFAULT_BUDGETS = {
+        'read': (5.0, 10),
+        'write': (1.0, 3),
+    }
+
+    # 엔드포인트 -> 예산 (challenge는 쓰기마다 한 번씩 따라오므로 쓰기 예산으로 계산)
+    ENDPOINT_BUDGETS = {
+        'feed': 'read',
+        'comments': 'read',
+        'post_detail': 'read',
+        'arena_status': 'read',
+        'arena_posts': 'read',
+        'challenge': 'write',
+        'post': 'write',
+        'comment': 'write',
+        'vote': 'write',
+        'arena_propose': 'write',
+        'arena_fight': 'write',
+    }
+
+    def __init__(self, budgets=None, endpoint_limits=None, backoff_base=1.0, backoff_cap=60.0):
+        """
+        Args:
+            budgets: {예산 이름: (초당 요청 수, 버스트)} (DEFAULT_BUDGETS 덮어쓰기)
+            endpoint_limits: {엔드포인트: (초당 요청 수, 버스트)} 예산과 별도로 거는 개별 제한
+            backoff_base: 첫 백오프 시간 (초)
+            backoff_cap: 최대 백오프 시간 (초)
+        """
+        budgets = dict(self.DEFAULT_BUDGETS, **(budgets or {}))
+        self.budgets = {name: TokenBucket(rate, burst) for name, (rate, burst) in budgets.items()}
+        self.endpoint_buckets = {
+            endpoint: TokenBucket(rate, burst)
+            for endpoint, (rate, burst) in (endpoint_limits or {}).items()
+        }
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+    def _buckets(self, endpoint):
+        budget = self.ENDPOINT_BUDGETS.get(endpoint, 'read')
+        buckets = [self.budgets[budget]]
+        if endpoint in self.endpoint_buckets:
+            buckets.append(self.endpoint_buckets[endpoint])
+        return buckets
+
+    def acquire(self, endpoint):
+        """요청 보내기 전에 호출 (예산이 없으면 대기)"""
+        for bucket in self._buckets(endpoint):
+            bucket.acquire()
+
+    def backoff(self, endpoint, attempt, retry_after=None):
+        """
+        429/5xx 응답 후 호출: 해당 예산을 잠그고 대기 시간(초) 반환
+
+        Retry-After가 있으면 그 값을, 없으면 지터를 섞은 지수 백오프를 사용
+        """
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+            delay = random.uniform(delay / 2, delay)  # equal jitter
+        for bucket in self._buckets(endpoint):
+            bucket.block(delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Retry-After 헤더 (초 또는 HTTP 날짜) -> 초"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,149 @@
+"""
+머슴 작업 스케줄러 (asyncio)
+피드 동기화, 분석, 투표, 글/댓글 작성처럼 주기가 다른 작업을 각자의 주기/제한시간으로 따로 돌림
+(작업은 스레드 풀에서 실행되므로 느린 쓰기 작업이 읽기 작업을 막지 않음,
+제한시간이 지난 작업은 deadline_passed()로 확인해서 남은 쓰기를 건너뜀)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+_current = threading.local()
+
+
+def deadline_passed():
+    """지금 스레드에서 실행 중인 작업의 제한시간이 지났는지 여부 (스케줄러 밖에서 부르면 항상 False)"""
+    deadline = getattr(_current, 'deadline', None)
+    return deadline is not None and time.monotonic() > deadline
+
+
+class PeriodicTask:
+    """주기 작업 하나"""
+
+    def __init__(self, name, fn, interval, timeout=None, jitter=0.1, initial_delay=0.0):
+        """
+        Args:
+            name: 작업 이름 (로그용)
+            fn: 인자 없는 동기 함수
+            interval: 실행 간격 (초, 이전 실행이 끝난 시점이 아니라 시작 시점 기준)
+            timeout: 한 번 실행의 제한시간 (초, 넘기면 경고 후 다음 주기는 이전 실행이 끝날 때까지 건너뜀,
+                작업 안에서는 deadline_passed()가 True가 되므로 남은 쓰기를 건너뛸 수 있음)
+            jitter: 간격에 섞을 랜덤 비율 (0.1이면 ±10%)
+            initial_delay: 첫 실행까지 대기 시간 (초)
+        """
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.timeout = timeout
+        self.jitter = jitter
+        self.initial_delay = initial_delay
+        self.runs = 0
+        self.failures = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.last_duration = None
+        self._future = None
+
+    def next_delay(self):
+        return max(0.0, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+class TaskScheduler:
+    """주기 작업들을 asyncio 이벤트 루프에서 독립적으로 실행"""
+
+    def __init__(self, tasks=None, max_workers=None):
+        """
+        Args:
+            tasks: PeriodicTask 목록
+            max_workers: 작업 실행 스레드 수 (기본: 작업 수)
+        """
+        self.tasks = list(tasks or [])
+        self.max_workers = max_workers
+        self._stop = None
+
+    def add(self, task):
+        self.tasks.append(task)
+        return task
+
+    async def _run_task(self, task, executor):
+        loop = asyncio.get_running_loop()
+        if await self._sleep(task.initial_delay):
+            return
+        while True:
+            started = time.monotonic()
+            if task._future is not None and not task._future.done():
+                # 이전 실행이 아직 안 끝났으면 겹쳐서 돌리지 않음
+                task.skipped += 1
+                print(f"[스케줄] {task.name}: 이전 실행이 아직 진행 중 -> 이번 주기 건너뜀")
+            else:
+                deadline = started + task.timeout if task.timeout else None
+                task._future = loop.run_in_executor(executor, self._call, task.fn, deadline)
+                try:
+                    await asyncio.wait_for(asyncio.shield(task._future), task.timeout)
+                    task.runs += 1
+                    task.last_duration = time.monotonic() - started
+                except asyncio.TimeoutError:
+                    task.overruns += 1
+                    print(f"[스케줄] {task.name}: 제한시간 {task.timeout:.0f}초 초과 (남은 쓰기는 건너뛰고 마무리)")
+                except Exception as e:
+                    task.failures += 1
+                    print(f"[스케줄] {task.name} 실패: {e}")
+            delay = task.next_delay() - (time.monotonic() - started)
+            if await self._sleep(delay):
+                return
+
+    @staticmethod
+    def _call(fn, deadline):
+        """작업 스레드에서 제한시간을 걸어두고 fn 실행"""
+        _current.deadline = deadline
+        try:
+            return fn()
+        finally:
+            _current.deadline = None
+
+    async def _sleep(self, delay):
+        """delay초 대기 (그 사이 stop()이 불리면 True)"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), max(0.0, delay))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def run(self, duration=None):
+        """
+        모든 작업 실행 (stop() 또는 duration초가 지날 때까지)
+        """
+        self._stop = asyncio.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers or max(1, len(self.tasks)),
+                                      thread_name_prefix='agent-task')
+        runners = [asyncio.ensure_future(self._run_task(task, executor)) for task in self.tasks]
+        try:
+            if duration is None:
+                await self._stop.wait()
+            else:
+                await self._sleep(duration)
+        finally:
+            self._stop.set()
+            await asyncio.gather(*runners, return_exceptions=True)
+            executor.shutdown(wait=False)
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    def stats(self):
+        """작업별 실행 통계"""
+        return {
+            task.name: {
+                'runs': task.runs,
+                'failures': task.failures,
+                'overruns': task.overruns,
+                'skipped': task.skipped,
+                'last_duration': round(task.last_duration, 3) if task.last_duration is not None else None,
+            }
+            for task in self.tasks
+        }
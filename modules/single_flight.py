@@ -0,0 +1,102 @@
+"""
+머슴 요청 합치기 (single-flight)
+여러 스레드가 동시에 같은 읽기 요청(같은 피드 페이지, 같은 글의 댓글)을 하면
+HTTP 요청은 하나만 보내고 결과를 나눠 가짐 (끝난 뒤 짧은 시간 동안은 그 결과를 그대로 재사용)
+"""
+
+import threading
+import time
+
+
+class _Call:
+    """진행 중이거나 끝난 요청 하나"""
+
+    __slots__ = ('done', 'result', 'error', 'finished_at')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.finished_at = None
+
+
+class SingleFlight:
+    """키별 요청 합치기"""
+
+    MAX_ENTRIES = 256  # 이보다 많이 쌓이면 재사용 시간이 지난 결과를 정리
+
+    def __init__(self, freshness=1.0):
+        """
+        Args:
+            freshness: 요청이 끝난 뒤 결과를 재사용할 시간 (초, 0이면 동시에 진행 중인 요청만 합침)
+        """
+        self.freshness = freshness
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0    # 다른 요청의 결과를 받아간 횟수
+        self.executed = 0  # 실제로 실행한 횟수
+
+    def do(self, key, fn):
+        """
+        key가 같은 요청이 진행 중이면 그 결과를 기다려서 반환하고, 없으면 fn()을 실행
+        (실패한 요청은 기다리던 쪽에도 같은 예외를 던지고 재사용하지 않음)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.done.is_set() and (
+                    call.error is not None or time.monotonic() - call.finished_at > self.freshness):
+                call = None
+            if call is None:
+                if len(self._calls) >= self.MAX_ENTRIES:
+                    self._prune()
+                call = self._calls[key] = _Call()
+                leader = True
+                self.executed += 1
+            else:
+                leader = False
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            raise
+        finally:
+            call.finished_at = time.monotonic()
+            call.done.set()
+        if not self.freshness:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+        return call.result
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [k for k, c in self._calls.items()
+                    if c.done.is_set() and now - c.finished_at > self.freshness]:
+            del self._calls[key]
+
+    def forget(self, kind, *args):
+        """
+        끝난 결과 재사용 취소 (쓰기 요청 후 다음 읽기는 새로 받게 함)
+
+        키는 (kind, ...) 튜플이고, args가 없으면 kind로 시작하는 키 전부를 지움
+        """
+        prefix = (kind,) + args
+        with self._lock:
+            for key in [k for k in self._calls if k[:len(prefix)] == prefix]:
+                if self._calls[key].done.is_set():
+                    del self._calls[key]
+
+    def stats(self):
+        """합치기 통계"""
+        return {'executed': self.executed, 'shared': self.shared}
@@ -0,0 +1,97 @@
+"""
+머슴 피드 스냅샷
+한 번 받아온 글/댓글과 그 분석 결과를 묶어서 글 작성, 댓글 작성, 투표가 같이 씀
+(같은 글을 다시 받아오거나 다시 분석하지 않도록 글별 분석은 처음 필요할 때 한 번만 계산해서 캐시)
+"""
+
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+
+# 글 하나의 분석 결과
+PostAnalysis = namedtuple('PostAnalysis', [
+    'keywords',           # 제목 + 내용 키워드 (투표용)
+    'category',           # keywords[0]의 카테고리 (tech, life 등)
+    'weighted_keywords',  # 제목(x3) > 본문(x2) > 댓글(x1) 가중치 키워드 (댓글용)
+    'keyword_type',       # weighted_keywords[0]의 종류 (concrete 등)
+    'title_intent',       # 글 자체의 의도
+    'comment_intent',     # 댓글 분위기 (댓글이 없으면 neutral)
+    'intent',             # 둘을 합친 최종 의도
+])
+
+
+class FeedSnapshot:
+    """한 사이클 동안 바뀌지 않는 피드 스냅샷"""
+
+    __slots__ = ('posts', 'new_posts', 'analysis', 'taken_at', '_analyzer', '_templates',
+                 '_by_id', '_post_analysis', '_lock')
+
+    def __init__(self, posts, analyzer, templates, new_posts=(), analysis=None, taken_at=None):
+        """
+        Args:
+            posts: 댓글이 붙은 Post 목록 (최신 글이 앞)
+            analyzer: FeedAnalyzer (글별 분석용)
+            templates: MerseumTemplates (카테고리 분류용)
+            new_posts: 지난번 동기화 이후 새로 올라온 글
+            analysis: 피드 전체 분석 결과 (analyzer.analyze + 심층 트렌드)
+            taken_at: 스냅샷을 만든 시각 (기본: 지금)
+        """
+        self.posts = tuple(posts)
+        self.new_posts = tuple(new_posts)
+        self.analysis = MappingProxyType(dict(analysis)) if analysis is not None else None
+        self.taken_at = time.time() if taken_at is None else taken_at
+        self._analyzer = analyzer
+        self._templates = templates
+        self._by_id = {post.id: post for post in self.posts}
+        self._post_analysis = {}
+        self._lock = threading.Lock()
+
+    def with_analysis(self, analysis):
+        """피드 분석 결과를 붙인 새 스냅샷 (글별 분석 캐시는 그대로 이어받음)"""
+        snapshot = FeedSnapshot(self.posts, self._analyzer, self._templates, self.new_posts,
+                                analysis, self.taken_at)
+        with self._lock:
+            snapshot._post_analysis = dict(self._post_analysis)
+        return snapshot
+
+    def post(self, post_id):
+        """ID로 글 찾기 (없으면 None)"""
+        return self._by_id.get(post_id)
+
+    def analyze_post(self, post):
+        """글 하나의 분석 결과 (처음 부를 때만 계산)"""
+        cached = self._post_analysis.get(post.id)
+        if cached is not None:
+            return cached
+
+        analyzer = self._analyzer
+        keywords = analyzer.extract_keywords(post.text)
+        category = self._templates.classify_category(keywords[0]) if keywords else None
+        weighted = analyzer.extract_keywords_weighted(
+            title=post.title, content=post.content, comments_text=post.comments_text
+        )
+        title_intent = analyzer.detect_intent(post.full_text)
+        comments = post.comments
+        comment_intent = analyzer.analyze_comments(comments)['intent'] if comments else 'neutral'
+        # 댓글 분위기가 압도적(분노/유머)이면 댓글 분위기를 따름
+        intent = comment_intent if comment_intent in ('complaint', 'humor') else title_intent
+
+        result = PostAnalysis(
+            keywords=tuple(keywords),
+            category=category,
+            weighted_keywords=tuple(weighted),
+            keyword_type=analyzer.classify_keyword_type(weighted[0]) if weighted else None,
+            title_intent=title_intent,
+            comment_intent=comment_intent,
+            intent=intent,
+        )
+        with self._lock:
+            return self._post_analysis.setdefault(post.id, result)
+
+    def __len__(self):
+        return len(self.posts)
+
+    def __repr__(self):
+        return f"FeedSnapshot(posts={len(self.posts)}, new={len(self.new_posts)}, analyzed={self.analysis is not None})"
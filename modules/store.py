@@ -0,0 +1,116 @@
+"""
+머슴 로컬 게시글/댓글 저장소 (SQLite)
+피드와 댓글을 저장해두고, 피드의 comment_count가 바뀌었거나 한동안 피드에서 확인되지 않은 글의 댓글만 다시 받게 함
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from modules.paths import data_path
+
+
+class PostStore:
+    """게시글/댓글 캐시"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS posts (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            comment_count INTEGER,
+            fetched_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS comments (
+            post_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            comment_count INTEGER,
+            fetched_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path=None, feed_ttl=900.0):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: ~/.mersoom/cache.sqlite3, ':memory:'도 가능)
+            feed_ttl: 글의 comment_count를 믿을 시간 (초, 마지막으로 피드에서 받은 뒤 이 시간이 지나면
+                피드에서 빠진 글로 보고 댓글을 다시 받음, 기본 사이클 간격 5분 ± 1분의 두 번 이상)
+        """
+        self.path = path or data_path('cache.sqlite3')
+        self.feed_ttl = feed_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def save_posts(self, posts):
+        """피드에서 받은 글 저장 (comment_count 갱신)"""
+        now = time.time()
+        rows = [
+            (str(post['id']), json.dumps(post, ensure_ascii=False), post.get('comment_count'), now)
+            for post in posts if post.get('id') is not None
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO posts (id, data, comment_count, fetched_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def get_post(self, post_id):
+        """저장된 글 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM posts WHERE id = ?", (str(post_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def cached_comments(self, post_id):
+        """
+        저장된 댓글 반환
+
+        댓글을 받을 때의 comment_count와 최근 피드의 comment_count가 같고, 그 글을 feed_ttl초 안에
+        피드에서 받았을 때만 유효함 (글이 피드에 없어서 비교할 수 없거나, 숫자가 바뀌었거나,
+        한동안 피드에서 확인되지 않아 comment_count를 믿을 수 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT c.data FROM comments c JOIN posts p ON p.id = c.post_id "
+                "WHERE c.post_id = ? AND p.comment_count IS NOT NULL "
+                "AND c.comment_count = p.comment_count AND p.fetched_at >= ?",
+                (str(post_id), time.time() - self.feed_ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def save_comments(self, post_id, comments):
+        """댓글 저장 (현재 피드 기준 comment_count와 함께)"""
+        post_id = str(post_id)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT comment_count FROM posts WHERE id = ?", (post_id,)).fetchone()
+            comment_count = row[0] if row and row[0] is not None else len(comments)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO comments (post_id, data, comment_count, fetched_at) VALUES (?, ?, ?, ?)",
+                (post_id, json.dumps(comments, ensure_ascii=False), comment_count, time.time())
+            )
+
+    def invalidate_comments(self, post_id):
+        """저장된 댓글 버리기 (직접 댓글을 단 뒤 등, 다음 조회 때 다시 받게)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM comments WHERE post_id = ?", (str(post_id),))
+
+    def stats(self):
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,146 @@
+"""
+머슴 HTTP 전송 계층
+엔드포인트 종류별 타임아웃, 크기를 정한 keep-alive 연결 풀, 멱등 요청 재시도,
+API가 불안정할 때 바로 실패시키는 서킷 브레이커를 한곳에서 처리
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.rate_limiter import RateLimiter
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 있어서 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 요청을 차단하는 서킷 브레이커"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """
+        Args:
+            failure_threshold: 이만큼 연속 실패하면 차단 (open)
+            reset_timeout: 차단 후 시험 요청을 허용하기까지 대기 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 여부 (차단 시간이 지나면 시험 요청 하나만 통과)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    print(f"[ERROR] API 연속 실패 {self.failures}회 -> {self.reset_timeout:.0f}초 동안 요청 차단")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class HttpTransport:
+    """MersoomAPI의 HTTP 전송 계층"""
+
+    # 엔드포인트 종류별 (연결 타임아웃, 읽기 타임아웃) 초
+    DEFAULT_TIMEOUTS = {
+        'read': (3.05, 10),
+        'write': (3.05, 20),
+    }
+
+    def __init__(self, timeouts=None, pool_size=10, limiter=None, max_retries=3,
+                 breaker=None, session=None):
+        """
+        Args:
+            timeouts: {'read'/'write': (연결, 읽기)} (DEFAULT_TIMEOUTS 덮어쓰기)
+            pool_size: 유지할 keep-alive 연결 수
+            limiter: 속도 제한기 (기본: RateLimiter())
+            max_retries: 재시도 가능한 요청의 최대 재시도 횟수
+            breaker: 서킷 브레이커 (기본: CircuitBreaker())
+            session: 사용할 requests.Session (기본: 새로 생성)
+        """
+        self.timeouts = dict(self.DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.limiter = limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.breaker = breaker or CircuitBreaker()
+        self.session = session or requests.Session()
+        self.pool_size = 0
+        self.resize_pool(pool_size)
+
+    def resize_pool(self, pool_size):
+        """keep-alive 연결 풀 크기 지정 (동시 요청 수보다 작으면 연결이 버려짐)"""
+        if pool_size <= self.pool_size:
+            return
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method, endpoint, url, **kwargs):
+        """
+        요청 전송 (서킷 브레이커 + 속도 제한 + 타임아웃 + 재시도)
+
+        GET과 챌린지 요청(부수효과 없음)은 연결 오류/타임아웃/429/5xx에 백오프 후 재시도하고,
+        쓰기 요청은 PoW 토큰이 일회용이라 재시도하지 않음 (429면 예산만 잠가서 다음 쓰기가 기다리게 함)
+        """
+        budget = RateLimiter.ENDPOINT_BUDGETS.get(endpoint, 'read')
+        kwargs.setdefault('timeout', self.timeouts[budget])
+        retryable = method == 'GET' or endpoint == 'challenge'
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"API 불안정으로 요청 차단 중 ({endpoint})")
+
+            self.limiter.acquire(endpoint)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                # 어떤 요청 오류든 실패로 기록 (시험 요청이 실패했는데 half_open에 멈춰 있지 않게)
+                self.breaker.record_failure()
+                transient = isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                if not transient or not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.limiter.backoff(endpoint, attempt)
+                attempt += 1
+                print(f"[대기] {endpoint} 연결 실패({type(e).__name__}) -> {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                continue
+
+            status = response.status_code
+            if status >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            if status != 429 and not (status >= 500 and retryable):
+                return response
+
+            delay = self.limiter.backoff(endpoint, attempt, response.headers.get('Retry-After'))
+            if not retryable or attempt >= self.max_retries:
+                return response
+            attempt += 1
+            print(f"[대기] {endpoint} 응답 {status} -> {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+머슴 멀티 페르소나 실행기
+여러 페르소나(닉네임, 작업 주기, 작성 제한)를 한 프로세스에서 돌림
+피드/댓글 동기화와 트렌드 분석은 한 번만 해서 같은 스냅샷을 모든 페르소나가 같이 쓰고,
+MersoomAPI(연결 풀, 속도 제한기, PoW), 템플릿, 분석기, 쓰기 대기열도 하나만 만들어 공유함
+(페르소나가 늘어도 늘어나는 건 각자의 투표/댓글/글 작업뿐)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autonomous_agent import AutonomousAgent
+from mersoom import MersoomAPI
+from modules.acted_index import ActedIndex
+from modules.analyzer import FeedAnalyzer
+from modules.async_api import AsyncMersoomAPI
+from modules.feed_sync import FeedSync
+from modules.metrics import Metrics
+from modules.news import NewsAggregator
+from modules.outbox import Outbox
+from modules.scheduler import PeriodicTask, TaskScheduler, deadline_passed
+from modules.store import PostStore
+from modules.templates import MerseumTemplates
+
+
+class MultiPersonaRunner:
+    """여러 AutonomousAgent 페르소나를 공용 피드/분석/연결 위에서 실행"""
+
+    # 한 번만 돌리고 결과를 나눠 쓰는 작업 / 페르소나마다 따로 도는 작업
+    SHARED_TASKS = ('feed', 'analysis', 'outbox')
+    PERSONA_TASKS = ('vote', 'comment', 'post')
+
+    def __init__(self, personas, dry_run=False, sync_state=None, outbox_path=None, metrics_path=None,
+                 stagger=7.0, **api_options):
+        """
+        Args:
+            personas: 페르소나 설정 목록
+                [{'nickname': ..., 'schedule': {작업: [간격, 제한시간]}, 'post_limit': 2, 'comment_limit': 6}]
+                (빠진 값은 AutonomousAgent 기본값)
+            dry_run: True면 쓰기 요청 없이 시뮬레이션만 함
+            sync_state: 피드 동기화 커서 파일 (기본: ~/.mersoom/feed_sync.json, False면 저장 안 함)
+            outbox_path: 쓰기 대기열 파일 (기본: ~/.mersoom/outbox.sqlite3)
+            metrics_path: 계측 결과 저장 파일 (.prom이면 Prometheus 텍스트, 나머지는 JSON)
+            stagger: 페르소나끼리 작업 시작 시각을 벌려둘 간격 (초, 쓰기가 한꺼번에 몰리지 않게)
+            api_options: MersoomAPI에 그대로 넘길 옵션 (base_url, record, replay 등)
+        """
+        if not personas:
+            raise ValueError("페르소나가 하나 이상 필요함")
+        if 'store' not in api_options:
+            api_options['store'] = PostStore()
+        if metrics_path and 'metrics' not in api_options:
+            api_options['metrics'] = Metrics()
+        self.metrics_path = metrics_path
+        self.stagger = stagger
+
+        self.api = MersoomAPI("", **api_options)
+        self.async_api = AsyncMersoomAPI(self.api, concurrency=5)
+        self.templates = MerseumTemplates()
+        self.analyzer = FeedAnalyzer()
+        self.news = NewsAggregator()
+        self.feed_sync = FeedSync(self.api, state_path=sync_state, page_size=10)
+        self.outbox = Outbox(self.api, path=outbox_path)
+        # 댓글/투표 기록은 한 파일에 닉네임별로 남김
+        self.acted = ActedIndex(path=False if dry_run else None)
+
+        shared = dict(api=self.api, async_api=self.async_api, templates=self.templates,
+                      analyzer=self.analyzer, news=self.news, feed_sync=self.feed_sync,
+                      outbox=self.outbox, acted=self.acted)
+        self.agents = []
+        for persona in personas:
+            options = dict(persona)
+            if options.get('schedule'):
+                options['schedule'] = {name: tuple(value) for name, value in options['schedule'].items()}
+            self.agents.append(AutonomousAgent("", dry_run=dry_run, **shared, **options))
+        # 피드/분석은 첫 페르소나가 대표로 돌리고 결과를 나머지에게 나눠줌
+        self.leader = self.agents[0]
+
+    @classmethod
+    def load_personas(cls, path):
+        """JSON 파일에서 페르소나 설정 목록 읽기"""
+        with open(path, 'r', encoding='utf-8') as f:
+            personas = json.load(f)
+        if isinstance(personas, dict):
+            personas = personas.get('personas', [])
+        return personas
+
+    # ---- 공용 작업 ----
+
+    def _task_feed(self):
+        snapshot = self.leader.refresh_feed()
+        if snapshot:
+            self._share(snapshot)
+
+    def _task_analysis(self):
+        snapshot = self.leader.snapshot
+        if snapshot:
+            self.leader.analyze_feed(snapshot)
+            self._share(self.leader.snapshot)
+
+    def _share(self, snapshot):
+        # 스냅샷은 바뀌지 않으므로 모든 페르소나가 같은 객체를 그대로 씀 (글별 분석 캐시도 공유)
+        for agent in self.agents:
+            agent.snapshot = snapshot
+
+    def _task_outbox(self):
+        if self.leader.dry_run:
+            return
+        # 뒤늦게 올라간 글/댓글은 쓴 페르소나의 작성 횟수로 셈
+        by_nickname = {agent.nickname: agent for agent in self.agents}
+        for kind, payload in self.outbox.flush(stop=deadline_passed):
+            agent = by_nickname.get(payload.get('nickname'))
+            if agent is not None:
+                agent.count_write(kind)
+
+    def _task_metrics(self):
+        self.api.metrics.dump(self.metrics_path)
+
+    def build_scheduler(self):
+        """공용 작업 + 페르소나별 작업 스케줄러 구성"""
+        handlers = {
+            'feed': self._task_feed,
+            'analysis': self._task_analysis,
+            'outbox': self._task_outbox,
+        }
+        scheduler = TaskScheduler()
+        for task in self.leader.build_tasks(self.SHARED_TASKS):
+            task.fn = handlers[task.name]
+            scheduler.add(task)
+        for index, agent in enumerate(self.agents):
+            for task in agent.build_tasks(self.PERSONA_TASKS, prefix=f"{agent.nickname}:"):
+                task.initial_delay += index * self.stagger
+                scheduler.add(task)
+        if self.metrics_path:
+            scheduler.add(PeriodicTask('metrics', self._task_metrics, 60, 10, initial_delay=60))
+        return scheduler
+
+    def run(self, duration=None):
+        """
+        모든 페르소나 실행 (Ctrl+C 또는 duration초가 지날 때까지)
+        """
+        print(f"=== 머슴 멀티 페르소나 시작 ({len(self.agents)}명) ===")
+        for agent in self.agents:
+            limit = agent.comment_limit if agent.comment_limit is not None else '무제한'
+            print(f"  {agent.nickname}: 30분에 글 {agent.post_limit}개, 댓글 {limit}개")
+        scheduler = self.build_scheduler()
+        try:
+            asyncio.run(scheduler.run(duration))
+        except KeyboardInterrupt:
+            print("\n\n=== 멀티 페르소나 종료 ===")
+        return scheduler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Mersoom Multi-Persona Runner')
+    parser.add_argument('--personas', help='페르소나 설정 JSON 파일 (없으면 --count명을 랜덤 닉네임으로)')
+    parser.add_argument('--count', type=int, default=3, help='--personas가 없을 때 만들 페르소나 수')
+    parser.add_argument('--dry-run', action='store_true', help='실제 API 호출 없이 테스트 실행')
+    parser.add_argument('--base-url', help='API 주소 (예: 모의 서버 http://127.0.0.1:8765/api)')
+    parser.add_argument('--metrics', help='계측 결과 저장 (.prom이면 Prometheus 형식)')
+    parser.add_argument('--duration', type=float, help='이 시간(초)이 지나면 종료')
+    args = parser.parse_args()
+
+    if args.personas:
+        personas = MultiPersonaRunner.load_personas(args.personas)
+    else:
+        # 닉네임이 겹치지 않게 뽑음
+        nicknames = random.sample(MerseumTemplates().nicknames, args.count)
+        personas = [{'nickname': nickname} for nickname in nicknames]
+
+    runner = MultiPersonaRunner(personas, dry_run=args.dry_run, base_url=args.base_url,
+                                metrics_path=args.metrics)
+    if args.dry_run:
+        print("=== [TEST MODE] API 호출이 비활성화되었습니다 ===")
+    runner.run(args.duration)
@@ -10,7 +10,7 @@ if posts and len(posts) > 0:
     print(f"Target Post ID: {post_id}")
     
     # Try Endpoint 1: /posts/{id}/comments
-    url1 = f"https://www.mersoom.com/api/posts/{post_id}/comments"
+    url1 = f"{api.BASE_URL}/posts/{post_id}/comments"
     print(f"Trying {url1}...")
     try:
         resp = requests.get(url1)
@@ -21,7 +21,7 @@ if posts and len(posts) > 0:
         print(f"Error: {e}")
 
     # Try Endpoint 2: /comments?post_id={id}
-    url2 = f"https://www.mersoom.com/api/comments?post_id={post_id}"
+    url2 = f"{api.BASE_URL}/comments?post_id={post_id}"
     print(f"Trying {url2}...")
     try:
         resp = requests.get(url2)
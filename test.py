@@ -4,8 +4,9 @@ Mersoom CLI 테스트 스크립트
 피드 조회와 PoW 솔버를 간단히 테스트
 """
 
+import os
 import sys
-sys.path.insert(0, '/home/cr4ne/mersoom-cli')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from mersoom import MersoomAPI, MersoomPoW
 
@@ -78,7 +79,7 @@ def main():
     if pow_ok and feed_ok:
         print("\n🎉 모든 테스트 통과!")
         print("\n다음 명령어로 CLI를 실행하세요:")
-        print("  cd /home/cr4ne/mersoom-cli")
+        print(f"  cd {os.path.dirname(os.path.abspath(__file__))}")
         print("  python3 mersoom.py")
     else:
         print("\n⚠️  일부 테스트 실패. 위 로그를 확인하세요.")
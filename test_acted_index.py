@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+행동 기록 인덱스(ActedIndex) 테스트
+블룸 필터 세대 교체, 오탐률 상한, 파일 저장/복원을 확인 (네트워크 없음)
+"""
+
+import math
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.acted_index import ActedIndex
+
+
+def test_generation_rollover():
+    """블룸 필터 세대 교체 테스트"""
+    print("="*60)
+    print("🧪 세대 교체 테스트")
+    print("="*60)
+
+    index = ActedIndex(path=False, exact_size=10, bloom_bits=1 << 16, generation_size=100)
+    for n in range(250):
+        index.mark('vote', f"p{n}", '머슴')
+
+    # 세대 0(p0~p99) -> 1(p100~p199) -> 2(p200~p249): 세대 0은 두 번 밀려나서 잊혀야 함
+    remembered = [n for n in range(100, 250) if not index.seen('vote', f"p{n}", '머슴')]
+    forgotten = sum(1 for n in range(100) if not index.seen('vote', f"p{n}", '머슴'))
+    stats = index.stats()
+    print(f"  통계: {stats}")
+    print(f"  최근 두 세대 중 놓친 기록 {len(remembered)}개, 가장 오래된 세대에서 잊힌 기록 {forgotten}/100개")
+
+    # 닉네임/행동 종류가 다르면 다른 기록
+    separate = not index.seen('vote', 'p200', '다른머슴') and not index.seen('comment', 'p200', '머슴')
+
+    ok = (stats == {'recent': 10, 'bloom_current': 50, 'bloom_previous': 100}
+          and not remembered and forgotten >= 95 and separate)
+    print(f"\n{'✅' if ok else '❌'} 최근 두 세대는 빠짐없이 기억, 그보다 오래된 세대는 버림")
+    return ok
+
+
+def test_false_positive_bound():
+    """오탐률 상한 테스트"""
+    print("\n" + "="*60)
+    print("🧪 오탐률 테스트")
+    print("="*60)
+
+    index = ActedIndex(path=False)
+    # 두 세대를 모두 꽉 채운 최악의 상태
+    for n in range(2 * index.generation_size):
+        index.mark('comment', f"seen-{n}")
+    trials = 20000
+    false_positives = sum(1 for n in range(trials) if index.seen('comment', f"new-{n}"))
+    rate = false_positives / trials
+
+    # 세대 하나의 이론 오탐률 (1 - e^(-kn/m))^k, 두 세대를 함께 보므로 약 2배
+    k, n, m = index.bloom_hashes, index.generation_size, index.bloom_bits
+    expected = 2 * (1 - math.exp(-k * n / m)) ** k
+    print(f"  세대 {n}개 x 2, 비트 {m}, 해시 {k}개")
+    print(f"  오탐률: {rate:.3%} (이론값 {expected:.3%}, 상한 1%)")
+
+    ok = rate <= 0.01
+    print(f"\n{'✅' if ok else '❌'} 두 세대가 꽉 차도 오탐률 1% 이하")
+    return ok
+
+
+def test_persistence():
+    """파일 저장/복원 테스트"""
+    print("\n" + "="*60)
+    print("🧪 저장/복원 테스트")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'acted_index.json')
+        index = ActedIndex(path=path, exact_size=5, generation_size=20)
+        for n in range(30):
+            index.mark('vote', f"p{n}")
+        restored = ActedIndex(path=path, exact_size=5, generation_size=20)
+        missing = [n for n in range(30) if not restored.seen('vote', f"p{n}")]
+        same_stats = restored.stats() == index.stats()
+        print(f"  복원 후 통계: {restored.stats()}, 놓친 기록 {len(missing)}개")
+
+    ok = not missing and same_stats
+    print(f"\n{'✅' if ok else '❌'} 재시작해도 최근 기록과 두 세대 블룸 필터가 그대로 유지")
+    return ok
+
+
+def main():
+    print("\n🙇 행동 기록 인덱스 테스트 시작\n")
+
+    results = {
+        '세대 교체': test_generation_rollover(),
+        '오탐률': test_false_positive_bound(),
+        '저장/복원': test_persistence(),
+    }
+
+    print("\n" + "="*60)
+    print("📊 테스트 결과")
+    print("="*60)
+    for name, ok in results.items():
+        print(f"  {name}: {'✅ 통과' if ok else '❌ 실패'}")
+
+    if all(results.values()):
+        print("\n🎉 모든 테스트 통과!")
+    else:
+        print("\n⚠️  일부 테스트 실패. 위 로그를 확인하세요.")
+    print()
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+계측(Histogram) 테스트
+정확히 계산한 분위수와 비교해서 HDR 히스토그램의 오차가 약속한 범위(상대 오차 약 1%) 안인지 확인 (네트워크 없음)
+"""
+
+import math
+import os
+import random
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.metrics import Histogram
+
+PERCENTILES = (1, 10, 50, 90, 99, 99.9, 100)
+
+
+def _exact(values, pct):
+    """정확한 pct 백분위수 (nearest-rank, Histogram.percentile과 같은 순위 기준)"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _max_error(values, scale, tolerance):
+    """모든 PERCENTILES에서 |추정 - 정확| / 허용 오차 중 최댓값 (1 이하면 통과)"""
+    histogram = Histogram(scale=scale)
+    for value in values:
+        histogram.record(value)
+    worst = 0.0
+    for pct in PERCENTILES:
+        exact = _exact(values, pct)
+        estimate = histogram.percentile(pct)
+        worst = max(worst, abs(estimate - exact) / tolerance(exact))
+    return worst
+
+
+def test_relative_error():
+    """넓은 범위 값의 상대 오차 테스트"""
+    print("="*60)
+    print("🧪 분위수 상대 오차 테스트")
+    print("="*60)
+
+    rng = random.Random(42)
+    # 응답 시간처럼 꼬리가 긴 분포 (수 ms ~ 수십 초)
+    values = [rng.lognormvariate(5, 1.5) for _ in range(20000)]
+    scale = 1000
+    # 버킷 폭은 하한의 1/2**(SUB_BITS-1) 이하라 중간값 오차는 그 절반 + 정수 변환 오차
+    bound = 1 / 2 ** Histogram.SUB_BITS
+    worst = _max_error(values, scale, lambda exact: exact * bound + 1 / scale)
+    print(f"  값 {len(values)}개, 범위 {min(values):.2f} ~ {max(values):.0f}ms")
+    print(f"  허용 오차 대비 최대 오차: {worst:.2f} (상대 오차 허용 {bound:.2%})")
+
+    ok = worst <= 1.0
+    print(f"\n{'✅' if ok else '❌'} 모든 분위수가 상대 오차 {bound:.2%} 안")
+    return ok
+
+
+def test_small_values():
+    """작은 값(정확한 버킷) 테스트"""
+    print("\n" + "="*60)
+    print("🧪 작은 값 테스트")
+    print("="*60)
+
+    rng = random.Random(7)
+    # 2**SUB_BITS보다 작은 정수는 버킷 폭이 1이라 정확해야 함
+    values = [rng.randrange(0, 2 ** Histogram.SUB_BITS) for _ in range(5000)]
+    worst = _max_error(values, 1, lambda exact: 0.5)
+    print(f"  허용 오차(0.5) 대비 최대 오차: {worst:.2f}")
+
+    histogram = Histogram(scale=1)
+    empty = histogram.percentile(50)
+    histogram.record(3.5)
+    single = histogram.percentile(99)
+    print(f"  빈 히스토그램 p50: {empty}, 값 하나(3.5) p99: {single}")
+
+    ok = worst <= 1.0 and empty is None and single == 3.5
+    print(f"\n{'✅' if ok else '❌'} 작은 값은 버킷 안에서 정확, 실제 최소/최대값 범위로 제한")
+    return ok
+
+
+def main():
+    print("\n🙇 계측 테스트 시작\n")
+
+    results = {
+        '분위수 상대 오차': test_relative_error(),
+        '작은 값': test_small_values(),
+    }
+
+    print("\n" + "="*60)
+    print("📊 테스트 결과")
+    print("="*60)
+    for name, ok in results.items():
+        print(f"  {name}: {'✅ 통과' if ok else '❌ 실패'}")
+
+    if all(results.values()):
+        print("\n🎉 모든 테스트 통과!")
+    else:
+        print("\n⚠️  일부 테스트 실패. 위 로그를 확인하세요.")
+    print()
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+쓰기 대기열(Outbox) 테스트
+가짜 API로 재시도, 중복 작성 방지, submit 중 동시에 도는 flush, 재시작 후 복구를 확인 (네트워크 없음)
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.outbox import Outbox
+from modules.single_flight import SingleFlight
+
+
+class FakeAPI:
+    """서버에 올라간 댓글을 기억하는 가짜 MersoomAPI"""
+
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        self.comments = {}       # post_id -> [댓글]
+        self.posts = []
+        self.sent = []           # 실제로 보낸 쓰기 요청
+        self.fail_next = 0       # 이만큼 실패 (올라가지 않음)
+        self.lose_response = 0   # 이만큼 올라가긴 하는데 응답을 못 받음
+        self.block = None        # 설정하면 보내는 도중 이 이벤트를 기다림
+        self.read_fails = False  # True면 피드/댓글 조회 실패
+
+    def _write(self, item, target):
+        self.sent.append(item)
+        if self.block is not None:
+            self.block.wait(5)
+        if self.fail_next:
+            self.fail_next -= 1
+            return False
+        target.append(item)
+        if self.lose_response:
+            self.lose_response -= 1
+            raise TimeoutError("응답 시간 초과")
+        return True
+
+    def create_post(self, nickname, title, content):
+        return self._write({'nickname': nickname, 'title': title, 'content': content}, self.posts)
+
+    def create_comment(self, post_id, nickname, content, parent_id=None):
+        return self._write({'nickname': nickname, 'content': content},
+                           self.comments.setdefault(post_id, []))
+
+    def get_feed(self, limit=10):
+        if self.read_fails:
+            return None
+        return list(reversed(self.posts))[:limit]
+
+    def get_comments(self, post_id, fresh=False, raise_errors=False):
+        if self.read_fails:
+            if raise_errors:
+                raise ConnectionError("댓글 조회 실패")
+            return []
+        return list(self.comments.get(post_id, []))
+
+
+def _outbox(api, **options):
+    options.setdefault('backoff_base', 0)
+    return Outbox(api, path=':memory:', **options)
+
+
+def test_retry():
+    """실패 후 재시도 테스트"""
+    print("="*60)
+    print("🧪 실패 후 재시도 테스트")
+    print("="*60)
+
+    api = FakeAPI()
+    api.fail_next = 1
+    outbox = _outbox(api)
+    first = outbox.submit('comment', post_id='p1', nickname='머슴', content='음슴체 댓글임')
+    waiting = outbox.pending()
+    flushed = outbox.flush()
+    print(f"  첫 시도 {first}, 대기 {waiting}개, flush {len(flushed)}개, 보낸 횟수 {len(api.sent)}")
+    ok = first is False and waiting == 1 and len(flushed) == 1 and len(api.sent) == 2 and len(api.comments['p1']) == 1
+
+    # max_attempts번 실패하면 포기
+    api = FakeAPI()
+    api.fail_next = 3
+    outbox = _outbox(api, max_attempts=3)
+    outbox.submit('post', nickname='머슴', title='제목', content='내용임')
+    outbox.flush()
+    outbox.flush()
+    stats = outbox.stats()
+
+    ok = ok and len(api.sent) == 3 and stats == {'dead': 1}
+    print(f"  max_attempts=3 연속 실패 후 상태: {stats}")
+    print(f"\n{'✅' if ok else '❌'} 실패한 요청은 flush에서 다시 보내고, 계속 실패하면 포기")
+    return ok
+
+
+def test_dedupe():
+    """응답을 못 받은 요청 중복 방지 테스트"""
+    print("\n" + "="*60)
+    print("🧪 중복 작성 방지 테스트")
+    print("="*60)
+
+    api = FakeAPI()
+    api.lose_response = 1
+    outbox = _outbox(api)
+    first = outbox.submit('comment', post_id='p1', nickname='머슴', content='이미 올라간 댓글임')
+    flushed = outbox.flush()
+    print(f"  첫 시도 {first}, flush {len(flushed)}개, 보낸 횟수 {len(api.sent)}, "
+          f"서버 댓글 {len(api.comments['p1'])}개")
+
+    ok = (first is False and len(flushed) == 1 and len(api.sent) == 1
+          and len(api.comments['p1']) == 1 and outbox.stats() == {'sent': 1})
+
+    # 중복 여부를 확인할 수 없으면(조회 실패) 보내지 않고 미룸
+    for kind, payload in (('comment', {'post_id': 'p2', 'nickname': '머슴', 'content': '확인 불가 댓글임'}),
+                          ('post', {'nickname': '머슴', 'title': '확인 불가 글', 'content': '내용임'})):
+        api = FakeAPI()
+        api.lose_response = 1
+        outbox = _outbox(api)
+        outbox.submit(kind, **payload)
+        api.read_fails = True
+        flushed = outbox.flush()
+        print(f"  {kind} 조회 실패 중 flush {len(flushed)}개, 보낸 횟수 {len(api.sent)}, 상태 {outbox.stats()}")
+        ok = ok and flushed == [] and len(api.sent) == 1 and outbox.stats() == {'pending': 1}
+        api.read_fails = False
+        flushed = outbox.flush()
+        ok = ok and len(flushed) == 1 and len(api.sent) == 1 and outbox.stats() == {'sent': 1}
+
+    print(f"\n{'✅' if ok else '❌'} 이미 올라간 요청은 다시 보내지 않고 완료 처리, 확인할 수 없으면 보내지 않고 미룸")
+    return ok
+
+
+def test_flush_during_submit():
+    """submit 중 동시 flush 테스트"""
+    print("\n" + "="*60)
+    print("🧪 submit 중 동시 flush 테스트")
+    print("="*60)
+
+    api = FakeAPI()
+    api.block = threading.Event()
+    outbox = _outbox(api)
+    result = {}
+    submitter = threading.Thread(
+        target=lambda: result.update(ok=outbox.submit('comment', post_id='p1', nickname='머슴', content='한 번만')))
+    submitter.start()
+    while not api.sent:
+        time.sleep(0.01)
+
+    # submit이 보내는 도중에 다른 스레드가 flush
+    flushed = outbox.flush()
+    api.block.set()
+    submitter.join(5)
+    print(f"  submit {result.get('ok')}, 동시 flush {len(flushed)}개, 보낸 횟수 {len(api.sent)}")
+
+    ok = result.get('ok') is True and flushed == [] and len(api.sent) == 1 and len(api.comments['p1']) == 1
+    print(f"\n{'✅' if ok else '❌'} 보내는 중인 요청은 flush가 건드리지 않음")
+    return ok
+
+
+def test_crash_recovery():
+    """보내다 죽은 요청 복구 테스트"""
+    print("\n" + "="*60)
+    print("🧪 재시작 후 복구 테스트")
+    print("="*60)
+
+    api = FakeAPI()
+    outbox = _outbox(api, claim_timeout=0.1)
+    # 보내는 중에 프로세스가 죽은 상황 재현: 하나는 서버에 올라갔고, 하나는 안 올라감
+    api.comments['p1'] = [{'nickname': '머슴', 'content': '올라간 댓글임'}]
+    now = time.time()
+    for content in ('올라간 댓글임', '안 올라간 댓글임'):
+        outbox._conn.execute(
+            "INSERT INTO outbox (kind, payload, status, next_attempt_at, created_at) VALUES (?, ?, 'sending', ?, ?)",
+            ('comment', f'{{"post_id": "p1", "nickname": "머슴", "content": "{content}"}}', now + 0.1, now)
+        )
+    early = outbox.flush()
+    time.sleep(0.15)
+    recovered = outbox.flush()
+    print(f"  잡아둔 시간 안 flush {len(early)}개, 지난 뒤 flush {len(recovered)}개, 보낸 횟수 {len(api.sent)}")
+
+    ok = (early == [] and len(recovered) == 2 and len(api.sent) == 1
+          and [c['content'] for c in api.comments['p1']] == ['올라간 댓글임', '안 올라간 댓글임'])
+    print(f"\n{'✅' if ok else '❌'} 올라간 요청은 완료 처리, 안 올라간 요청만 다시 보냄")
+    return ok
+
+
+def main():
+    print("\n🙇 쓰기 대기열 테스트 시작\n")
+
+    results = {
+        '실패 후 재시도': test_retry(),
+        '중복 작성 방지': test_dedupe(),
+        'submit 중 동시 flush': test_flush_during_submit(),
+        '재시작 후 복구': test_crash_recovery(),
+    }
+
+    print("\n" + "="*60)
+    print("📊 테스트 결과")
+    print("="*60)
+    for name, ok in results.items():
+        print(f"  {name}: {'✅ 통과' if ok else '❌ 실패'}")
+
+    if all(results.values()):
+        print("\n🎉 모든 테스트 통과!")
+    else:
+        print("\n⚠️  일부 테스트 실패. 위 로그를 확인하세요.")
+    print()
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
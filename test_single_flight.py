@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+요청 합치기(SingleFlight) 테스트
+동시에 들어온 같은 요청이 한 번만 실행되는지, 실패하면 기다리던 쪽 모두 같은 예외를 받는지 확인 (네트워크 없음)
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.single_flight import SingleFlight
+
+
+def _run_concurrently(flight, key, fn, count):
+    """count개 스레드가 동시에 flight.do(key, fn) -> [(결과, 예외)]"""
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = (flight.do(key, fn), None)
+        except Exception as e:
+            results[index] = (None, e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_coalescing():
+    """동시 요청 합치기 테스트"""
+    print("="*60)
+    print("🧪 동시 요청 합치기 테스트")
+    print("="*60)
+
+    flight = SingleFlight(freshness=0)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return ['글1', '글2']
+
+    results = _run_concurrently(flight, ('feed', 1), fetch, 8)
+    ok = len(calls) == 1 and all(result == (['글1', '글2'], None) for result in results)
+    print(f"  실행 {len(calls)}회, 결과 공유 {flight.stats()['shared']}회")
+
+    # freshness=0이면 끝난 결과를 재사용하지 않음
+    flight.do(('feed', 1), fetch)
+    ok = ok and len(calls) == 2
+
+    # 키가 다르면 따로 실행
+    flight.do(('feed', 2), fetch)
+    ok = ok and len(calls) == 3
+
+    print(f"\n{'✅' if ok else '❌'} 같은 키는 한 번만 실행, 다른 키/끝난 요청은 새로 실행")
+    return ok
+
+
+def test_freshness():
+    """끝난 결과 재사용/forget 테스트"""
+    print("\n" + "="*60)
+    print("🧪 결과 재사용 시간 테스트")
+    print("="*60)
+
+    flight = SingleFlight(freshness=0.3)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    first = flight.do(('comments', 'a'), fetch)
+    reused = flight.do(('comments', 'a'), fetch)
+    flight.forget('comments', 'a')
+    after_forget = flight.do(('comments', 'a'), fetch)
+    time.sleep(0.35)
+    expired = flight.do(('comments', 'a'), fetch)
+    print(f"  첫 요청 {first}, 재사용 {reused}, forget 후 {after_forget}, 만료 후 {expired}")
+
+    ok = (first, reused, after_forget, expired) == (1, 1, 2, 3)
+    print(f"\n{'✅' if ok else '❌'} 재사용 시간 안에서만 재사용, forget하면 새로 실행")
+    return ok
+
+
+def test_error_propagation():
+    """실패 전파 테스트"""
+    print("\n" + "="*60)
+    print("🧪 실패 전파 테스트")
+    print("="*60)
+
+    flight = SingleFlight(freshness=1.0)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ConnectionError("서버 응답 없음")
+
+    results = _run_concurrently(flight, ('detail', 'x'), fail, 6)
+    errors = [error for _, error in results]
+    same_error = all(error is errors[0] for error in errors) and isinstance(errors[0], ConnectionError)
+    print(f"  실행 {len(calls)}회, 예외 받은 스레드 {sum(1 for e in errors if e is not None)}/{len(errors)}")
+
+    # 실패한 결과는 재사용하지 않으므로 다음 요청은 다시 실행
+    value = flight.do(('detail', 'x'), lambda: 'ok')
+    ok = len(calls) == 1 and same_error and value == 'ok'
+    print(f"\n{'✅' if ok else '❌'} 기다리던 스레드 모두 같은 예외, 실패 결과는 재사용 안 함")
+    return ok
+
+
+def main():
+    print("\n🙇 요청 합치기 테스트 시작\n")
+
+    results = {
+        '동시 요청 합치기': test_coalescing(),
+        '결과 재사용 시간': test_freshness(),
+        '실패 전파': test_error_propagation(),
+    }
+
+    print("\n" + "="*60)
+    print("📊 테스트 결과")
+    print("="*60)
+    for name, ok in results.items():
+        print(f"  {name}: {'✅ 통과' if ok else '❌ 실패'}")
+
+    if all(results.values()):
+        print("\n🎉 모든 테스트 통과!")
+    else:
+        print("\n⚠️  일부 테스트 실패. 위 로그를 확인하세요.")
+    print()
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)